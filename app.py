@@ -5,9 +5,11 @@ This file is used when deploying to HuggingFace Spaces.
 For local deployment, use: python -m chatassistant_retail
 """
 
+import asyncio
 import logging
 import os
 import sys
+import threading
 from pathlib import Path
 
 # Add src directory to Python path for HuggingFace Spaces deployment
@@ -28,18 +30,51 @@ logger = logging.getLogger(__name__)
 
 logger.info("Starting Retail Inventory Assistant on HuggingFace Spaces")
 
-# from chatassistant_retail.ui import create_gradio_interface
-from chatassistant_retail.ui import gradio_app
 
-# Create and launch interface
-# demo = create_gradio_interface()
-demo = gradio_app.create_gradio_interface()
+def _build_demo():
+    """Import the Gradio UI and build the interface (keeps heavy imports out of module import)."""
+    # from chatassistant_retail.ui import create_gradio_interface
+    from chatassistant_retail.ui import gradio_app
+
+    # demo = create_gradio_interface()
+    return gradio_app.create_gradio_interface()
+
+
+def _warmup():
+    """Warm Azure Search and the embeddings deployment so the first chat turn avoids cold-start latency."""
+    try:
+        from chatassistant_retail.chatbot import get_chatbot
+        from chatassistant_retail.rag import EmbeddingsClient
+
+        retriever = get_chatbot().rag_retriever
+        if not retriever.search_client.enabled:
+            return
+
+        # Reuses the search client's connection pool that chat requests will use
+        retriever.search_client.get_index_stats()
+
+        # Separate client: async HTTP pools are bound to the event loop that opened them
+        asyncio.run(EmbeddingsClient(retriever.settings).generate_embeddings_batch(["warmup"]))
+        logger.info("Prewarm complete")
+    except Exception as e:
+        logger.warning(f"Prewarm failed: {e}")
+
+
+# Create and launch interface (Spaces looks for a module-level `demo`)
+demo = _build_demo()
+
+# Opt-in so local development isn't slowed down by extra Azure calls
+if os.environ.get("PREWARM") == "1":
+    threading.Thread(target=_warmup, name="prewarm", daemon=True).start()
 
 if __name__ == "__main__":
+    from chatassistant_retail.ui.gradio_app import app_lifespan
+
     # For HF Spaces, use 0.0.0.0 to accept external connections
     demo.launch(
         server_name="0.0.0.0",
         server_port=7860,
         share=False,
         show_error=True,
+        app_kwargs={"lifespan": app_lifespan},
     )
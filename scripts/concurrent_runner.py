@@ -0,0 +1,83 @@
+"""Run independent async test-script checks concurrently with per-check output."""
+
+import asyncio
+import io
+import sys
+from collections.abc import Awaitable, Callable, Coroutine
+from contextvars import ContextVar
+from typing import Any
+
+# Buffer receiving print() output for the check running in the current task (None: real stdout)
+_current_output: ContextVar[io.StringIO | None] = ContextVar("_current_output", default=None)
+
+
+class _TaskStdout:
+    """sys.stdout proxy that routes writes to the current task's buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = _current_output.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+async def _run_buffered(check: Callable[[], Awaitable[bool]]) -> tuple[bool, str]:
+    """Run one check with its own output buffer; exceptions count as failure."""
+    buffer = io.StringIO()
+    _current_output.set(buffer)
+    try:
+        passed = bool(await check())
+    except Exception as e:
+        print(f"\n❌ Unhandled error: {e}")
+        passed = False
+    return passed, buffer.getvalue()
+
+
+async def run_concurrently(checks: dict[str, Callable[[], Awaitable[bool]]]) -> dict[str, bool]:
+    """
+    Run independent checks concurrently and print their output in declaration order.
+
+    Each check runs in its own task, so print() output is captured per check and
+    written out after all checks finish instead of interleaving.
+
+    Args:
+        checks: Mapping of check name to async function returning True on success
+
+    Returns:
+        Mapping of check name to pass/fail
+    """
+    original_stdout = sys.stdout
+    sys.stdout = _TaskStdout(original_stdout)
+    try:
+        outcomes = await asyncio.gather(*(_run_buffered(check) for check in checks.values()))
+    finally:
+        sys.stdout = original_stdout
+
+    for _, output in outcomes:
+        print(output, end="")
+
+    return {name: passed for name, (passed, _) in zip(checks, outcomes, strict=True)}
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a script's main coroutine, on uvloop when it is installed.
+
+    uvloop is optional and POSIX-only; without it (e.g. on Windows) the default
+    asyncio event loop is used.
+
+    Args:
+        main: Coroutine to run to completion
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
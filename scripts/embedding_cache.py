@@ -0,0 +1,138 @@
+"""On-disk embedding cache for Azure Search index setup and sync."""
+
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "data" / "embeddings_cache.sqlite"
+
+# Stay well below SQLite's host-parameter limit for IN (...) queries
+_QUERY_CHUNK_SIZE = 500
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed store of embedding vectors.
+
+    Keys combine a model fingerprint (deployment name and dimensions) with the embedded
+    text, so switching models never returns stale vectors from another model.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, fingerprint: str = ""):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file location (defaults to data/embeddings_cache.sqlite)
+            fingerprint: Model identity mixed into every key, e.g. "text-embedding-ada-002:1536"
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.fingerprint = fingerprint
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS cache (hash TEXT PRIMARY KEY, vector BLOB)")
+
+    def key(self, text: str) -> str:
+        """Return the cache key for a text under this cache's model fingerprint."""
+        return hashlib.blake2b(f"{self.fingerprint}\0{text}".encode(), digest_size=16).hexdigest()
+
+    def get_many(self, hashes: list[str]) -> dict[str, np.ndarray]:
+        """
+        Look up cached vectors.
+
+        Args:
+            hashes: Cache keys to fetch
+
+        Returns:
+            Mapping of found keys to float32 embedding vectors
+        """
+        found = {}
+        for i in range(0, len(hashes), _QUERY_CHUNK_SIZE):
+            chunk = hashes[i : i + _QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(f"SELECT hash, vector FROM cache WHERE hash IN ({placeholders})", chunk)
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, vectors: dict[str, np.ndarray]) -> None:
+        """
+        Store vectors as float32 blobs.
+
+        Args:
+            vectors: Mapping of cache keys to embedding vectors
+        """
+        rows = [(key, vector.astype(np.float32, copy=False).tobytes()) for key, vector in vectors.items()]
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO cache (hash, vector) VALUES (?, ?)", rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+
+async def generate_embeddings_sorted(embeddings_client, texts: list[str]) -> list[list[float]]:
+    """
+    Embed texts in length order, preserving input order in the result.
+
+    The client splits the sorted texts into concurrent sub-batches, so each request
+    holds texts of similar length and none is padded out by one long outlier.
+    Duplicates are already collapsed by the callers (generate_embeddings_cached by
+    cache key, generate_embeddings_batch by text), so no dedupe happens here.
+
+    Args:
+        embeddings_client: EmbeddingsClient instance
+        texts: Texts to embed
+
+    Returns:
+        Embedding vectors in the same order as texts
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    sorted_embeddings = await embeddings_client.generate_embeddings_batch([texts[i] for i in order])
+
+    # Scatter results back to the original positions
+    embeddings: list[list[float]] = [None] * len(texts)  # type: ignore[list-item]
+    for position, embedding in zip(order, sorted_embeddings, strict=True):
+        embeddings[position] = embedding
+    return embeddings
+
+
+async def generate_embeddings_cached(embeddings_client, texts: list[str], cache: EmbeddingCache) -> np.ndarray:
+    """
+    Generate embeddings, only calling the API for texts missing from the cache.
+
+    Vectors are kept as one float32 array (4 bytes per value) rather than lists of
+    Python floats; they are converted to lists only when building index documents.
+
+    Args:
+        embeddings_client: EmbeddingsClient instance
+        texts: Texts to embed
+        cache: EmbeddingCache to read from and populate
+
+    Returns:
+        float32 array of shape (len(texts), dimensions), rows in the same order as texts
+    """
+    hashes = [cache.key(text) for text in texts]
+    cached = cache.get_many(list(set(hashes)))
+
+    misses = {h: text for h, text in zip(hashes, texts, strict=True) if h not in cached}
+    logger.info(f"Embedding cache: {len(cached)} hits, {len(misses)} misses")
+
+    if misses:
+        new_embeddings = await generate_embeddings_sorted(embeddings_client, list(misses.values()))
+        new_vectors = {
+            h: np.asarray(embedding, dtype=np.float32)
+            for h, embedding in zip(misses.keys(), new_embeddings, strict=True)
+        }
+        # Zero vectors stand in for texts the API rejected; don't persist them
+        cache.put_many({h: vector for h, vector in new_vectors.items() if vector.any()})
+        cached.update(new_vectors)
+
+    if not hashes:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.stack([cached[h] for h in hashes])
@@ -3,8 +3,14 @@
 
 import json
 import logging
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+from pydantic import TypeAdapter
+
 from chatassistant_retail.config import get_settings
 from chatassistant_retail.data import SampleDataGenerator
 from chatassistant_retail.data.models import Product, Sale
@@ -16,11 +22,103 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Bump when Product/Sale fields or generator output change so existing sample files are regenerated
+SAMPLE_DATA_SCHEMA_VERSION = 2
+
+# Records which parameters produced the sample files currently on disk
+_STAMP_FILENAME = "sample_data.stamp"
+
+# Serialize straight to JSON bytes in pydantic-core, skipping the intermediate dict
+_PRODUCT_ADAPTER = TypeAdapter(Product)
+_SALE_ADAPTER = TypeAdapter(Sale)
+
+
+def import_zstandard():
+    """
+    Import the optional zstandard package used for compressed sample data files.
+
+    Returns:
+        The zstandard module
+
+    Raises:
+        ImportError: If zstandard is not installed, naming the extra that provides it
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "Compressed sample data requires the zstandard package. "
+            'Install it with: pip install "chatassistant_retail[perf]"'
+        ) from e
+    return zstandard
+
+
+def _write_json(
+    path: Path, records: Iterable[Product] | Iterable[Sale], adapter: TypeAdapter, compress: bool = False
+) -> None:
+    """
+    Stream models to a JSON array file, one record per line.
+
+    Only one serialized record is held in memory at a time; the output is still a
+    regular JSON array so existing loaders (tools, retriever) can read it unchanged.
+    With compress=True the same bytes are piped through a zstd stream writer.
+    """
+    with open(path, "wb", buffering=1 << 20) as raw:
+        if compress:
+            zstandard = import_zstandard()
+            f = zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False)
+        else:
+            f = raw
+
+        f.write(b"[")
+        for i, record in enumerate(records):
+            f.write(b",\n" if i else b"\n")
+            f.write(adapter.dump_json(record))
+        f.write(b"\n]\n")
+
+        if compress:
+            f.close()
+
+
+def _sample_data_stamp(count: int, months: int) -> dict:
+    """Build the stamp describing a sample data generation run."""
+    return {"schema_version": SAMPLE_DATA_SCHEMA_VERSION, "count": count, "months": months}
+
+
+def sample_data_is_current(count: int, months: int, data_dir: Path | None = None) -> bool:
+    """
+    Check whether sample data files on disk were generated with the given parameters.
+
+    Args:
+        count: Expected number of products
+        months: Expected months of sales history
+        data_dir: Data directory (defaults to project root/data/)
+
+    Returns:
+        True if products.json and sales_history.json exist and match the current schema
+        version, count, and months; False otherwise
+    """
+    if data_dir is None:
+        data_dir = Path(__file__).parent.parent / "data"
+
+    stamp_file = data_dir / _STAMP_FILENAME
+    if not (
+        stamp_file.exists() and (data_dir / "products.json").exists() and (data_dir / "sales_history.json").exists()
+    ):
+        return False
+
+    try:
+        return json.loads(stamp_file.read_text()) == _sample_data_stamp(count, months)
+    except (OSError, ValueError):
+        return False
+
+
 def generate_and_save_sample_data(
     count: int | None = None,
     months: int | None = None,
     save_to_disk: bool = True,
     data_dir: Path | None = None,
+    compress: bool = False,
 ) -> tuple[list[Product], list[Sale]]:
     """
     Generate sample products and sales data.
@@ -30,13 +128,21 @@ def generate_and_save_sample_data(
         months: Number of months of sales history (defaults to settings.sample_data_sales_months)
         save_to_disk: Whether to save JSON files to disk (default: True)
         data_dir: Directory to save files (defaults to project root/data/)
+        compress: Write zstd-compressed .json.zst files instead of plain JSON
+            (requires the zstandard package from the perf extra; only
+            scripts/setup_azure_search.py reads them)
 
     Returns:
         Tuple of (products, sales) as lists of Product and Sale instances
 
     Raises:
+        ImportError: If compress=True and the zstandard package is not installed
         OSError: If save_to_disk=True and file writing fails
     """
+    if save_to_disk and compress:
+        # Fail before generating anything rather than inside a writer thread
+        import_zstandard()
+
     settings = get_settings()
 
     # Use defaults from settings if not provided
@@ -63,25 +169,35 @@ def generate_and_save_sample_data(
     # Save to disk if requested
     if save_to_disk:
         data_dir.mkdir(exist_ok=True)
-        products_file = data_dir / "products.json"
-        sales_file = data_dir / "sales_history.json"
+        suffix = ".json.zst" if compress else ".json"
+        products_file = data_dir / f"products{suffix}"
+        sales_file = data_dir / f"sales_history{suffix}"
+
+        logger.info(f"Saving products to {products_file} and sales history to {sales_file}...")
+        # The two files are independent, so overlap serialization of one with I/O of the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            products_future = executor.submit(_write_json, products_file, products, _PRODUCT_ADAPTER, compress)
+            sales_future = executor.submit(_write_json, sales_file, sales, _SALE_ADAPTER, compress)
 
-        logger.info(f"Saving products to {products_file}...")
         try:
-            with open(products_file, "w") as f:
-                json.dump([p.model_dump() for p in products], f, indent=2, default=str)
+            products_future.result()
         except OSError as e:
             logger.error(f"Failed to save products: {e}")
             raise
 
-        logger.info(f"Saving sales history to {sales_file}...")
         try:
-            with open(sales_file, "w") as f:
-                json.dump([s.model_dump() for s in sales], f, indent=2, default=str)
+            sales_future.result()
         except OSError as e:
             logger.error(f"Failed to save sales history: {e}")
             raise
 
+        # Only plain JSON files can be reused by sample_data_is_current
+        stamp_file = data_dir / _STAMP_FILENAME
+        if compress:
+            stamp_file.unlink(missing_ok=True)
+        else:
+            stamp_file.write_text(json.dumps(_sample_data_stamp(count, months)))
+
     return products, sales
 
 
@@ -103,24 +219,22 @@ def main():
         print(f"Total Products: {len(products)}")
         print(f"Total Sales: {len(sales)}")
         print("\nProducts by Category:")
-        category_counts = {}
-        for product in products:
-            category_counts[product.category] = category_counts.get(product.category, 0) + 1
+        category_counts = Counter(p.category for p in products)
         for category, count in sorted(category_counts.items()):
             print(f"  {category}: {count}")
 
         print("\nStock Distribution:")
-        out_of_stock = sum(1 for p in products if p.current_stock == 0)
-        low_stock = sum(1 for p in products if 0 < p.current_stock <= p.reorder_level)
-        normal_stock = sum(1 for p in products if p.current_stock > p.reorder_level)
+        stock = np.fromiter((p.current_stock for p in products), dtype=np.int32, count=len(products))
+        reorder = np.fromiter((p.reorder_level for p in products), dtype=np.int32, count=len(products))
+        out_of_stock = int((stock == 0).sum())
+        low_stock = int(((stock > 0) & (stock <= reorder)).sum())
+        normal_stock = int((stock > reorder).sum())
         print(f"  Out of Stock: {out_of_stock}")
         print(f"  Low Stock: {low_stock}")
         print(f"  Normal Stock: {normal_stock}")
 
         print("\nSales by Channel:")
-        channel_counts = {}
-        for sale in sales:
-            channel_counts[sale.channel] = channel_counts.get(sale.channel, 0) + 1
+        channel_counts = Counter(s.channel for s in sales)
         for channel, count in sorted(channel_counts.items()):
             print(f"  {channel.capitalize()}: {count}")
 
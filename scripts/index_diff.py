@@ -1,9 +1,13 @@
 """Change detection module for Azure Search index synchronization."""
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
+import numpy as np
+
 from chatassistant_retail.data.models import Product
+from chatassistant_retail.rag.azure_search_client import compute_content_hash
 
 
 @dataclass
@@ -31,6 +35,13 @@ class IndexDiff:
         )
 
 
+# Mutable fields compared during sync (id/sku are keys and excluded), split by type
+_NUMERIC_FIELDS = ("price", "current_stock", "reorder_level")
+_STRING_FIELDS = ("name", "category", "description", "supplier")
+_get_local_numeric = attrgetter(*_NUMERIC_FIELDS)
+_get_local_strings = attrgetter(*_STRING_FIELDS)
+
+
 def _products_differ(local: Product, indexed: dict[str, Any]) -> bool:
     """
     Check if local product differs from indexed document.
@@ -44,29 +55,61 @@ def _products_differ(local: Product, indexed: dict[str, Any]) -> bool:
     Returns:
         True if products differ, False if identical
     """
-    fields_to_compare = ["name", "category", "description", "price", "current_stock", "reorder_level", "supplier"]
-
-    for field in fields_to_compare:
-        local_value = getattr(local, field)
+    # Numeric lane: JSON may load ints as floats, so compare with a tolerance
+    for field, local_value in zip(_NUMERIC_FIELDS, _get_local_numeric(local), strict=True):
         indexed_value = indexed.get(field)
+        if not isinstance(indexed_value, (int, float)) or abs(local_value - indexed_value) > 1e-9:
+            return True
 
-        # Handle type coercion (JSON may load ints as floats, etc.)
-        if isinstance(local_value, (int, float)) and isinstance(indexed_value, (int, float)):
-            if abs(local_value - indexed_value) > 1e-9:  # Float comparison tolerance
-                return True
-        elif str(local_value) != str(indexed_value):
+    # String lane: both sides are already str, so compare directly
+    for field, local_value in zip(_STRING_FIELDS, _get_local_strings(local), strict=True):
+        if local_value != indexed.get(field):
             return True
 
     return False
 
 
-def calculate_diff(local_products: list[Product], indexed_documents: list[dict[str, Any]]) -> IndexDiff:
+def _changed_mask(products: list[Product], documents: list[dict[str, Any]]) -> np.ndarray:
+    """
+    Vectorized equivalent of _products_differ over aligned lists of products and documents.
+
+    Builds one column array per field and compares whole columns at once, so the
+    per-product cost is a few array element operations instead of interpreted loops.
+
+    Args:
+        products: Local Product instances
+        documents: Indexed documents, aligned with products
+
+    Returns:
+        Boolean array, True where the product differs from its document
+    """
+    changed = np.zeros(len(products), dtype=bool)
+
+    for field in _NUMERIC_FIELDS:
+        local_column = np.fromiter((getattr(p, field) for p in products), dtype=np.float64, count=len(products))
+        # Missing values become NaN, which never satisfies the tolerance check below
+        indexed_column = np.array([doc.get(field) for doc in documents], dtype=np.float64)
+        changed |= ~(np.abs(local_column - indexed_column) <= 1e-9)
+
+    for field in _STRING_FIELDS:
+        local_column = np.array([getattr(p, field) for p in products], dtype=object)
+        indexed_column = np.array([doc.get(field) for doc in documents], dtype=object)
+        changed |= (local_column != indexed_column).astype(bool)
+
+    return changed
+
+
+def calculate_diff(
+    local_products: list[Product], indexed_documents: list[dict[str, Any]], embedding_fingerprint: str = ""
+) -> IndexDiff:
     """
     Calculate difference between local products and indexed documents.
 
     Args:
         local_products: Products from local JSON file
         indexed_documents: Documents from Azure Search index
+        embedding_fingerprint: Embedding model identity mixed into content_hash
+            (AzureSearchClient.embedding_fingerprint); hashes only match with it
 
     Returns:
         IndexDiff object with inserts, updates, deletes, and unchanged counts
@@ -75,27 +118,33 @@ def calculate_diff(local_products: list[Product], indexed_documents: list[dict[s
     local_by_sku = {p.sku: p for p in local_products}
     indexed_by_sku = {doc["sku"]: doc for doc in indexed_documents}
 
-    inserts = []
-    updates = []
-    deletes = []
-    unchanged = 0
+    local_keys = local_by_sku.keys()
+    indexed_keys = indexed_by_sku.keys()
+
+    # SKUs in local but not in index → INSERT; in index but not local → DELETE.
+    # Key-view set operations run in C; sorting keeps the output deterministic.
+    inserts = [local_by_sku[sku] for sku in sorted(local_keys - indexed_keys)]
+    deletes = sorted(indexed_keys - local_keys)
 
-    # Find inserts and updates
-    for sku, product in local_by_sku.items():
-        if sku not in indexed_by_sku:
-            # SKU exists locally but not in index → INSERT
-            inserts.append(product)
+    # SKUs in both → matching fingerprints mean identical content; compare the rest field by field
+    candidates = []
+    unchanged = 0
+    for sku in sorted(local_keys & indexed_keys):
+        product = local_by_sku[sku]
+        indexed = indexed_by_sku[sku]
+        indexed_hash = indexed.get("content_hash")
+        if indexed_hash is not None and indexed_hash == compute_content_hash(product, embedding_fingerprint):
+            unchanged += 1
         else:
-            # SKU exists in both → check if fields differ
-            if _products_differ(product, indexed_by_sku[sku]):
-                updates.append(product)
-            else:
-                unchanged += 1
-
-    # Find deletes
-    for sku in indexed_by_sku.keys():
-        if sku not in local_by_sku:
-            # SKU exists in index but not locally → DELETE
-            deletes.append(sku)
+            candidates.append((product, indexed))
+
+    try:
+        changed = _changed_mask([product for product, _ in candidates], [indexed for _, indexed in candidates])
+    except (TypeError, ValueError):
+        # Non-numeric values in numeric fields: fall back to the per-product comparison
+        changed = [_products_differ(product, indexed) for product, indexed in candidates]
+
+    updates = [product for (product, _), differs in zip(candidates, changed, strict=True) if differs]
+    unchanged += len(candidates) - len(updates)
 
     return IndexDiff(inserts=inserts, updates=updates, deletes=deletes, unchanged=unchanged)
@@ -1,23 +1,37 @@
 """Setup Azure Cognitive Search index for chatassistant_retail."""
 
+from __future__ import annotations
+
 import argparse
 import asyncio
-import json
 import logging
 import sys
+import time
+from collections.abc import Callable
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add parent directory to path for importing sibling scripts
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from chatassistant_retail.config import get_settings
-from chatassistant_retail.data.models import Product
-from chatassistant_retail.rag import AzureSearchClient, EmbeddingsClient
-from scripts.generate_sample_data import generate_and_save_sample_data
+# Heavy imports (Azure SDKs, openai, faker, numpy) are deferred to the functions that use them
+# so argument parsing and --help stay fast.
+if TYPE_CHECKING:
+    import httpx
+
+    from chatassistant_retail.data.models import Product
+    from chatassistant_retail.rag import AzureSearchClient, EmbeddingsClient
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Vector size of the embedding deployment (text-embedding-ada-002)
+EMBEDDING_DIMENSIONS = 1536
+
+# Product fields joined (space-separated) into the text that gets embedded
+_embedding_text_fields = attrgetter("name", "category", "description")
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -35,6 +49,12 @@ Examples:
   # Full reindex (delete and recreate)
   python scripts/setup_azure_search.py --full-reindex
 
+  # Initial setup, regenerating sample data even if it is already on disk
+  python scripts/setup_azure_search.py --force-regen
+
+  # Initial setup without prompts: keep an existing index's documents, update its schema, skip sample data
+  python scripts/setup_azure_search.py --no-recreate --update-schema --no-load-samples
+
   # Sync without confirmation prompt (CI/CD usage)
   python scripts/setup_azure_search.py --sync --yes
         """,
@@ -52,6 +72,49 @@ Examples:
         help="Delete entire index and recreate from scratch",
     )
 
+    parser.add_argument(
+        "--recreate",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Initial setup: recreate the index if it already exists (default: ask, or yes with --yes)",
+    )
+
+    parser.add_argument(
+        "--update-schema",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Initial setup: when not recreating an existing index, keep its documents and update its schema "
+        "in place instead of cancelling (default: ask, or no with --yes)",
+    )
+
+    parser.add_argument(
+        "--load-samples",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Initial setup: load 500 sample products after creating the index (default: ask, or yes with --yes)",
+    )
+
+    parser.add_argument(
+        "--force-regen",
+        action="store_true",
+        help="Regenerate sample data even if data/products.json is already up to date",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Products embedded and uploaded per chunk (Azure Search limit: 1000 actions per request; "
+        "vector documents are large, so the default stays below it)",
+    )
+
+    parser.add_argument(
+        "--max-concurrent-uploads",
+        type=int,
+        default=4,
+        help="Upload requests in flight at once",
+    )
+
     parser.add_argument(
         "--yes",
         "-y",
@@ -62,53 +125,324 @@ Examples:
     return parser.parse_args()
 
 
+async def confirm(prompt: str, answer: bool | None = None) -> bool:
+    """
+    Ask a yes/no question without blocking the event loop.
+
+    Args:
+        prompt: Question shown to the user
+        answer: Preset answer from CLI flags; the user is only asked when None
+
+    Returns:
+        True if the answer is yes
+    """
+    if answer is not None:
+        return answer
+    response = await asyncio.to_thread(input, prompt)
+    return response.lower() == "yes"
+
+
 def load_local_products() -> list[Product]:
-    """Load products from local JSON file."""
+    """
+    Load products from local JSON file.
+
+    Reads data/products.json, or data/products.json.zst when only the
+    zstd-compressed file written by generate_and_save_sample_data(compress=True) exists.
+    """
     data_dir = Path(__file__).parent.parent / "data"
     products_file = data_dir / "products.json"
+    if not products_file.exists() and products_file.with_suffix(".json.zst").exists():
+        products_file = products_file.with_suffix(".json.zst")
 
     if not products_file.exists():
         raise FileNotFoundError(f"Products file not found: {products_file}")
 
-    with open(products_file) as f:
-        products_data = json.load(f)
+    import orjson
+    from pydantic import TypeAdapter
+
+    from chatassistant_retail.data.models import Product
+
+    raw = products_file.read_bytes()
+    if products_file.suffix == ".zst":
+        from scripts.generate_sample_data import import_zstandard
 
-    return [Product(**p) for p in products_data]
+        raw = import_zstandard().ZstdDecompressor().decompressobj().decompress(raw)
 
+    # Validate the whole list in one pydantic-core call instead of constructing Products one by one
+    products = TypeAdapter(list[Product]).validate_python(orjson.loads(raw))
+
+    # Category and supplier are low-cardinality; share one string object per distinct value
+    for product in products:
+        product.category = sys.intern(product.category)
+        product.supplier = sys.intern(product.supplier)
+
+    return products
+
+
+def start_warmup(
+    search_client: AzureSearchClient, settings, http_client: httpx.AsyncClient | None = None
+) -> tuple[EmbeddingsClient, asyncio.Task]:
+    """
+    Warm up the embeddings and search connections in the background.
+
+    Started before a confirmation prompt so TLS handshakes, auth and connection
+    pool setup happen while the user is reading, not on the first real request.
+
+    Args:
+        search_client: AzureSearchClient instance
+        settings: Settings instance
+        http_client: Shared connection pool for the embeddings client
+
+    Returns:
+        Tuple of (embeddings client to reuse, warmup task to await or cancel)
+    """
+    from chatassistant_retail.rag import EmbeddingsClient
+
+    embeddings_client = EmbeddingsClient(settings, http_client=http_client)
+
+    async def warm() -> None:
+        # Failures here are not fatal; the real requests will surface them
+        await asyncio.gather(
+            embeddings_client.generate_embedding("warmup"),
+            asyncio.to_thread(search_client.get_index_stats),
+            return_exceptions=True,
+        )
+
+    return embeddings_client, asyncio.create_task(warm())
+
+
+async def embed_and_apply(
+    search_client: AzureSearchClient,
+    settings,
+    products: list[Product],
+    deletes: list[str] | None = None,
+    chunk_size: int = 500,
+    max_concurrent_uploads: int = 4,
+    embeddings_client: EmbeddingsClient | None = None,
+) -> dict:
+    """
+    Embed products chunk by chunk and upload each chunk while the next one is being embedded.
+
+    A producer embeds chunks and puts them on a bounded queue; consumer tasks upload
+    whatever is ready, so wall time approaches max(embedding time, upload time)
+    instead of their sum. Products whose text the embeddings API rejects are not
+    uploaded and are reported as failures, so the next sync retries them.
+
+    Args:
+        search_client: AzureSearchClient instance
+        settings: Settings instance
+        products: Products to embed and upsert
+        deletes: SKUs to delete (sent with the first upload)
+        chunk_size: Products per embedding/upload chunk, also the maximum actions per
+            upload request (Azure Search limit: 1000)
+        max_concurrent_uploads: Upload requests in flight at once
+        embeddings_client: Already warmed EmbeddingsClient to reuse (created if None)
+
+    Returns:
+        Aggregated results in the same shape as AzureSearchClient.apply_diff
+    """
+    from chatassistant_retail.rag import EmbeddingsClient
+    from scripts.embedding_cache import EmbeddingCache, generate_embeddings_cached
+
+    if embeddings_client is None:
+        embeddings_client = EmbeddingsClient(settings)
+    cache = EmbeddingCache(fingerprint=f"{settings.azure_openai_embedding_deployment}:{EMBEDDING_DIMENSIONS}")
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+    results: list[dict] = []
+    rejected: list[str] = []
+
+    async def produce() -> None:
+        try:
+            chunks = [products[i : i + chunk_size] for i in range(0, len(products), chunk_size)] or [[]]
+            for i, chunk in enumerate(chunks):
+                texts = [" ".join(_embedding_text_fields(p)) for p in chunk]
+                embeddings = await generate_embeddings_cached(embeddings_client, texts, cache) if texts else []
+                if len(embeddings):
+                    # Zero vectors stand in for texts the API rejected. Uploading them with the
+                    # product's content_hash would mark the product as current forever, so leave
+                    # it out; the next sync sees it as missing or changed and retries it
+                    accepted = embeddings.any(axis=1)
+                    if not accepted.all():
+                        rejected.extend(p.sku for p, ok in zip(chunk, accepted, strict=True) if not ok)
+                        chunk = [p for p, ok in zip(chunk, accepted, strict=True) if ok]
+                        embeddings = embeddings[accepted]
+                await queue.put((list(deletes or []) if i == 0 else [], chunk, embeddings))
+        finally:
+            # One sentinel per consumer, also on failure so consumers never wait forever
+            for _ in range(max_concurrent_uploads):
+                await queue.put(None)
+
+    async def consume() -> None:
+        while (item := await queue.get()) is not None:
+            results.append(await search_client.apply_diff(*item, batch_size=chunk_size))
 
-async def load_sample_data(search_client: AzureSearchClient, settings) -> int:
-    """Load sample data into the index."""
     try:
-        logger.info("Generating sample products and sales history...")
-        products, sales = generate_and_save_sample_data(
-            count=500,
-            months=6,
-            save_to_disk=True,  # Overwrite data/products.json and data/sales_history.json
+        await asyncio.gather(produce(), *(consume() for _ in range(max_concurrent_uploads)))
+    finally:
+        cache.close()
+
+    if rejected:
+        results.append(
+            {
+                "total": len(rejected),
+                "succeeded": 0,
+                "failed": len(rejected),
+                "errors": [f"SKU {sku}: embedding rejected by the API; not uploaded" for sku in rejected],
+            }
         )
-        logger.info(f"Generated {len(products)} products and {len(sales)} sales transactions")
-        logger.info("Sample data saved to data/products.json and data/sales_history.json")
-    except Exception as e:
-        logger.error(f"Failed to generate sample data: {e}")
-        return 1
 
-    logger.info("Generating embeddings (this may take a few minutes)...")
-    embeddings_client = EmbeddingsClient(settings)
+    return {
+        "total": sum(r["total"] for r in results),
+        "succeeded": sum(r["succeeded"] for r in results),
+        "failed": sum(r["failed"] for r in results),
+        "errors": [error for r in results for error in r["errors"]],
+    }
 
-    # Create text for embeddings
-    texts = [f"{p.name} {p.category} {p.description}" for p in products]
 
-    # Generate embeddings in batches
-    embeddings = await embeddings_client.generate_embeddings_batch(texts)
-    logger.info(f"Generated {len(embeddings)} embeddings")
+async def _wait_until(
+    condition: Callable[[], bool],
+    timeout: float = 30.0,
+    initial_interval: float = 0.2,
+    max_interval: float = 2.0,
+) -> bool:
+    """
+    Poll a blocking condition until it holds or the timeout elapses.
 
-    logger.info("Uploading products to index (batches of 100)...")
-    await search_client.index_products(products, embeddings)
+    The interval doubles after each poll (0.2s, 0.4s, 0.8s, ...) so the common fast
+    case returns quickly without hammering the service when it is slow.
 
-    # Wait for indexing to complete
-    await asyncio.sleep(3)
+    Args:
+        condition: Blocking check, run in a worker thread
+        timeout: Maximum seconds to wait
+        initial_interval: First delay between polls in seconds
+        max_interval: Upper bound on the delay between polls
+
+    Returns:
+        True if the condition held before the timeout, False otherwise
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    while True:
+        if await asyncio.to_thread(condition):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        await asyncio.sleep(interval)
+        interval = min(interval * 2, max_interval)
+
+
+async def _wait_for_count(search_client: AzureSearchClient, expected: int, timeout: float = 30.0) -> int:
+    """
+    Poll index stats until the document count reaches the expected value.
+
+    Args:
+        search_client: AzureSearchClient instance
+        expected: Document count to wait for
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Last observed document count (equals expected unless the timeout elapsed)
+    """
+    doc_count = 0
+
+    def reached() -> bool:
+        nonlocal doc_count
+        doc_count = search_client.get_index_stats().get("document_count", 0)
+        return doc_count == expected
+
+    await _wait_until(reached, timeout=timeout)
+    return doc_count
+
+
+async def _index_is_current(search_client: AzureSearchClient, products: list[Product]) -> bool:
+    """
+    Check whether the index already holds exactly these products, embedded by the current model.
 
-    stats = search_client.get_index_stats()
-    doc_count = stats.get("document_count", 0)
+    Cheap when the index is new or partially loaded: the document count is checked
+    before any documents are fetched. Every document's content_hash must then match
+    the product's hash under the current embedding fingerprint, so vectors from a
+    different embedding deployment (or documents without a hash) count as stale.
+
+    Args:
+        search_client: AzureSearchClient instance
+        products: Products that would be uploaded
+
+    Returns:
+        True if no document would need to be inserted, updated, re-embedded, or deleted
+    """
+    from chatassistant_retail.rag.azure_search_client import compute_content_hash
+
+    doc_count = (await asyncio.to_thread(search_client.get_index_stats)).get("document_count", 0)
+    if doc_count != len(products):
+        return False
+
+    fingerprint = search_client.embedding_fingerprint
+    expected = {product.sku: compute_content_hash(product, fingerprint) for product in products}
+    documents = await search_client.get_all_documents()
+    return len(documents) == len(expected) and all(
+        doc.get("content_hash") is not None and doc.get("content_hash") == expected.get(doc.get("sku"))
+        for doc in documents
+    )
+
+
+async def load_sample_data(
+    search_client: AzureSearchClient,
+    settings,
+    force_regen: bool = False,
+    embeddings_client: EmbeddingsClient | None = None,
+    chunk_size: int = 500,
+    max_concurrent_uploads: int = 4,
+) -> int:
+    """Load sample data into the index, reusing sample files on disk when they are current."""
+    from scripts.generate_sample_data import generate_and_save_sample_data, sample_data_is_current
+
+    count, months = 500, 6
+
+    if not force_regen and sample_data_is_current(count, months):
+        logger.info("Sample data in data/ is up to date; skipping regeneration (use --force-regen to override)")
+        try:
+            products = load_local_products()
+        except Exception as e:
+            logger.error(f"Failed to load sample data: {e}")
+            return 1
+    else:
+        try:
+            logger.info("Generating sample products and sales history...")
+            products, sales = generate_and_save_sample_data(
+                count=count,
+                months=months,
+                save_to_disk=True,  # Overwrite data/products.json and data/sales_history.json
+            )
+            logger.info(f"Generated {len(products)} products and {len(sales)} sales transactions")
+            logger.info("Sample data saved to data/products.json and data/sales_history.json")
+        except Exception as e:
+            logger.error(f"Failed to generate sample data: {e}")
+            return 1
+
+    # Skip the embed-and-upload phase when a kept index already holds exactly these products
+    if await _index_is_current(search_client, products):
+        logger.info(f"Index already contains all {len(products)} products with fresh vectors; skipping upload")
+        return 0
+
+    # Embed and upload products, overlapping the two stages
+    logger.info(f"Embedding and uploading {len(products)} products (this may take a few minutes)...")
+    upload_result = await embed_and_apply(
+        search_client,
+        settings,
+        products,
+        chunk_size=chunk_size,
+        max_concurrent_uploads=max_concurrent_uploads,
+        embeddings_client=embeddings_client,
+    )
+
+    if upload_result["errors"]:
+        logger.error(f"Failed to index {upload_result['failed']} products")
+        for error in upload_result["errors"][:5]:
+            logger.error(f"  - {error}")
+        return 1
+
+    # Wait for indexing to complete
+    doc_count = await _wait_for_count(search_client, len(products))
     logger.info(f"Successfully indexed {doc_count} products")
 
     if doc_count != len(products):
@@ -117,7 +451,9 @@ async def load_sample_data(search_client: AzureSearchClient, settings) -> int:
     return 0
 
 
-async def initial_setup_operation(search_client: AzureSearchClient, settings, args) -> int:
+async def initial_setup_operation(
+    search_client: AzureSearchClient, settings, args, http_client: httpx.AsyncClient | None = None
+) -> int:
     """
     Initial setup: Create index and optionally load sample data.
     This is the default behavior (backward compatible).
@@ -128,34 +464,39 @@ async def initial_setup_operation(search_client: AzureSearchClient, settings, ar
     if search_client.index_exists():
         logger.warning(f"Index '{index_name}' already exists.")
 
-        if args.yes:
-            response = "yes"
+        recreate = await confirm(
+            "Do you want to recreate it? This will delete all existing data. (yes/no): ",
+            answer=args.recreate if args.recreate is not None else (True if args.yes else None),
+        )
+        if recreate:
+            logger.info(f"Deleting existing index '{index_name}'...")
+            try:
+                search_client.index_client.delete_index(index_name)
+                logger.info(f"Index '{index_name}' deleted successfully.")
+                await _wait_until(lambda: not search_client.index_exists())
+            except Exception as e:
+                logger.error(f"Failed to delete index: {e}")
+                return 1
         else:
-            response = input("Do you want to recreate it? This will delete all existing data. (yes/no): ")
-
-        if response.lower() != "yes":
-            logger.info("Setup cancelled.")
-            logger.info("Hint: Use --sync to update existing index without recreating it.")
-            return 0
-
-        logger.info(f"Deleting existing index '{index_name}'...")
-        try:
-            search_client.index_client.delete_index(index_name)
-            logger.info(f"Index '{index_name}' deleted successfully.")
-            await asyncio.sleep(2)
-        except Exception as e:
-            logger.error(f"Failed to delete index: {e}")
-            return 1
-
-    # Create index
+            # Changing the live schema is a separate decision; never imply it from declining a delete
+            update_schema = await confirm(
+                "Do you want to keep its documents and update the index schema in place instead? (yes/no): ",
+                answer=args.update_schema if args.update_schema is not None else (False if args.yes else None),
+            )
+            if not update_schema:
+                logger.info("Setup cancelled.")
+                logger.info("Hint: Use --sync to update existing index without recreating it.")
+                return 0
+
+            # Existing documents and vectors are kept; sample data loading skips them if still fresh
+            logger.info(f"Keeping existing index '{index_name}'; updating its schema in place.")
+
+    # Create (or update) index
     logger.info(f"Creating index '{index_name}'...")
-    search_client.create_index(embedding_dimensions=1536)
+    search_client.create_index(embedding_dimensions=EMBEDDING_DIMENSIONS)
 
-    # Wait a moment for index creation to complete
-    await asyncio.sleep(2)
-
-    # Verify creation
-    if not search_client.index_exists():
+    # Wait for index creation to complete
+    if not await _wait_until(search_client.index_exists):
         logger.error("Failed to create index.")
         return 1
 
@@ -168,18 +509,27 @@ async def initial_setup_operation(search_client: AzureSearchClient, settings, ar
         logger.info(f"Vector search configured: {bool(schema.get('vector_search'))}")
         logger.info(f"Semantic search configured: {bool(schema.get('semantic_search'))}")
 
-    # Ask if user wants to load sample data
-    if args.yes:
-        load_data = True
-    else:
-        response = input("\nDo you want to load sample product data (500 products)? (yes/no): ")
-        load_data = response.lower() == "yes"
+    # Ask if user wants to load sample data (warming up clients while they answer)
+    embeddings_client, warmup = start_warmup(search_client, settings, http_client)
+    load_data = await confirm(
+        "\nDo you want to load sample product data (500 products)? (yes/no): ",
+        answer=args.load_samples if args.load_samples is not None else (True if args.yes else None),
+    )
 
     if load_data:
-        result = await load_sample_data(search_client, settings)
+        await warmup
+        result = await load_sample_data(
+            search_client,
+            settings,
+            force_regen=args.force_regen,
+            embeddings_client=embeddings_client,
+            chunk_size=args.batch_size,
+            max_concurrent_uploads=args.max_concurrent_uploads,
+        )
         if result != 0:
             return result
     else:
+        warmup.cancel()
         logger.info("Index created successfully. No data loaded.")
         logger.info("Hint: Use --sync to load products from data/products.json")
 
@@ -202,7 +552,9 @@ async def initial_setup_operation(search_client: AzureSearchClient, settings, ar
     return 0
 
 
-async def sync_operation(search_client: AzureSearchClient, settings, args) -> int:
+async def sync_operation(
+    search_client: AzureSearchClient, settings, args, http_client: httpx.AsyncClient | None = None
+) -> int:
     """
     Sync operation: Detect and apply changes from local JSON to Azure index.
     """
@@ -217,27 +569,29 @@ async def sync_operation(search_client: AzureSearchClient, settings, args) -> in
         logger.error("  python scripts/setup_azure_search.py")
         return 1
 
-    # Load local products
-    logger.info("Loading local products from data/products.json...")
-    try:
-        local_products = load_local_products()
-        logger.info(f"Loaded {len(local_products)} products from local file")
-    except Exception as e:
-        logger.error(f"Failed to load local products: {e}")
+    # Load local products (in a worker thread) while fetching indexed documents
+    logger.info("Loading local products from data/products.json and fetching documents from Azure Search index...")
+    local_result, indexed_result = await asyncio.gather(
+        asyncio.to_thread(load_local_products),
+        search_client.get_all_documents(),
+        return_exceptions=True,
+    )
+
+    if isinstance(local_result, BaseException):
+        logger.error(f"Failed to load local products: {local_result}")
         return 1
+    local_products = local_result
+    logger.info(f"Loaded {len(local_products)} products from local file")
 
-    # Fetch indexed documents
-    logger.info("Fetching documents from Azure Search index...")
-    try:
-        indexed_documents = await search_client.get_all_documents()
-        logger.info(f"Retrieved {len(indexed_documents)} documents from index")
-    except Exception as e:
-        logger.error(f"Failed to fetch indexed documents: {e}")
+    if isinstance(indexed_result, BaseException):
+        logger.error(f"Failed to fetch indexed documents: {indexed_result}")
         return 1
+    indexed_documents = indexed_result
+    logger.info(f"Retrieved {len(indexed_documents)} documents from index")
 
     # Calculate diff
     logger.info("Calculating changes...")
-    diff = calculate_diff(local_products, indexed_documents)
+    diff = calculate_diff(local_products, indexed_documents, search_client.embedding_fingerprint)
 
     # Display summary
     print("\n" + "=" * 60)
@@ -248,56 +602,40 @@ async def sync_operation(search_client: AzureSearchClient, settings, args) -> in
         logger.info("No changes detected. Index is up to date.")
         return 0
 
-    # Confirm with user
-    if not args.yes:
-        response = input("Apply these changes to Azure Search index? (yes/no): ")
-        if response.lower() != "yes":
-            logger.info("Sync cancelled.")
-            return 0
+    # Confirm with user (warming up clients while they answer)
+    embeddings_client, warmup = start_warmup(search_client, settings, http_client)
+    if not await confirm("Apply these changes to Azure Search index? (yes/no): ", answer=True if args.yes else None):
+        warmup.cancel()
+        logger.info("Sync cancelled.")
+        return 0
+    await warmup
 
     # Apply changes
     logger.info("Applying changes to Azure Search index...")
 
-    # Step 1: Delete products
-    if diff.deletes:
-        logger.info(f"Deleting {len(diff.deletes)} products...")
-        delete_result = await search_client.delete_products_by_sku(diff.deletes)
-        logger.info(f"Deleted {delete_result['succeeded']} / {delete_result['total']} products")
-
-        if delete_result["errors"]:
-            logger.warning(f"Delete errors: {len(delete_result['errors'])}")
-            for error in delete_result["errors"][:5]:  # Show first 5 errors
-                logger.warning(f"  - {error}")
-
-    # Step 2: Upsert (insert + update)
+    # Embed inserts + updates and upload them (with deletes) as each chunk is ready
     products_to_upsert = diff.inserts + diff.updates
-    if products_to_upsert:
-        logger.info(f"Upserting {len(products_to_upsert)} products (inserts + updates)...")
-
-        # Generate embeddings
-        logger.info("Generating embeddings...")
-        embeddings_client = EmbeddingsClient(settings)
-        texts = [f"{p.name} {p.category} {p.description}" for p in products_to_upsert]
-        embeddings = await embeddings_client.generate_embeddings_batch(texts)
-        logger.info(f"Generated {len(embeddings)} embeddings")
-
-        # Upsert products
-        upsert_result = await search_client.upsert_products(products_to_upsert, embeddings)
-        logger.info(f"Upserted {upsert_result['succeeded']} / {upsert_result['total']} products")
-
-        if upsert_result["errors"]:
-            logger.warning(f"Upsert errors: {len(upsert_result['errors'])}")
-            for error in upsert_result["errors"][:5]:
-                logger.warning(f"  - {error}")
+    logger.info(f"Deleting {len(diff.deletes)} and upserting {len(products_to_upsert)} products...")
+    apply_result = await embed_and_apply(
+        search_client,
+        settings,
+        products_to_upsert,
+        diff.deletes,
+        chunk_size=args.batch_size,
+        max_concurrent_uploads=args.max_concurrent_uploads,
+        embeddings_client=embeddings_client,
+    )
+    logger.info(f"Applied {apply_result['succeeded']} / {apply_result['total']} changes")
 
-    # Wait for indexing
-    await asyncio.sleep(3)
+    if apply_result["errors"]:
+        logger.warning(f"Sync errors: {len(apply_result['errors'])}")
+        for error in apply_result["errors"][:5]:  # Show first 5 errors
+            logger.warning(f"  - {error}")
 
-    # Verify final state
+    # Wait for indexing, then verify final state
     logger.info("\nVerifying sync results...")
-    stats = search_client.get_index_stats()
-    doc_count = stats.get("document_count", 0)
     expected_count = len(local_products)
+    doc_count = await _wait_for_count(search_client, expected_count)
 
     logger.info(f"Index document count: {doc_count}")
     logger.info(f"Expected count: {expected_count}")
@@ -310,46 +648,52 @@ async def sync_operation(search_client: AzureSearchClient, settings, args) -> in
     return 0
 
 
-async def full_reindex_operation(search_client: AzureSearchClient, settings, args) -> int:
+async def full_reindex_operation(
+    search_client: AzureSearchClient, settings, args, http_client: httpx.AsyncClient | None = None
+) -> int:
     """
     Full reindex: Delete entire index and recreate from local JSON.
     """
     index_name = settings.azure_search_index_name
 
-    # Confirm destructive operation
+    # Confirm destructive operation (warming up the embeddings client while the user answers)
+    embeddings_client, warmup = start_warmup(search_client, settings, http_client)
     if not args.yes:
         logger.warning(f"This will DELETE index '{index_name}' and recreate it from scratch.")
-        response = input("Are you sure? (yes/no): ")
-        if response.lower() != "yes":
+        if not await confirm("Are you sure? (yes/no): "):
+            warmup.cancel()
             logger.info("Full reindex cancelled.")
             return 0
 
+    # Load local products in a worker thread while the index is deleted and recreated
+    logger.info("Loading products from data/products.json...")
+    local_task = asyncio.create_task(asyncio.to_thread(load_local_products))
+
     # Delete index if exists
     if search_client.index_exists():
         logger.info(f"Deleting index '{index_name}'...")
         try:
             search_client.index_client.delete_index(index_name)
             logger.info(f"Index '{index_name}' deleted.")
-            await asyncio.sleep(2)
+            await _wait_until(lambda: not search_client.index_exists())
         except Exception as e:
             logger.error(f"Failed to delete index: {e}")
+            local_task.cancel()
             return 1
 
     # Create index
     logger.info(f"Creating index '{index_name}'...")
-    search_client.create_index(embedding_dimensions=1536)
-    await asyncio.sleep(2)
+    search_client.create_index(embedding_dimensions=EMBEDDING_DIMENSIONS)
 
-    if not search_client.index_exists():
+    if not await _wait_until(search_client.index_exists):
         logger.error("Failed to create index.")
+        local_task.cancel()
         return 1
 
     logger.info(f"Index '{index_name}' created successfully!")
 
-    # Load local products
-    logger.info("Loading products from data/products.json...")
     try:
-        local_products = load_local_products()
+        local_products = await local_task
         logger.info(f"Loaded {len(local_products)} products from local file")
     except Exception as e:
         logger.error(f"Failed to load local products: {e}")
@@ -359,16 +703,17 @@ async def full_reindex_operation(search_client: AzureSearchClient, settings, arg
         logger.warning("No products found in data/products.json. Index is empty.")
         return 0
 
-    # Generate embeddings
-    logger.info("Generating embeddings (this may take a few minutes)...")
-    embeddings_client = EmbeddingsClient(settings)
-    texts = [f"{p.name} {p.category} {p.description}" for p in local_products]
-    embeddings = await embeddings_client.generate_embeddings_batch(texts)
-    logger.info(f"Generated {len(embeddings)} embeddings")
-
-    # Upload products
-    logger.info(f"Uploading {len(local_products)} products to index...")
-    upsert_result = await search_client.upsert_products(local_products, embeddings)
+    # Embed and upload products, overlapping the two stages
+    logger.info(f"Embedding and uploading {len(local_products)} products (this may take a few minutes)...")
+    await warmup
+    upsert_result = await embed_and_apply(
+        search_client,
+        settings,
+        local_products,
+        chunk_size=args.batch_size,
+        max_concurrent_uploads=args.max_concurrent_uploads,
+        embeddings_client=embeddings_client,
+    )
     logger.info(f"Uploaded {upsert_result['succeeded']} / {upsert_result['total']} products")
 
     if upsert_result["errors"]:
@@ -377,7 +722,7 @@ async def full_reindex_operation(search_client: AzureSearchClient, settings, arg
             logger.warning(f"  - {error}")
 
     # Wait for indexing
-    await asyncio.sleep(3)
+    await _wait_for_count(search_client, upsert_result["succeeded"])
 
     # Health check
     logger.info("\nPerforming health check...")
@@ -393,6 +738,18 @@ async def main():
     """Main entry point for Azure Search setup and management."""
     args = parse_args()
 
+    import httpx
+
+    from chatassistant_retail.config import get_settings
+    from chatassistant_retail.rag import AzureSearchClient
+
+    # One connection pool shared by every embeddings request, so concurrent batches reuse
+    # warm TCP/TLS connections instead of opening new ones
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60),
+        timeout=httpx.Timeout(30.0),
+    )
+
     try:
         settings = get_settings()
 
@@ -409,11 +766,11 @@ async def main():
 
         # Route to appropriate operation
         if args.sync:
-            return await sync_operation(search_client, settings, args)
+            return await sync_operation(search_client, settings, args, http_client)
         elif args.full_reindex:
-            return await full_reindex_operation(search_client, settings, args)
+            return await full_reindex_operation(search_client, settings, args, http_client)
         else:
-            return await initial_setup_operation(search_client, settings, args)
+            return await initial_setup_operation(search_client, settings, args, http_client)
 
     except KeyboardInterrupt:
         logger.info("\nOperation interrupted by user.")
@@ -421,6 +778,8 @@ async def main():
     except Exception as e:
         logger.error(f"Unexpected error: {e}", exc_info=True)
         return 1
+    finally:
+        await http_client.aclose()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """Test script for Gradio UI components."""
 
-import asyncio
 import logging
 
+from concurrent_runner import run, run_concurrently
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -158,11 +159,14 @@ async def main():
     print("PHASE 5 GRADIO UI TESTING")
     print("=" * 60)
 
-    results = {
-        "UI Components": await test_ui_components(),
-        "Metrics Dashboard": await test_metrics_dashboard(),
-        "Gradio Interface": await test_gradio_interface(),
-    }
+    # The checks are independent, so run them concurrently (output is still printed per check)
+    results = await run_concurrently(
+        {
+            "UI Components": test_ui_components,
+            "Metrics Dashboard": test_metrics_dashboard,
+            "Gradio Interface": test_gradio_interface,
+        }
+    )
 
     # Summary
     print("\n" + "=" * 60)
@@ -184,5 +188,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    success = run(main())
     exit(0 if success else 1)
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """Test script for Phase 2 components."""
 
-import asyncio
 import logging
 
+from concurrent_runner import run, run_concurrently
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -290,13 +291,16 @@ async def main():
     print("PHASE 2 COMPONENT TESTING")
     print("=" * 60)
 
-    results = {
-        "LLM Client": await test_llm_client(),
-        "RAG Retriever": await test_rag_retriever(),
-        "MCP Tools": await test_mcp_tools(),
-        "Embeddings": await test_embeddings(),
-        "Response Parser": await test_response_parser(),
-    }
+    # The checks are independent, so run them concurrently (output is still printed per check)
+    results = await run_concurrently(
+        {
+            "LLM Client": test_llm_client,
+            "RAG Retriever": test_rag_retriever,
+            "MCP Tools": test_mcp_tools,
+            "Embeddings": test_embeddings,
+            "Response Parser": test_response_parser,
+        }
+    )
 
     # Summary
     print("\n" + "=" * 60)
@@ -318,5 +322,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    success = run(main())
     exit(0 if success else 1)
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Test script for Phase 3 components."""
 
-import asyncio
 import logging
+from dataclasses import dataclass
+from typing import Any
+
+from concurrent_runner import run, run_concurrently
 
 logging.basicConfig(
     level=logging.INFO,
@@ -11,6 +14,23 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Plain stand-ins for the chat completion response shape; much cheaper than nested mocks
+@dataclass(slots=True)
+class _Msg:
+    content: str
+    tool_calls: Any = None
+
+
+@dataclass(slots=True)
+class _Choice:
+    message: _Msg
+
+
+@dataclass(slots=True)
+class _Resp:
+    choices: list[_Choice]
+
+
 async def test_session_stores():
     """Test session storage implementations."""
     print("\n" + "=" * 60)
@@ -57,7 +77,7 @@ async def test_langgraph_manager():
     print("=" * 60)
 
     try:
-        from unittest.mock import AsyncMock, MagicMock
+        from types import SimpleNamespace
 
         from langchain_core.messages import HumanMessage
 
@@ -66,18 +86,32 @@ async def test_langgraph_manager():
         print("\n✓ Creating mock components...")
 
         # Mock LLM client
-        mock_llm = MagicMock()
-        mock_llm.call_llm = AsyncMock(
-            return_value=MagicMock(choices=[MagicMock(message=MagicMock(content="Test response", tool_calls=None))])
+        async def call_llm(*args, **kwargs):
+            return _Resp([_Choice(_Msg("Test response"))])
+
+        async def extract_response_content(response):
+            return response.choices[0].message.content
+
+        async def extract_tool_calls(response):
+            return response.choices[0].message.tool_calls or []
+
+        mock_llm = SimpleNamespace(
+            call_llm=call_llm,
+            extract_response_content=extract_response_content,
+            extract_tool_calls=extract_tool_calls,
         )
 
         # Mock RAG retriever
-        mock_rag = MagicMock()
-        mock_rag.retrieve = AsyncMock(return_value=[{"sku": "SKU-10000", "name": "Test Product", "price": 99.99}])
+        async def retrieve(*args, **kwargs):
+            return [{"sku": "SKU-10000", "name": "Test Product", "price": 99.99}]
+
+        mock_rag = SimpleNamespace(retrieve=retrieve)
 
         # Mock tool executor
-        mock_tools = MagicMock()
-        mock_tools.execute_tool = AsyncMock(return_value={"success": True})
+        async def execute_tool(*args, **kwargs):
+            return {"success": True}
+
+        mock_tools = SimpleNamespace(execute_tool=execute_tool)
 
         print("✓ Initializing Langgraph manager...")
         manager = LanggraphManager(mock_llm, mock_rag, mock_tools)
@@ -222,12 +256,15 @@ async def main():
     print("State Management & Orchestration")
     print("=" * 60)
 
-    results = {
-        "Session Stores": await test_session_stores(),
-        "Langgraph Manager": await test_langgraph_manager(),
-        "Chatbot Integration": await test_chatbot_integration(),
-        "Utility Functions": await test_utilities(),
-    }
+    # The checks are independent, so run them concurrently (output is still printed per check)
+    results = await run_concurrently(
+        {
+            "Session Stores": test_session_stores,
+            "Langgraph Manager": test_langgraph_manager,
+            "Chatbot Integration": test_chatbot_integration,
+            "Utility Functions": test_utilities,
+        }
+    )
 
     # Summary
     print("\n" + "=" * 60)
@@ -249,5 +286,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    success = run(main())
     exit(0 if success else 1)
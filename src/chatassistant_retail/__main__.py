@@ -10,8 +10,6 @@ logging.basicConfig(
 
 def main():
     """Launch the Gradio UI."""
-    from chatassistant_retail.ui import create_gradio_interface
-
     print("\n" + "=" * 60)
     print("🛒 Retail Inventory Assistant")
     print("=" * 60)
@@ -20,12 +18,16 @@ def main():
     print("\nPress Ctrl+C to stop the server")
     print("=" * 60 + "\n")
 
+    # Imported after the banner so it shows immediately; gradio takes seconds to import
+    from chatassistant_retail.ui import app_lifespan, create_gradio_interface
+
     demo = create_gradio_interface()
     demo.launch(
         server_name="127.0.0.1",
         server_port=7860,
         share=False,
         show_error=True,
+        app_kwargs={"lifespan": app_lifespan},
     )
 
 
@@ -1,20 +1,49 @@
 """Main chatbot class for retail inventory assistant."""
 
+import asyncio
 import logging
+import sys
+import threading
 import uuid
+import weakref
+from collections import OrderedDict, defaultdict
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+from pydantic import TypeAdapter
 
-from chatassistant_retail.config.settings import Settings
+from chatassistant_retail.config import get_settings
+from chatassistant_retail.http_client import close_shared_http_client, get_shared_http_client
 from chatassistant_retail.llm import AzureOpenAIClient
 from chatassistant_retail.rag import Retriever
 from chatassistant_retail.state import ConversationState, LanggraphManager, MemorySessionStore
+from chatassistant_retail.state.persistent_store import close_redis_pools
 from chatassistant_retail.tools.mcp_server import ToolExecutor
 
+if TYPE_CHECKING:
+    from chatassistant_retail.config.settings import Settings
+
 logger = logging.getLogger(__name__)
 
+# Serializes one message exactly as ConversationState.model_dump does for its messages field
+_MESSAGE_ADAPTER = TypeAdapter(BaseMessage)
+
+# Chat role for each message type. Keyed by BaseMessage.type rather than class, since
+# messages restored from a session store come back as plain BaseMessage instances.
+_ROLE_BY_MESSAGE_TYPE = {"human": "user", "ai": "assistant", "system": "system", "tool": "tool"}
+
+# Tags states saved by this module so they can be rebuilt without re-validation.
+# Bump when ConversationState or the saved message layout changes.
+_STATE_SCHEMA_VERSION = 1
+
+_MESSAGE_CLASSES: dict[str, type[BaseMessage]] = {
+    "human": HumanMessage,
+    "ai": AIMessage,
+    "system": SystemMessage,
+    "tool": ToolMessage,
+}
+
 
 class RetailChatBot:
     """
@@ -31,8 +60,13 @@ class RetailChatBot:
 
     def __init__(
         self,
-        settings: Settings | None = None,
+        settings: "Settings | None" = None,
         session_store=None,
+        *,
+        llm_client: AzureOpenAIClient | None = None,
+        rag_retriever: Retriever | None = None,
+        tool_executor: ToolExecutor | None = None,
+        langfuse_client=None,
     ):
         """
         Initialize retail chatbot.
@@ -40,19 +74,25 @@ class RetailChatBot:
         Args:
             settings: Configuration settings (uses default if not provided)
             session_store: Session storage implementation (uses MemorySessionStore if not provided)
+            llm_client: Pre-built LLM client (constructed if not provided)
+            rag_retriever: Pre-built RAG retriever (constructed if not provided)
+            tool_executor: Pre-built MCP tool executor (constructed if not provided)
+            langfuse_client: Pre-built LangFuse client (constructed if not provided and enabled)
         """
-        self.settings = settings or Settings()
+        self.settings = settings or get_settings()
+        # Messages kept per conversation (*2 for user+assistant pairs)
+        self._history_cap = self.settings.max_conversation_history * 2
 
         # Initialize LLM client
-        self.llm_client = AzureOpenAIClient(settings=self.settings)
+        self.llm_client = llm_client or AzureOpenAIClient(settings=self.settings, http_client=get_shared_http_client())
         logger.info("Initialized Azure OpenAI client")
 
         # Initialize RAG retriever
-        self.rag_retriever = Retriever(settings=self.settings)
+        self.rag_retriever = rag_retriever or Retriever(settings=self.settings, http_client=get_shared_http_client())
         logger.info("Initialized RAG retriever")
 
         # Initialize MCP tool executor
-        self.tool_executor = ToolExecutor()
+        self.tool_executor = tool_executor or ToolExecutor()
         logger.info("Initialized MCP tool executor")
 
         # Initialize session store
@@ -68,15 +108,191 @@ class RetailChatBot:
         logger.info("Initialized Langgraph state manager")
 
         # Initialize LangFuse observability
-        self.langfuse_client = None
-        if self.settings.langfuse_enabled:
-            try:
-                from chatassistant_retail.observability import get_langfuse_client
+        self.langfuse_client = langfuse_client or self._init_langfuse(self.settings)
+
+        # Session saves run in the background; keep references so they aren't garbage
+        # collected, and serialize writes per session so turns persist in order
+        self._pending_saves: set[asyncio.Task] = set()
+        self._latest_saves: dict[str, asyncio.Task] = {}
+        self._session_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # Recently used conversation states (with their serialized messages), so hot
+        # sessions skip the store read, pydantic re-validation, and re-serializing
+        # unchanged messages. Assumes a session's turns are served by this process.
+        self._state_cache: OrderedDict[str, tuple[ConversationState, list[dict[str, Any]]]] = OrderedDict()
+
+    @staticmethod
+    def _init_langfuse(settings: "Settings"):
+        """Create the LangFuse client if enabled; returns None if disabled or unavailable."""
+        if not settings.langfuse_enabled:
+            return None
+        try:
+            from chatassistant_retail.observability import get_langfuse_client
 
-                self.langfuse_client = get_langfuse_client()
-                logger.info("Initialized LangFuse observability")
-            except Exception as e:
-                logger.warning(f"Failed to initialize LangFuse: {e}")
+            langfuse_client = get_langfuse_client()
+            logger.info("Initialized LangFuse observability")
+            return langfuse_client
+        except Exception as e:
+            logger.warning(f"Failed to initialize LangFuse: {e}")
+            return None
+
+    @classmethod
+    async def create(cls, settings: "Settings | None" = None, session_store=None) -> "RetailChatBot":
+        """
+        Create a chatbot, constructing its independent clients concurrently.
+
+        The LLM client, retriever (Azure Search index check), tool executor, and
+        LangFuse client are built in worker threads at the same time, so startup
+        takes about as long as the slowest of them rather than their sum.
+
+        Args:
+            settings: Configuration settings (uses default if not provided)
+            session_store: Session storage implementation (uses MemorySessionStore if not provided)
+
+        Returns:
+            Initialized RetailChatBot
+        """
+        settings = settings or get_settings()
+        http_client = get_shared_http_client()
+        llm_client, rag_retriever, tool_executor, langfuse_client = await asyncio.gather(
+            asyncio.to_thread(AzureOpenAIClient, settings=settings, http_client=http_client),
+            asyncio.to_thread(Retriever, settings=settings, http_client=http_client),
+            asyncio.to_thread(ToolExecutor),
+            asyncio.to_thread(cls._init_langfuse, settings),
+        )
+        return cls(
+            settings,
+            session_store,
+            llm_client=llm_client,
+            rag_retriever=rag_retriever,
+            tool_executor=tool_executor,
+            langfuse_client=langfuse_client,
+        )
+
+    @staticmethod
+    def _state_from_dict(session_id: str, state_dict: dict[str, Any] | None) -> ConversationState:
+        """
+        Rebuild a loaded session state, or start a new one if none was stored.
+
+        States tagged with the current schema version were written by _dump_state, so
+        they are trusted and rebuilt with model_construct (no validation); anything
+        else goes through full pydantic validation.
+        """
+        if state_dict:
+            if state_dict.get("_schema") == _STATE_SCHEMA_VERSION:
+                fields = {key: value for key, value in state_dict.items() if key != "_schema"}
+                fields["messages"] = [
+                    _MESSAGE_CLASSES.get(msg["type"], BaseMessage).model_construct(**msg)
+                    for msg in fields.get("messages", [])
+                ]
+                if "current_intent" in fields:
+                    # model_construct skips the interning validator, so intern here
+                    fields["current_intent"] = sys.intern(fields["current_intent"])
+                state = ConversationState.model_construct(**fields)
+            else:
+                state = ConversationState(**state_dict)
+            logger.debug(f"Loaded existing state with {len(state.messages)} messages")
+        else:
+            state = ConversationState(session_id=session_id)
+            logger.debug("Created new conversation state")
+        return state
+
+    def _schedule_save(self, session_id: str, state_dict: dict[str, Any]) -> None:
+        """Persist session state in a background task."""
+        task = asyncio.create_task(self._safe_save(session_id, state_dict))
+        self._pending_saves.add(task)
+        task.add_done_callback(self._pending_saves.discard)
+        self._latest_saves[session_id] = task
+
+    async def _safe_save(self, session_id: str, state_dict: dict[str, Any]) -> None:
+        """Save session state, logging instead of raising on failure."""
+        try:
+            async with self._session_locks[session_id]:
+                await self.session_store.save_state(session_id, state_dict)
+        except Exception as e:
+            logger.error(f"Failed to save state for session {session_id}: {e}", exc_info=True)
+        finally:
+            # No later save was scheduled for this session, so its bookkeeping can go
+            if self._latest_saves.get(session_id) is asyncio.current_task():
+                del self._latest_saves[session_id]
+                self._session_locks.pop(session_id, None)
+
+    async def _wait_for_saves(self, session_id: str) -> None:
+        """Wait until background saves for a session have been written."""
+        task = self._latest_saves.get(session_id)
+        if task is not None:
+            # Saves run in scheduling order, so the latest finishing implies all have
+            await asyncio.wait([task])
+
+    async def _load_state(self, session_id: str) -> dict[str, Any] | None:
+        """Load session state once any pending save for the session has landed."""
+        await self._wait_for_saves(session_id)
+        return await self.session_store.load_state(session_id)
+
+    async def _get_state(self, session_id: str) -> ConversationState:
+        """
+        Get a session's conversation state, from the in-memory cache when possible.
+
+        Cached states are returned as copies (with their own message, context and
+        tool call containers) so a turn that fails midway can't corrupt the cache.
+        """
+        cached, _ = self._state_cache.get(session_id, (None, None))
+        if cached is not None:
+            self._state_cache.move_to_end(session_id)
+            logger.debug(f"Using cached state with {len(cached.messages)} messages")
+            return cached.model_copy(
+                update={
+                    "messages": list(cached.messages),
+                    "context": dict(cached.context),
+                    "tool_calls": list(cached.tool_calls),
+                }
+            )
+        return self._state_from_dict(session_id, await self._load_state(session_id))
+
+    def _cache_state(self, session_id: str, state: ConversationState, message_dumps: list[dict[str, Any]]) -> None:
+        """Remember a session's latest state, evicting the least recently used."""
+        max_cached = self.settings.max_cached_sessions
+        if max_cached <= 0:
+            return
+        self._state_cache[session_id] = (state, message_dumps)
+        self._state_cache.move_to_end(session_id)
+        while len(self._state_cache) > max_cached:
+            self._state_cache.popitem(last=False)
+
+    def _dump_state(self, session_id: str, state: ConversationState) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """
+        Serialize state for the session store, reusing dumps of messages already saved.
+
+        A turn only appends (and possibly trims) messages, so messages carried over
+        from the cached state keep their previous JSON dicts and only new ones are
+        serialized.
+
+        Args:
+            session_id: Session identifier
+            state: Conversation state to serialize
+
+        Returns:
+            Tuple of (state.model_dump(mode="json") plus a "_schema" version tag, message dicts)
+        """
+        previous: dict[int, dict[str, Any]] = {}
+        cached_state, cached_dumps = self._state_cache.get(session_id, (None, None))
+        if cached_state is not None:
+            previous = {id(msg): dump for msg, dump in zip(cached_state.messages, cached_dumps, strict=True)}
+
+        message_dumps = [
+            previous.get(id(msg)) or _MESSAGE_ADAPTER.dump_python(msg, mode="json") for msg in state.messages
+        ]
+        state_dict = {
+            "messages": message_dumps,
+            **state.model_dump(mode="json", exclude={"messages"}),
+            "_schema": _STATE_SCHEMA_VERSION,
+        }
+        return state_dict, message_dumps
+
+    async def aclose(self) -> None:
+        """Wait for pending background session saves to finish."""
+        if self._pending_saves:
+            await asyncio.gather(*self._pending_saves)
 
     async def process_message(
         self,
@@ -105,34 +321,27 @@ class RetailChatBot:
         """
         # Generate session ID if not provided
         if not session_id:
-            session_id = str(uuid.uuid4())
+            session_id = uuid.uuid4().hex
 
         logger.info(f"Processing message for session: {session_id}")
 
         try:
-            # Load existing state or create new
-            state_dict = await self.session_store.load_state(session_id)
-            if state_dict:
-                state = ConversationState(**state_dict)
-                logger.debug(f"Loaded existing state with {len(state.messages)} messages")
-            else:
-                state = ConversationState(session_id=session_id)
-                logger.debug("Created new conversation state")
-
-            # Handle multi-modal input
             if image:
                 # Use image product processor for inventory-focused analysis
-                from langchain_core.messages import AIMessage
-
                 from chatassistant_retail.workflow.image_processor import ImageProductProcessor
 
+                # The image query does not read conversation history, so load the
+                # session concurrently with it instead of before it
                 processor = ImageProductProcessor()
-                response_data = await processor.process_image_query(
-                    image_path=image,
-                    user_text=text,
-                    llm_client=self.llm_client,
-                    rag_retriever=self.rag_retriever,
-                    tool_executor=self.tool_executor,
+                state, response_data = await asyncio.gather(
+                    self._get_state(session_id),
+                    processor.process_image_query(
+                        image_path=image,
+                        user_text=text,
+                        llm_client=self.llm_client,
+                        rag_retriever=self.rag_retriever,
+                        tool_executor=self.tool_executor,
+                    ),
                 )
 
                 # Update state with structured response
@@ -146,21 +355,26 @@ class RetailChatBot:
                     state.error = response_data["error"]
 
             else:
+                # Text queries are answered from the loaded history, so load it first
+                state = await self._get_state(session_id)
+
                 # Add user message to state
                 state.messages.append(HumanMessage(content=text))
 
                 # Trim conversation history if too long
-                max_history = self.settings.max_conversation_history
-                if len(state.messages) > max_history * 2:  # *2 for user+assistant pairs
-                    state.messages = state.messages[-(max_history * 2) :]
+                if len(state.messages) > self._history_cap:
+                    # Delete in place rather than slicing out a new list; the list is
+                    # never the cached state's own (see _get_state)
+                    del state.messages[: -self._history_cap]
                     logger.debug(f"Trimmed conversation history to {len(state.messages)} messages")
 
                 # Process through Langgraph state machine
                 state = await self.state_manager.process(state)
 
-            # Save state
-            state_dict = state.model_dump(mode="json")
-            await self.session_store.save_state(session_id, state_dict)
+            # Cache the new state and save it in the background so the write doesn't delay the response
+            state_dict, message_dumps = self._dump_state(session_id, state)
+            self._cache_state(session_id, state, message_dumps)
+            self._schedule_save(session_id, state_dict)
 
             # Extract response
             response_text = ""
@@ -203,6 +417,9 @@ class RetailChatBot:
             True if successful, False otherwise
         """
         logger.info(f"Clearing session: {session_id}")
+        # Let pending saves land first so they can't recreate the deleted state
+        self._state_cache.pop(session_id, None)
+        await self._wait_for_saves(session_id)
         return await self.session_store.delete_state(session_id)
 
     async def get_session_history(self, session_id: str) -> list[dict[str, str]]:
@@ -215,18 +432,11 @@ class RetailChatBot:
         Returns:
             List of messages with role and content
         """
-        state_dict = await self.session_store.load_state(session_id)
-        if not state_dict:
-            return []
-
-        state = ConversationState(**state_dict)
-        history = []
-        for msg in state.messages:
-            role = "user" if isinstance(msg, HumanMessage) else "assistant"
-            content = msg.content if hasattr(msg, "content") else ""
-            history.append({"role": role, "content": content})
-
-        return history
+        state = await self._get_state(session_id)
+        return [
+            {"role": _ROLE_BY_MESSAGE_TYPE.get(msg.type, "assistant"), "content": getattr(msg, "content", "")}
+            for msg in state.messages
+        ]
 
     def get_metrics(self) -> dict[str, Any]:
         """
@@ -255,6 +465,10 @@ class RetailChatBot:
 
 # Create singleton instance
 _chatbot_instance: RetailChatBot | None = None
+# Guards construction across threads (e.g. Gradio worker threads)
+_chatbot_lock = threading.Lock()
+# asyncio locks are bound to one event loop, so keep one per running loop
+_chatbot_async_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
 
 
 def get_chatbot() -> RetailChatBot:
@@ -266,5 +480,64 @@ def get_chatbot() -> RetailChatBot:
     """
     global _chatbot_instance
     if _chatbot_instance is None:
-        _chatbot_instance = RetailChatBot()
+        with _chatbot_lock:
+            if _chatbot_instance is None:
+                _chatbot_instance = RetailChatBot()
     return _chatbot_instance
+
+
+def _publish_chatbot(chatbot: RetailChatBot) -> RetailChatBot:
+    """Install chatbot as the singleton unless another thread got there first."""
+    global _chatbot_instance
+    with _chatbot_lock:
+        if _chatbot_instance is None:
+            _chatbot_instance = chatbot
+        return _chatbot_instance
+
+
+async def get_chatbot_async() -> RetailChatBot:
+    """
+    Get singleton chatbot instance, initializing its clients concurrently on first use.
+
+    Concurrent first callers on the same event loop wait on a lock instead of each
+    building a chatbot; the thread lock shared with get_chatbot() is only taken in a
+    worker thread so the event loop never blocks on it.
+
+    Returns:
+        RetailChatBot instance
+    """
+    if _chatbot_instance is None:
+        loop = asyncio.get_running_loop()
+        init_lock = _chatbot_async_locks.setdefault(loop, asyncio.Lock())
+        async with init_lock:
+            if _chatbot_instance is None:
+                chatbot = await RetailChatBot.create()
+                return await asyncio.to_thread(_publish_chatbot, chatbot)
+    return _chatbot_instance
+
+
+async def shutdown_chatbot() -> None:
+    """
+    Release the singleton chatbot and the shared HTTP and Redis connection pools.
+
+    Waits for the chatbot's pending session saves, then closes the pool shared by its
+    Azure OpenAI clients and the loop's shared Redis pools. Each step is best effort, so
+    a failure in one still lets the others run. Await it on the event loop that served the chatbot (see
+    ui.gradio_app.app_lifespan): the pending saves and pooled connections belong to it.
+    """
+    global _chatbot_instance
+    with _chatbot_lock:
+        chatbot, _chatbot_instance = _chatbot_instance, None
+    if chatbot is not None:
+        try:
+            await chatbot.aclose()
+        except Exception as e:
+            logger.warning(f"Error flushing chatbot session saves on shutdown: {e}")
+    try:
+        await close_shared_http_client()
+    except Exception as e:
+        logger.warning(f"Error closing shared HTTP client on shutdown: {e}")
+    try:
+        await close_redis_pools()
+    except Exception as e:
+        logger.warning(f"Error closing Redis connection pools on shutdown: {e}")
@@ -1,5 +1,42 @@
 """Configuration module for chatassistant_retail."""
 
-from .settings import Settings, get_settings
+from typing import TYPE_CHECKING
 
-__all__ = ["Settings", "get_settings"]
+if TYPE_CHECKING:
+    from .settings import Settings
+
+__all__ = ["Settings", "get_settings", "reset_settings_cache"]
+
+_settings: "Settings | None" = None
+
+
+def get_settings() -> "Settings":
+    """Get cached settings instance."""
+    global _settings
+    settings = _settings
+    if settings is None:
+        # pydantic-settings is only imported once settings are first needed
+        from .settings import Settings
+
+        settings = Settings()
+        settings.validate_required_credentials()
+        _settings = settings
+    return settings
+
+
+def reset_settings_cache() -> None:
+    """Drop the cached settings so the next get_settings() re-reads the environment."""
+    global _settings
+    _settings = None
+
+
+def __getattr__(name: str):
+    if name == "Settings":
+        from .settings import Settings
+
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
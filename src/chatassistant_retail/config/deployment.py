@@ -1,17 +1,20 @@
 """Deployment mode configuration and factory patterns."""
 
 import logging
+import sys
 from typing import TYPE_CHECKING
 
-from .settings import Settings, get_settings
+from . import get_settings
 
 if TYPE_CHECKING:
     from chatassistant_retail.state.session_store import SessionStore
 
+    from .settings import Settings
+
 logger = logging.getLogger(__name__)
 
 
-def get_session_store(settings: Settings | None = None) -> "SessionStore":
+def get_session_store(settings: "Settings | None" = None) -> "SessionStore":
     """
     Factory function to get the appropriate session store based on deployment mode.
 
@@ -69,7 +72,7 @@ def get_session_store(settings: Settings | None = None) -> "SessionStore":
         raise ValueError(f"Invalid deployment mode: {settings.deployment_mode}")
 
 
-def configure_logging(settings: Settings | None = None) -> None:
+def configure_logging(settings: "Settings | None" = None) -> None:
     """
     Configure logging based on deployment mode.
 
@@ -81,21 +84,25 @@ def configure_logging(settings: Settings | None = None) -> None:
 
     if settings.deployment_mode == "hf_spaces":
         # HuggingFace Spaces: Less verbose logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
+        level = logging.INFO
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     else:
         # Local development: More verbose logging
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
-        )
+        level = logging.DEBUG
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s")
+
+    # Like logging.basicConfig, leave an already configured root logger alone
+    root = logging.getLogger()
+    if not root.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+        root.setLevel(level)
 
     logger.info(f"Logging configured for deployment mode: {settings.deployment_mode}")
 
 
-def get_gradio_server_config(settings: Settings | None = None) -> dict:
+def get_gradio_server_config(settings: "Settings | None" = None) -> dict:
     """
     Get Gradio server configuration based on deployment mode.
 
@@ -1,10 +1,9 @@
 """Application settings using Pydantic Settings."""
 
 import logging
-from functools import lru_cache
 from typing import Literal
 
-from pydantic import Field, field_validator
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
@@ -101,6 +100,10 @@ class Settings(BaseSettings):
         default=10,
         description="Maximum number of messages to keep in conversation history",
     )
+    max_cached_sessions: int = Field(
+        default=256,
+        description="Number of recent conversation states kept in memory per process (0 disables the cache)",
+    )
     enable_streaming: bool = Field(
         default=True,
         description="Enable streaming responses from LLM",
@@ -113,6 +116,10 @@ class Settings(BaseSettings):
         default=3600,
         description="Cache TTL in seconds (1 hour default)",
     )
+    vision_cache_path: str | None = Field(
+        default=None,
+        description="SQLite file persisting image identifications across restarts and workers (None disables it)",
+    )
 
     # Sample data configuration
     sample_data_products_count: int = Field(
@@ -130,30 +137,16 @@ class Settings(BaseSettings):
         description="Maximum length for user input (security)",
     )
 
-    @field_validator("azure_openai_api_key")
-    @classmethod
-    def validate_azure_key(cls, v: str) -> str:
-        """Validate Azure OpenAI API key format."""
-        if v.startswith("sk-"):
-            logger.warning(
-                "Potential OpenAI key detected instead of Azure key. Azure keys typically don't start with 'sk-'"
-            )
-        return v
-
-    @field_validator("deployment_mode")
-    @classmethod
-    def validate_deployment_mode(cls, v: str) -> str:
-        """Validate deployment mode configuration."""
-        if v not in ["hf_spaces", "local"]:
-            raise ValueError(f"Invalid deployment mode: {v}. Must be 'hf_spaces' or 'local'")
-        return v
-
     def validate_required_credentials(self) -> None:
         """Validate that required credentials are present."""
         if not self.azure_openai_endpoint:
             raise ValueError("AZURE_OPENAI_ENDPOINT must be set")
         if not self.azure_openai_api_key:
             raise ValueError("AZURE_OPENAI_API_KEY must be set")
+        if self.azure_openai_api_key.startswith("sk-"):
+            logger.warning(
+                "Potential OpenAI key detected instead of Azure key. Azure keys typically don't start with 'sk-'"
+            )
 
         if self.langfuse_enabled:
             if not self.langfuse_public_key or not self.langfuse_secret_key:
@@ -165,11 +158,3 @@ class Settings(BaseSettings):
                 logger.warning(
                     "Local deployment mode requires Redis or PostgreSQL URL. Falling back to in-memory session storage."
                 )
-
-
-@lru_cache
-def get_settings() -> Settings:
-    """Get cached settings instance."""
-    settings = Settings()
-    settings.validate_required_credentials()
-    return settings
@@ -1,6 +1,18 @@
 """Data models and sample data generation."""
 
-from .models import Product, PurchaseOrder, Sale
-from .sample_generator import SampleDataGenerator
+from .models import Product, PurchaseOrder, Sale, SaleRow, SalesColumns
 
-__all__ = ["Product", "Sale", "PurchaseOrder", "SampleDataGenerator"]
+__all__ = ["Product", "Sale", "SaleRow", "SalesColumns", "PurchaseOrder", "SampleDataGenerator"]
+
+
+def __getattr__(name: str):
+    # SampleDataGenerator pulls in faker and numpy; import it only when first used
+    if name == "SampleDataGenerator":
+        from .sample_generator import SampleDataGenerator
+
+        return SampleDataGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
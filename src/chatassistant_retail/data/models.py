@@ -1,10 +1,16 @@
 """Pydantic models for retail inventory data."""
 
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
+import numpy as np
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class Product(BaseModel):
     """Product catalog model."""
@@ -63,6 +69,100 @@ class Sale(BaseModel):
         }
     }
 
+    @classmethod
+    def from_row(cls, row: "SaleRow") -> "Sale":
+        """Validate a lightweight SaleRow into a Sale."""
+        return cls.model_validate(row, from_attributes=True)
+
+
+@dataclass(slots=True, frozen=True)
+class SaleRow:
+    """
+    Unvalidated sales transaction for bulk pipelines.
+
+    Has the same fields as Sale but is a slotted dataclass, so each row is a fraction
+    of a pydantic model's size and attribute reads are fixed-offset. Use Sale.from_row
+    where validation is needed.
+    """
+
+    sale_id: str
+    sku: str
+    quantity: int
+    sale_price: float
+    timestamp: datetime
+    channel: Literal["retail", "online", "wholesale"]
+
+
+@dataclass(slots=True)
+class SalesColumns:
+    """
+    Sales history stored column-wise as NumPy arrays (one entry per sale).
+
+    Aggregations by SKU, day, or channel can run as vectorized array operations
+    instead of Python loops over Sale objects, and the arrays take far less memory.
+    """
+
+    sale_id: np.ndarray  # str
+    sku: np.ndarray  # str
+    quantity: np.ndarray  # int32
+    sale_price: np.ndarray  # float64
+    timestamp: np.ndarray  # datetime64[us]
+    channel: np.ndarray  # str
+
+    def __len__(self) -> int:
+        return len(self.sale_id)
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """Return the sales as a DataFrame with one column per Sale field."""
+        import pandas as pd
+
+        return pd.DataFrame({field.name: getattr(self, field.name) for field in fields(self)})
+
+    def _column_lists(self) -> list[list]:
+        """Convert every column to a list of Python values, in Sale field order."""
+        return [getattr(self, field.name).tolist() for field in fields(self)]
+
+    def to_rows(self) -> list[SaleRow]:
+        """Return the sales as lightweight SaleRow records."""
+        return list(map(SaleRow, *self._column_lists()))
+
+    def iter_models(self, validate: bool = False, chunk_size: int = 1000) -> Iterator[Sale]:
+        """
+        Yield the sales as Sale models, converting chunk_size rows at a time.
+
+        Args:
+            validate: Run each sale through pydantic validation instead of model_construct
+            chunk_size: Rows converted from NumPy to Python values per step
+
+        Yields:
+            Sale instances in row order
+        """
+        make_sale = Sale if validate else Sale.model_construct
+        columns = [getattr(self, field.name) for field in fields(self)]
+        for start in range(0, len(self), chunk_size):
+            chunk = [column[start : start + chunk_size].tolist() for column in columns]
+            for sale_id, sku, quantity, sale_price, timestamp, channel in zip(*chunk, strict=True):
+                yield make_sale(
+                    sale_id=sale_id,
+                    sku=sku,
+                    quantity=quantity,
+                    sale_price=sale_price,
+                    timestamp=timestamp,
+                    channel=channel,
+                )
+
+    def to_models(self, validate: bool = False) -> list[Sale]:
+        """
+        Return the sales as Sale models.
+
+        Args:
+            validate: Run each sale through pydantic validation instead of model_construct
+
+        Returns:
+            List of Sale instances
+        """
+        return list(self.iter_models(validate))
+
 
 class PurchaseOrder(BaseModel):
     """Purchase order model."""
@@ -2,11 +2,12 @@
 
 import random
 import uuid
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 
-from faker import Faker
+import numpy as np
 
-from .models import Product, Sale
+from .models import Product, Sale, SaleRow, SalesColumns
 
 
 class SampleDataGenerator:
@@ -24,7 +25,7 @@ class SampleDataGenerator:
     ]
 
     PRODUCT_TEMPLATES = {
-        "Electronics": [
+        "Electronics": (
             "Wireless Mouse",
             "Keyboard",
             "Monitor",
@@ -35,8 +36,8 @@ class SampleDataGenerator:
             "USB Cable",
             "Power Bank",
             "Webcam",
-        ],
-        "Clothing": [
+        ),
+        "Clothing": (
             "T-Shirt",
             "Jeans",
             "Jacket",
@@ -47,8 +48,8 @@ class SampleDataGenerator:
             "Shorts",
             "Socks",
             "Cap",
-        ],
-        "Groceries": [
+        ),
+        "Groceries": (
             "Organic Apples",
             "Whole Wheat Bread",
             "Fresh Milk",
@@ -59,8 +60,8 @@ class SampleDataGenerator:
             "Olive Oil",
             "Cereal",
             "Eggs",
-        ],
-        "Home & Garden": [
+        ),
+        "Home & Garden": (
             "LED Light Bulb",
             "Plant Pot",
             "Garden Hose",
@@ -71,8 +72,8 @@ class SampleDataGenerator:
             "Door Mat",
             "Picture Frame",
             "Curtains",
-        ],
-        "Sports & Outdoors": [
+        ),
+        "Sports & Outdoors": (
             "Yoga Mat",
             "Dumbbell Set",
             "Tennis Racket",
@@ -83,8 +84,8 @@ class SampleDataGenerator:
             "Bicycle",
             "Running Shoes",
             "Fitness Tracker",
-        ],
-        "Books & Media": [
+        ),
+        "Books & Media": (
             "Fiction Novel",
             "Cookbook",
             "Blu-ray Movie",
@@ -95,8 +96,8 @@ class SampleDataGenerator:
             "Magazine",
             "Journal",
             "Coloring Book",
-        ],
-        "Toys & Games": [
+        ),
+        "Toys & Games": (
             "Action Figure",
             "Building Blocks",
             "Doll",
@@ -107,8 +108,8 @@ class SampleDataGenerator:
             "Play-Doh Set",
             "Toy Train",
             "Card Game",
-        ],
-        "Health & Beauty": [
+        ),
+        "Health & Beauty": (
             "Shampoo",
             "Face Cream",
             "Toothpaste",
@@ -119,9 +120,33 @@ class SampleDataGenerator:
             "Body Lotion",
             "Deodorant",
             "Nail Polish",
-        ],
+        ),
     }
 
+    # Every (category, template) pair, so one random.choice picks both
+    _CATEGORY_TEMPLATE_PAIRS = tuple(
+        (category, template) for category, templates in PRODUCT_TEMPLATES.items() for template in templates
+    )
+
+    # Name variations for generated products
+    _VARIATIONS = ("Pro", "Plus", "Premium", "Deluxe", "Standard", "Basic")
+    _COLORS = ("Red", "Blue", "Green", "Black", "White", "Silver")
+
+    # (min, max) price per category
+    _PRICE_RANGES = {
+        "Electronics": (19.99, 999.99),
+        "Clothing": (9.99, 199.99),
+        "Groceries": (1.99, 49.99),
+        "Home & Garden": (4.99, 299.99),
+        "Sports & Outdoors": (14.99, 599.99),
+        "Books & Media": (5.99, 79.99),
+        "Toys & Games": (7.99, 149.99),
+        "Health & Beauty": (3.99, 99.99),
+    }
+
+    # Distinct suppliers/descriptions generated per generate_products call
+    _FAKER_POOL_SIZE = 64
+
     def __init__(self, seed: int = 42):
         """
         Initialize the sample data generator.
@@ -129,34 +154,60 @@ class SampleDataGenerator:
         Args:
             seed: Random seed for reproducibility
         """
+        # faker loads dozens of provider modules; import it only when a generator is built
+        from faker import Faker
+
         self.fake = Faker()
         Faker.seed(seed)
         random.seed(seed)
+        # Bulk draws for sales history; seeded separately so runs stay reproducible
+        self.rng = np.random.default_rng(seed)
 
-    def generate_products(self, count: int = 500) -> list[Product]:
+    def generate_products(self, count: int = 500, validate: bool = False) -> list[Product]:
         """
         Generate sample products across categories.
 
         Args:
             count: Number of products to generate
+            validate: Run each product through pydantic validation (by default rows
+                are built with model_construct, since they are valid by construction)
 
         Returns:
             List of Product instances
         """
-        products = []
+        return list(self.iter_products(count, validate))
+
+    def iter_products(self, count: int = 500, validate: bool = False) -> Iterator[Product]:
+        """
+        Generate sample products one at a time.
+
+        Same products as generate_products, for callers that stream them (e.g. to an
+        index or database) without holding the whole list.
+
+        Args:
+            count: Number of products to generate
+            validate: Run each product through pydantic validation
+
+        Yields:
+            Product instances
+        """
+        # Positive prices, non-negative stock and reorder levels by construction
+        make_product = Product if validate else Product.model_construct
+
+        # Faker is the slowest part of product generation, so draw suppliers and
+        # descriptions from small pre-generated pools instead of once per product
+        pool_size = min(count, self._FAKER_POOL_SIZE)
+        supplier_pool = [self.fake.company() for _ in range(pool_size)]
+        description_pool = [self.fake.text(max_nb_chars=200) for _ in range(pool_size)]
 
         for i in range(count):
-            category = random.choice(self.CATEGORIES)
-            product_template = random.choice(self.PRODUCT_TEMPLATES[category])
+            category, product_template = random.choice(self._CATEGORY_TEMPLATE_PAIRS)
 
             # Add variation to product names
-            variations = ["Pro", "Plus", "Premium", "Deluxe", "Standard", "Basic"]
-            colors = ["Red", "Blue", "Green", "Black", "White", "Silver"]
-
             if random.random() > 0.5:
-                name = f"{random.choice(variations)} {product_template}"
+                name = f"{random.choice(self._VARIATIONS)} {product_template}"
             else:
-                name = f"{product_template} ({random.choice(colors)})"
+                name = f"{product_template} ({random.choice(self._COLORS)})"
 
             # Generate stock levels with realistic distribution
             stock_distribution = random.random()
@@ -171,146 +222,212 @@ class SampleDataGenerator:
 
             reorder_level = random.randint(10, 50)
 
-            product = Product(
+            yield make_product(
                 sku=f"SKU-{10000 + i:05d}",
                 name=name,
                 category=category,
                 price=round(self._generate_category_price(category), 2),
                 current_stock=current_stock,
                 reorder_level=reorder_level,
-                supplier=self.fake.company(),
-                description=self.fake.text(max_nb_chars=200),
+                supplier=random.choice(supplier_pool),
+                description=random.choice(description_pool),
                 image_url=f"https://placeholder.co/400x400?text={product_template.replace(' ', '+')}",
             )
-            products.append(product)
-
-        return products
 
     def _generate_category_price(self, category: str) -> float:
         """Generate realistic price based on category."""
-        price_ranges = {
-            "Electronics": (19.99, 999.99),
-            "Clothing": (9.99, 199.99),
-            "Groceries": (1.99, 49.99),
-            "Home & Garden": (4.99, 299.99),
-            "Sports & Outdoors": (14.99, 599.99),
-            "Books & Media": (5.99, 79.99),
-            "Toys & Games": (7.99, 149.99),
-            "Health & Beauty": (3.99, 99.99),
-        }
-
-        min_price, max_price = price_ranges.get(category, (5.99, 99.99))
+        min_price, max_price = self._PRICE_RANGES.get(category, (5.99, 99.99))
         return random.uniform(min_price, max_price)
 
-    def generate_sales_history(self, products: list[Product], months: int = 6) -> list[Sale]:
+    # Upper bounds of the quantity buckets: 70% single item, 20% two items,
+    # 7% small bulk (3-5), 3% large bulk (6-20)
+    _QUANTITY_THRESHOLDS = np.array([0.7, 0.9, 0.97])
+
+    # Upper bounds of the channel buckets: 50% retail, 35% online, 15% wholesale
+    _CHANNEL_THRESHOLDS = np.array([0.5, 0.85])
+    _CHANNELS = np.array(["retail", "online", "wholesale"])
+
+    # (low, high) seasonal sales multiplier per month, January first: higher in Q4
+    # (holiday season) and Jul-Aug (summer sales), lower in Jan-Feb (post-holiday slump)
+    _SEASONAL_RANGES = np.array(
+        [
+            (0.7, 0.9),
+            (0.7, 0.9),
+            (0.95, 1.05),
+            (0.95, 1.05),
+            (0.95, 1.05),
+            (0.95, 1.05),
+            (1.1, 1.3),
+            (1.1, 1.3),
+            (0.95, 1.05),
+            (0.95, 1.05),
+            (1.3, 1.6),
+            (1.3, 1.6),
+        ]
+    )
+
+    def generate_sales_history(
+        self, products: list[Product], months: int = 6, use_uuid: bool = False, validate: bool = False
+    ) -> list[Sale]:
         """
         Generate sales history with seasonal patterns.
 
         Args:
             products: List of products to generate sales for
             months: Number of months of history to generate
+            use_uuid: Give each sale a random UUID instead of a sequential
+                "SALE-00000001"-style ID (sequential IDs are unique within one run)
+            validate: Run each sale through pydantic validation (by default rows are
+                built with model_construct, since they are valid by construction)
 
         Returns:
             List of Sale instances
         """
-        sales = []
-        start_date = datetime.now() - timedelta(days=30 * months)
+        return list(self.iter_sales_history(products, months, use_uuid, validate))
 
-        for day_offset in range(30 * months):
-            current_date = start_date + timedelta(days=day_offset)
-
-            # Get seasonal multiplier
-            seasonal_multiplier = self._get_seasonal_multiplier(current_date)
-
-            # Base daily sales count varies by day of week
-            if current_date.weekday() < 5:  # Weekday
-                base_sales_count = random.randint(50, 100)
-            else:  # Weekend
-                base_sales_count = random.randint(80, 150)
-
-            daily_sales_count = int(base_sales_count * seasonal_multiplier)
-
-            for _ in range(daily_sales_count):
-                # Select product with weighted probability (popular items sell more)
-                product = self._select_product_weighted(products)
-
-                # Generate sale time during business hours (9am - 9pm)
-                hour = random.randint(9, 20)
-                minute = random.randint(0, 59)
-                second = random.randint(0, 59)
-                timestamp = current_date.replace(hour=hour, minute=minute, second=second)
-
-                # Price variation: -10% to +10%
-                price_variation = random.uniform(0.9, 1.1)
-                sale_price = round(product.price * price_variation, 2)
-
-                # Quantity: most sales are 1-2 items, occasionally bulk
-                quantity_rand = random.random()
-                if quantity_rand < 0.7:  # 70% single item
-                    quantity = 1
-                elif quantity_rand < 0.9:  # 20% two items
-                    quantity = 2
-                elif quantity_rand < 0.97:  # 7% small bulk (3-5)
-                    quantity = random.randint(3, 5)
-                else:  # 3% large bulk (6-20)
-                    quantity = random.randint(6, 20)
-
-                # Channel distribution
-                channel_rand = random.random()
-                if channel_rand < 0.5:  # 50% retail
-                    channel = "retail"
-                elif channel_rand < 0.85:  # 35% online
-                    channel = "online"
-                else:  # 15% wholesale
-                    channel = "wholesale"
-
-                sale = Sale(
-                    sale_id=str(uuid.uuid4()),
-                    sku=product.sku,
-                    quantity=quantity,
-                    sale_price=sale_price,
-                    timestamp=timestamp,
-                    channel=channel,
-                )
-                sales.append(sale)
-
-        return sales
+    def iter_sales_history(
+        self, products: list[Product], months: int = 6, use_uuid: bool = False, validate: bool = False
+    ) -> Iterator[Sale]:
+        """
+        Generate sales history one sale at a time.
 
-    def _get_seasonal_multiplier(self, date: datetime) -> float:
+        The sales are drawn as compact NumPy columns up front and converted to Sale
+        models as they are consumed, so streaming callers never hold every model.
+
+        Args:
+            products: List of products to generate sales for
+            months: Number of months of history to generate
+            use_uuid: Give each sale a random UUID instead of a sequential ID
+            validate: Run each sale through pydantic validation
+
+        Yields:
+            Sale instances, grouped by day
         """
-        Get seasonal sales multiplier.
+        # Values are valid by construction (known SKUs, positive prices and quantities,
+        # allowed channels), so skip per-row validation unless asked for
+        yield from self.generate_sales_history_columnar(products, months, use_uuid).iter_models(validate=validate)
 
-        Higher sales in Q4 (holiday season), lower in Q1.
+    def generate_sales_history_fast(
+        self, products: list[Product], months: int = 6, use_uuid: bool = False
+    ) -> list[SaleRow]:
         """
-        month = date.month
-
-        if month in [11, 12]:  # Nov-Dec: Holiday season
-            return random.uniform(1.3, 1.6)
-        elif month in [1, 2]:  # Jan-Feb: Post-holiday slump
-            return random.uniform(0.7, 0.9)
-        elif month in [7, 8]:  # Jul-Aug: Summer sales
-            return random.uniform(1.1, 1.3)
-        else:  # Other months: Normal
-            return random.uniform(0.95, 1.05)
-
-    def _select_product_weighted(self, products: list[Product]) -> Product:
+        Generate sales history as lightweight SaleRow records.
+
+        Same data as generate_sales_history, but as slotted dataclasses instead of
+        pydantic models, for bulk pipelines that don't need validation.
+
+        Args:
+            products: List of products to generate sales for
+            months: Number of months of history to generate
+            use_uuid: Give each sale a random UUID instead of a sequential ID
+
+        Returns:
+            List of SaleRow instances
+        """
+        return self.generate_sales_history_columnar(products, months, use_uuid).to_rows()
+
+    def generate_sales_history_columnar(
+        self, products: list[Product], months: int = 6, use_uuid: bool = False
+    ) -> SalesColumns:
+        """
+        Generate sales history as NumPy columns.
+
+        Daily sale counts are drawn per day; everything per sale (product, time,
+        price, quantity, channel) is drawn for all sales at once with NumPy. The
+        other generate_sales_history* methods convert this result.
+
+        Args:
+            products: List of products to generate sales for
+            months: Number of months of history to generate
+            use_uuid: Give each sale a random UUID instead of a sequential ID
+
+        Returns:
+            SalesColumns with one entry per sale
+        """
+        start_date = datetime.now() - timedelta(days=30 * months)
+        daily_counts = self._daily_sales_counts(start_date, 30 * months)
+        total = int(daily_counts.sum()) if products else 0
+
+        rng = self.rng
+
+        # Select products with weighted probability (popular items sell more)
+        weights = self._product_weights(products) if products else np.ones(0)
+        product_idx = rng.choice(len(products), size=total, p=weights / weights.sum()) if total else np.zeros(0, int)
+
+        # Sale time during business hours (9am - 9pm) on each sale's day
+        day_offsets = np.repeat(np.arange(daily_counts.size), daily_counts) if total else np.zeros(0, int)
+        seconds = day_offsets * 86400 + rng.integers(9 * 3600, 21 * 3600, size=total)
+        day_start = start_date.replace(hour=0, minute=0, second=0)
+        timestamps = np.datetime64(day_start, "us") + seconds.astype("timedelta64[s]")
+
+        # Price variation: -10% to +10%
+        prices = np.array([p.price for p in products], dtype=np.float64)
+        sale_prices = np.round(prices[product_idx] * rng.uniform(0.9, 1.1, size=total), 2)
+
+        # Quantity: most sales are 1-2 items, occasionally bulk
+        quantity_bucket = np.searchsorted(self._QUANTITY_THRESHOLDS, rng.random(total), side="right")
+        quantities = np.choose(
+            quantity_bucket,
+            [
+                np.ones(total, dtype=np.int32),
+                np.full(total, 2, dtype=np.int32),
+                rng.integers(3, 6, size=total, dtype=np.int32),
+                rng.integers(6, 21, size=total, dtype=np.int32),
+            ],
+        )
+
+        # Channel distribution
+        channels = self._CHANNELS[np.searchsorted(self._CHANNEL_THRESHOLDS, rng.random(total), side="right")]
+
+        skus = np.array([p.sku for p in products], dtype=str)[product_idx]
+        if use_uuid:
+            sale_ids = np.array([str(uuid.uuid4()) for _ in range(total)], dtype=str)
+        else:
+            sale_ids = np.array([f"SALE-{i:08d}" for i in range(1, total + 1)], dtype=str)
+
+        return SalesColumns(
+            sale_id=sale_ids,
+            sku=skus,
+            quantity=quantities,
+            sale_price=sale_prices,
+            timestamp=timestamps,
+            channel=channels,
+        )
+
+    def _daily_sales_counts(self, start_date: datetime, days: int) -> np.ndarray:
+        """Draw the number of sales on each of `days` days from weekday and season."""
+        dates = np.datetime64(start_date.date(), "D") + np.arange(days)
+        # 1970-01-01 was a Thursday, so shift by 3 to get Monday == 0
+        weekend = (dates.astype(np.int64) + 3) % 7 >= 5
+        month_index = dates.astype("datetime64[M]").astype(np.int64) % 12
+
+        # Base daily sales count varies by day of week
+        base_sales_count = self.rng.integers(np.where(weekend, 80, 50), np.where(weekend, 151, 101))
+
+        low, high = self._SEASONAL_RANGES[month_index].T
+        return (base_sales_count * self.rng.uniform(low, high)).astype(np.int64)
+
+    @staticmethod
+    def _product_weights(products: list[Product]) -> np.ndarray:
         """
-        Select a product with weighted probability.
+        Compute each product's relative chance of being sold.
 
         Products with higher stock levels and lower prices are more likely to be sold.
         """
-        # Create weights based on stock and price
-        weights = []
-        for product in products:
-            # Higher stock = higher chance of being sold
-            stock_weight = min(product.current_stock, 100) / 100.0
+        # Higher stock = higher chance of being sold
+        stock_weight = np.minimum([p.current_stock for p in products], 100) / 100.0
 
-            # Lower price = higher chance of being sold
-            price_weight = 1.0 / (1.0 + product.price / 100.0)
+        # Lower price = higher chance of being sold
+        price_weight = 1.0 / (1.0 + np.array([p.price for p in products]) / 100.0)
 
-            # Combined weight
-            weight = (stock_weight * 0.6 + price_weight * 0.4) + 0.1  # Ensure min weight
+        # Combined weight
+        return (stock_weight * 0.6 + price_weight * 0.4) + 0.1  # Ensure min weight
 
-            weights.append(weight)
+    def _get_seasonal_multiplier(self, date: datetime) -> float:
+        """
+        Get seasonal sales multiplier.
 
-        return random.choices(products, weights=weights, k=1)[0]
+        Higher sales in Q4 (holiday season), lower in Q1.
+        """
+        low, high = self._SEASONAL_RANGES[date.month - 1]
+        return random.uniform(low, high)
@@ -0,0 +1,49 @@
+"""Process-wide HTTP connection pool shared by the Azure OpenAI clients."""
+
+import importlib.util
+import logging
+import threading
+
+import httpx
+from openai import DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
+
+_shared_http_client: httpx.AsyncClient | None = None
+_shared_http_lock = threading.Lock()
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use.
+
+    Reusing one connection pool across the LLM and embeddings clients (and across
+    chatbot instances) keeps TCP/TLS connections warm instead of each client
+    opening its own. HTTP/2 is used when the optional h2 package is installed.
+    Pooled connections belong to the event loop that opened them, so use the
+    client from a single event loop.
+
+    Returns:
+        Shared httpx.AsyncClient with the OpenAI SDK's default settings
+    """
+    global _shared_http_client
+    if _shared_http_client is None:
+        with _shared_http_lock:
+            if _shared_http_client is None:
+                http2 = importlib.util.find_spec("h2") is not None
+                _shared_http_client = DefaultAsyncHttpxClient(
+                    http2=http2,
+                    # Keep idle connections for a minute (httpx default: 5s) so chat turns reuse them
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60),
+                )
+                logger.info(f"Initialized shared HTTP client (http2={http2})")
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """Close the shared HTTP client, if one was created."""
+    global _shared_http_client
+    with _shared_http_lock:
+        client, _shared_http_client = _shared_http_client, None
+    if client is not None:
+        await client.aclose()
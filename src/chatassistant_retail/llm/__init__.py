@@ -1,7 +1,21 @@
 """LLM integration module for Azure OpenAI."""
 
-from .azure_openai_client import AzureOpenAIClient
 from .prompt_templates import SYSTEM_PROMPTS, get_system_prompt
 from .response_parser import ResponseParser
 
 __all__ = ["AzureOpenAIClient", "SYSTEM_PROMPTS", "get_system_prompt", "ResponseParser"]
+
+
+def __getattr__(name: str):
+    # AzureOpenAIClient pulls in the openai SDK; import it only when first used
+    if name == "AzureOpenAIClient":
+        from .azure_openai_client import AzureOpenAIClient
+
+        # Cache on the module so later lookups skip __getattr__
+        globals()[name] = AzureOpenAIClient
+        return AzureOpenAIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
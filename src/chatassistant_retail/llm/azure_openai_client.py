@@ -1,34 +1,167 @@
 """Azure OpenAI client for multi-modal LLM interactions."""
 
-import base64
+import asyncio
+import copy
+import hashlib
+import io
 import logging
+import mmap
+import os
+import re
+import sqlite3
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+import httpx
+import orjson
 from openai import AsyncAzureOpenAI
 
 from chatassistant_retail.config import get_settings
+from chatassistant_retail.llm.vision_cache import VisionDiskCache
 from chatassistant_retail.observability import trace
 
+try:
+    # SIMD-accelerated drop-in for base64.b64encode (optional "perf" extra)
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
 logger = logging.getLogger(__name__)
 
+# Images larger than this are downscaled and re-encoded as JPEG before upload; vision
+# models resize server-side anyway, so full-resolution phone photos only cost bandwidth
+_MAX_UPLOAD_BYTES = 512 * 1024
+_MAX_IMAGE_SIDE = 2048
+
+# Leading magic bytes of the image formats the vision models accept
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+_DEFAULT_IMAGE_MIME = "image/jpeg"
+
+# JSON object inside a markdown code fence (```json ... ``` or ``` ... ```); fallback for _parse_json_object
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Kept byte-identical across calls so the provider's prompt cache can reuse it
+VISION_SYSTEM_PROMPT = """You are a retail product identification specialist. Analyze the image and extract product information.
+
+Return ONLY a JSON object with these fields:
+- product_name: The type and name of the product (e.g., "Wireless Mouse", "Running Shoes")
+- category: One of: Electronics, Clothing, Groceries, Home & Garden, Sports & Outdoors, Books & Media, Toys & Games, Health & Beauty
+- description: Detailed description of the product
+- color: Primary color(s) of the product
+- keywords: Array of search keywords (3-5 keywords)
+- confidence: Your confidence level (0.0 to 1.0)
+
+Example:
+{
+    "product_name": "Wireless Mouse",
+    "category": "Electronics",
+    "description": "Black wireless optical mouse with ergonomic design",
+    "color": "black",
+    "keywords": ["wireless mouse", "computer mouse", "black mouse", "optical mouse"],
+    "confidence": 0.9
+}"""
+
+
+def _detect_image_mime(header: bytes) -> str:
+    """
+    Detect an image's MIME type from its first 12 bytes.
+
+    Args:
+        header: Start of the image file
+
+    Returns:
+        MIME type, or image/jpeg if the format is not recognised
+    """
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    for signature, mime in _IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime
+    return _DEFAULT_IMAGE_MIME
+
+
+def _encode_mapped_image(mapped: mmap.mmap) -> tuple[str, str]:
+    """Base64 encode a memory-mapped image straight from its pages, without reading a bytes copy first."""
+    return _detect_image_mime(mapped[:12]), b64encode(mapped).decode("ascii")
+
+
+def _parse_json_object(text: str) -> Any:
+    """
+    Parse the JSON object in a model response, with or without a markdown fence.
+
+    Responses are almost always bare JSON or a single fenced object, so the span
+    from the first "{" to the last "}" is tried first; that takes two linear scans
+    and no backtracking. The fence regex is only used if that slice doesn't parse.
+
+    Args:
+        text: Model response text
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        orjson.JSONDecodeError: If no candidate parses as JSON
+    """
+    start = text.find("{")
+    end = text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            return orjson.loads(text[start : end + 1])
+        except orjson.JSONDecodeError:
+            pass
+    fence = _JSON_FENCE_RE.search(text)
+    return orjson.loads(fence.group(1) if fence else text.strip())
+
 
 class AzureOpenAIClient:
     """Client for interacting with Azure OpenAI multi-modal models."""
 
-    def __init__(self, settings=None):
+    def __init__(
+        self,
+        settings=None,
+        http_client: httpx.AsyncClient | None = None,
+        vision_cache_size: int = 128,
+        vision_cache_ttl: float = 3600.0,
+    ):
         """
         Initialize Azure OpenAI client.
 
         Args:
             settings: Optional Settings instance. If None, uses get_settings().
+            http_client: Optional httpx.AsyncClient to send requests through, e.g. the
+                shared client from get_shared_http_client() so several clients reuse one
+                warm connection pool. If None, the client gets its own connection pool.
+                The caller owns any client it passes in.
+            vision_cache_size: Product identifications kept for repeat uploads of the
+                same image (0 disables the cache)
+            vision_cache_ttl: Seconds a cached identification stays valid
         """
         self.settings = settings or get_settings()
         self.client = AsyncAzureOpenAI(
             api_key=self.settings.azure_openai_api_key,
             api_version=self.settings.azure_openai_api_version,
             azure_endpoint=self.settings.azure_openai_endpoint,
+            http_client=http_client,
         )
+        # Image digest + context -> (expiry time, vision_data), least recently used first
+        self._vision_cache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._vision_cache_size = vision_cache_size
+        self._vision_cache_ttl = vision_cache_ttl
+        self.vision_cache_stats = {"hits": 0, "misses": 0, "disk_hits": 0}
+        # Persistent tier behind the in-memory one: survives restarts, shared by workers
+        self._vision_disk_cache = None
+        if self.settings.vision_cache_path:
+            try:
+                self._vision_disk_cache = VisionDiskCache(self.settings.vision_cache_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Vision disk cache unavailable at {self.settings.vision_cache_path}: {e}")
         logger.info(f"Initialized Azure OpenAI client with endpoint: {self.settings.azure_openai_endpoint}")
 
     @trace(name="azure_openai_call", trace_type="llm")
@@ -39,6 +172,7 @@ class AzureOpenAIClient:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         stream: bool = False,
+        raw: bool = False,
     ) -> dict[str, Any] | Any:
         """
         Call Azure OpenAI LLM with messages and optional function calling.
@@ -49,9 +183,12 @@ class AzureOpenAIClient:
             temperature: Sampling temperature (0.0 to 2.0)
             max_tokens: Maximum tokens in response
             stream: Whether to stream the response
+            raw: Return the ChatCompletion object instead of dumping it to a dict;
+                cheaper when only the content or tool calls are read
 
         Returns:
-            Response from Azure OpenAI (dict if not streaming, generator if streaming)
+            Response from Azure OpenAI (dict, or ChatCompletion if raw, if not
+            streaming; generator if streaming)
         """
         try:
             request_params = {
@@ -69,8 +206,15 @@ class AzureOpenAIClient:
                 return await self.client.chat.completions.create(stream=True, **request_params)
             else:
                 response = await self.client.chat.completions.create(**request_params)
-                logger.debug(f"LLM response: {response.model_dump()}")
-                return response.model_dump()
+                if raw:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"LLM response: {response.model_dump()}")
+                    return response
+                response_dict = response.model_dump()
+                # Formatting the whole response is costly; skip it unless debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"LLM response: {response_dict}")
+                return response_dict
 
         except Exception as e:
             logger.error(f"Error calling Azure OpenAI: {e}")
@@ -83,6 +227,8 @@ class AzureOpenAIClient:
         image_path: str | Path | None = None,
         system_prompt: str | None = None,
         tools: list[dict[str, Any]] | None = None,
+        raw: bool = False,
+        image_url: str | None = None,
     ) -> dict[str, Any]:
         """
         Process multi-modal input (text + optional image).
@@ -92,6 +238,8 @@ class AzureOpenAIClient:
             image_path: Optional path to image file
             system_prompt: Optional system prompt
             tools: Optional list of tool definitions
+            raw: Return the ChatCompletion object instead of a dict (see call_llm)
+            image_url: Data URL already built for image_path, sent instead of re-encoding the file
 
         Returns:
             Response from Azure OpenAI
@@ -110,18 +258,19 @@ class AzureOpenAIClient:
 
         # Add image if provided
         if image_path:
-            image_data = self._encode_image(image_path)
+            if image_url is None:
+                image_url = await self._image_data_url_async(image_path)
             user_content.append(
                 {
                     "type": "image_url",
-                    "image_url": {"url": f"data:image/jpeg;base64,{image_data}"},
+                    "image_url": {"url": image_url},
                 }
             )
             logger.info(f"Processing multi-modal input with image: {image_path}")
 
         messages.append({"role": "user", "content": user_content})
 
-        return await self.call_llm(messages=messages, tools=tools)
+        return await self.call_llm(messages=messages, tools=tools, raw=raw)
 
     @trace(name="identify_product_from_image", trace_type="llm")
     async def identify_product_from_image(
@@ -149,47 +298,38 @@ class AzureOpenAIClient:
                 - confidence: Confidence score (0.0 to 1.0)
             Returns None if identification fails
         """
-        import json
-
-        system_prompt = """You are a retail product identification specialist. Analyze the image and extract product information.
-
-Return ONLY a JSON object with these fields:
-- product_name: The type and name of the product (e.g., "Wireless Mouse", "Running Shoes")
-- category: One of: Electronics, Clothing, Groceries, Home & Garden, Sports & Outdoors, Books & Media, Toys & Games, Health & Beauty
-- description: Detailed description of the product
-- color: Primary color(s) of the product
-- keywords: Array of search keywords (3-5 keywords)
-- confidence: Your confidence level (0.0 to 1.0)
-
-Example:
-{
-    "product_name": "Wireless Mouse",
-    "category": "Electronics",
-    "description": "Black wireless optical mouse with ergonomic design",
-    "color": "black",
-    "keywords": ["wireless mouse", "computer mouse", "black mouse", "optical mouse"],
-    "confidence": 0.9
-}"""
+        cache_key = image_url = None
+        if self._vision_cache_size > 0 or self._vision_disk_cache is not None:
+            cache_key, image_url = await asyncio.to_thread(self._read_vision_image, image_path, context)
+        if cache_key is not None:
+            cached = self._get_cached_vision(cache_key)
+            if cached is not None:
+                logger.info(f"Vision cache hit for image: {image_path}")
+                return cached
+            if self._vision_disk_cache is not None:
+                try:
+                    cached = await asyncio.to_thread(self._vision_disk_cache.get, cache_key)
+                except sqlite3.Error as e:
+                    logger.warning(f"Vision disk cache lookup failed, identifying uncached: {e}")
+                if cached is not None:
+                    self.vision_cache_stats["disk_hits"] += 1
+                    logger.info(f"Vision disk cache hit for image: {image_path}")
+                    self._cache_vision(cache_key, cached)
+                    return cached
 
         try:
             response = await self.process_multimodal(
                 text=context or "Identify this product for inventory lookup",
                 image_path=image_path,
-                system_prompt=system_prompt,
+                system_prompt=VISION_SYSTEM_PROMPT,
+                raw=True,
+                image_url=image_url,
             )
 
             response_text = await self.extract_response_content(response)
 
-            # Parse JSON response
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_str = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                json_str = response_text.split("```")[1].split("```")[0].strip()
-            else:
-                json_str = response_text.strip()
-
-            vision_data = json.loads(json_str)
+            # Parse JSON response, which may be wrapped in a markdown code block
+            vision_data = _parse_json_object(response_text)
 
             # Validate required fields
             required_fields = ["product_name", "category", "keywords"]
@@ -197,15 +337,23 @@ Example:
                 logger.warning(f"Vision response missing required fields: {vision_data}")
                 return None
 
-            logger.info(
-                f"Identified product: {vision_data.get('product_name')} "
-                f"({vision_data.get('category')}) "
-                f"confidence: {vision_data.get('confidence', 0)}"
-            )
-
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Identified product: {vision_data.get('product_name')} "
+                    f"({vision_data.get('category')}) "
+                    f"confidence: {vision_data.get('confidence', 0)}"
+                )
+
+            if cache_key is not None:
+                self._cache_vision(cache_key, vision_data)
+                if self._vision_disk_cache is not None:
+                    try:
+                        await asyncio.to_thread(self._vision_disk_cache.set, cache_key, vision_data)
+                    except sqlite3.Error as e:
+                        logger.warning(f"Failed to persist identification to vision disk cache: {e}")
             return vision_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse vision response as JSON: {e}")
             logger.debug(f"Response text: {response_text if 'response_text' in locals() else 'N/A'}")
             return None
@@ -213,6 +361,127 @@ Example:
             logger.error(f"Error identifying product from image: {e}", exc_info=True)
             return None
 
+    async def identify_products_from_images(
+        self,
+        image_paths: list[str | Path],
+        contexts: list[str] | None = None,
+        max_concurrency: int = 8,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Identify several product images concurrently.
+
+        Requests run in parallel (at most max_concurrency at a time), so N images
+        take roughly one round trip instead of N. A failed identification yields
+        None in its slot without cancelling the others.
+
+        Args:
+            image_paths: Paths to the product images
+            contexts: Optional per-image user context, same length as image_paths
+            max_concurrency: Maximum identification requests in flight at once
+
+        Returns:
+            Results of identify_product_from_image, in the same order as image_paths
+        """
+        if contexts is None:
+            contexts = [""] * len(image_paths)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def identify(image_path: str | Path, context: str) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self.identify_product_from_image(image_path, context)
+
+        results = await asyncio.gather(
+            *(identify(path, context) for path, context in zip(image_paths, contexts, strict=True)),
+            return_exceptions=True,
+        )
+        for path, result in zip(image_paths, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Error identifying product from image {path}: {result}")
+        return [None if isinstance(result, BaseException) else result for result in results]
+
+    def _read_vision_image(self, image_path: str | Path, context: str) -> tuple[str | None, str | None]:
+        """
+        Build the vision cache key from the image contents and the user's context.
+
+        The image is mapped once: the digest is computed over the mapped pages, and an
+        image small enough to upload as-is is encoded from the same mapping, so a cache
+        miss doesn't read the file again.
+
+        Returns:
+            Tuple of (cache_key, data_url). cache_key is None if the image can't be read
+            (identification then proceeds uncached and reports the error itself); data_url
+            is None when the image must be downscaled, which is left until a cache miss
+        """
+        digest = hashlib.sha256()
+        data_url = None
+        try:
+            with open(image_path, "rb") as image_file:
+                size = os.fstat(image_file.fileno()).st_size
+                if size == 0:
+                    data_url = f"data:{_DEFAULT_IMAGE_MIME};base64,"
+                else:
+                    with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        digest.update(mapped)
+                        if size <= _MAX_UPLOAD_BYTES:
+                            mime, image_data = _encode_mapped_image(mapped)
+                            data_url = f"data:{mime};base64,{image_data}"
+        except OSError:
+            return None, None
+        digest.update(b"\0")
+        digest.update(context.encode())
+        return digest.hexdigest(), data_url
+
+    def _get_cached_vision(self, key: str) -> dict[str, Any] | None:
+        """Return a copy of a cached, unexpired identification and count the hit or miss."""
+        entry = self._vision_cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._vision_cache[key]
+            self.vision_cache_stats["misses"] += 1
+            return None
+        self._vision_cache.move_to_end(key)
+        self.vision_cache_stats["hits"] += 1
+        # Callers may modify the result; keep the cached copy intact
+        return copy.deepcopy(entry[1])
+
+    def _cache_vision(self, key: str, vision_data: dict[str, Any]) -> None:
+        """Store an identification, evicting the least recently used beyond the cache size."""
+        self._vision_cache[key] = (time.monotonic() + self._vision_cache_ttl, copy.deepcopy(vision_data))
+        self._vision_cache.move_to_end(key)
+        while len(self._vision_cache) > self._vision_cache_size:
+            self._vision_cache.popitem(last=False)
+
+    async def _image_data_url_async(self, image_path: str | Path) -> str:
+        """
+        Build the image's data URL in a worker thread, keeping disk I/O and encoding off the event loop.
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            data: URL with the base64 encoded image
+
+        Raises:
+            FileNotFoundError: If the image does not exist
+        """
+        return await asyncio.to_thread(self._image_data_url, image_path)
+
+    def _image_data_url(self, image_path: str | Path) -> str:
+        """
+        Build the image's data URL for the API.
+
+        The bare base64 string is dropped as soon as the URL is built, so only one
+        encoded copy of the image stays alive for the duration of the request.
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            data: URL with the base64 encoded image
+        """
+        mime, image_data = self._encode_image_with_mime(image_path)
+        return f"data:{mime};base64,{image_data}"
+
     def _encode_image(self, image_path: str | Path) -> str:
         """
         Encode image to base64 for API.
@@ -223,24 +492,81 @@ Example:
         Returns:
             Base64 encoded image string
         """
+        return self._encode_image_with_mime(image_path)[1]
+
+    def _encode_image_with_mime(self, image_path: str | Path) -> tuple[str, str]:
+        """
+        Encode image to base64 and detect its MIME type from the file signature.
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            Tuple of (MIME type, base64 encoded image string)
+        """
         image_path = Path(image_path)
         if not image_path.exists():
             raise FileNotFoundError(f"Image not found: {image_path}")
 
+        size = image_path.stat().st_size
+        if size > _MAX_UPLOAD_BYTES:
+            downscaled = self._downscale_image(image_path, size)
+            if downscaled is not None:
+                return "image/jpeg", b64encode(downscaled).decode("ascii")
+
         with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+            # mmap can't map an empty file
+            if size == 0:
+                return _DEFAULT_IMAGE_MIME, ""
+            with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _encode_mapped_image(mapped)
+
+    @staticmethod
+    def _downscale_image(image_path: Path, size: int) -> bytes | None:
+        """
+        Shrink an oversized image to at most _MAX_IMAGE_SIDE pixels per side as JPEG.
 
-    async def extract_response_content(self, response: dict[str, Any]) -> str:
+        Args:
+            image_path: Path to image file
+            size: File size in bytes
+
+        Returns:
+            JPEG bytes, or None to upload the original (not decodable, or no smaller)
+        """
+        from PIL import Image, ImageOps, UnidentifiedImageError
+
+        try:
+            with Image.open(image_path) as image:
+                # Apply the EXIF rotation before it is lost in re-encoding
+                image = ImageOps.exif_transpose(image)
+                image.thumbnail((_MAX_IMAGE_SIDE, _MAX_IMAGE_SIDE), Image.LANCZOS)
+                if image.mode != "RGB":
+                    image = image.convert("RGB")
+                buffer = io.BytesIO()
+                image.save(buffer, "JPEG", quality=85, optimize=True)
+        except (UnidentifiedImageError, OSError) as e:
+            logger.warning(f"Could not downscale image {image_path}, uploading original: {e}")
+            return None
+
+        if buffer.tell() >= size:
+            return None
+        logger.debug(f"Downscaled image {image_path} from {size} to {buffer.tell()} bytes")
+        return buffer.getvalue()
+
+    async def extract_response_content(self, response: dict[str, Any] | Any) -> str:
         """
         Extract text content from LLM response.
 
         Args:
-            response: Response dictionary from call_llm()
+            response: Response dictionary (or raw ChatCompletion) from call_llm()
 
         Returns:
             Extracted text content
         """
         try:
+            if not isinstance(response, dict):
+                return (response.choices[0].message.content or "") if response.choices else ""
+
             choices = response.get("choices", [])
             if not choices:
                 return ""
@@ -254,17 +580,29 @@ Example:
             logger.error(f"Error extracting response content: {e}")
             return ""
 
-    async def extract_tool_calls(self, response: dict[str, Any]) -> list[dict[str, Any]]:
+    async def extract_tool_calls(self, response: dict[str, Any] | Any) -> list[dict[str, Any]]:
         """
         Extract tool calls from LLM response.
 
         Args:
-            response: Response dictionary from call_llm()
+            response: Response dictionary (or raw ChatCompletion) from call_llm()
 
         Returns:
             List of tool call dictionaries
         """
         try:
+            if not isinstance(response, dict):
+                if not response.choices:
+                    return []
+                return [
+                    {
+                        "id": tc.id,
+                        "type": tc.type,
+                        "function": {"name": tc.function.name, "arguments": tc.function.arguments},
+                    }
+                    for tc in response.choices[0].message.tool_calls or []
+                ]
+
             choices = response.get("choices", [])
             if not choices:
                 return []
@@ -288,24 +626,50 @@ Example:
             logger.error(f"Error extracting tool calls: {e}")
             return []
 
-    async def stream_response(self, messages: list[dict[str, Any]], tools: list[dict[str, Any]] | None = None):
+    async def stream_response(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        min_flush_chars: int = 32,
+        max_flush_ms: float = 25.0,
+    ):
         """
         Stream response from Azure OpenAI.
 
+        Deltas are typically only a few tokens long, so they are buffered and yielded
+        together once min_flush_chars have accumulated or max_flush_ms have passed
+        since the last yield. The concatenated output is unchanged.
+
         Args:
             messages: List of message dictionaries
             tools: Optional list of tool definitions
+            min_flush_chars: Buffered characters that trigger a yield (0 yields every delta)
+            max_flush_ms: Milliseconds after which buffered text is yielded regardless of size
 
         Yields:
             Chunks of the response
         """
         stream = await self.call_llm(messages=messages, tools=tools, stream=True)
 
+        buffer: list[str] = []
+        buffered_chars = 0
+        max_flush_seconds = max_flush_ms / 1000
+        last_flush = time.monotonic()
         async for chunk in stream:
-            chunk_dict = chunk.model_dump()
-            choices = chunk_dict.get("choices", [])
-            if choices:
-                delta = choices[0].get("delta", {})
-                content = delta.get("content")
-                if content:
-                    yield content
+            # Read the delta by attribute; dumping every chunk to a dict is the costly part
+            if not chunk.choices:
+                continue
+            content = chunk.choices[0].delta.content
+            if not content:
+                continue
+            buffer.append(content)
+            buffered_chars += len(content)
+            now = time.monotonic()
+            if buffered_chars >= min_flush_chars or now - last_flush >= max_flush_seconds:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+                last_flush = now
+
+        if buffer:
+            yield "".join(buffer)
@@ -112,10 +112,30 @@ FEW_SHOT_EXAMPLES = {
 }
 
 
+# Few-shot examples rendered once; the prompts and examples are static
+_EXAMPLES_TEXT = "\n\n## Example Interactions:\n\n" + "".join(
+    f"Example {i}:\nUser: {example['user']}\nAssistant: {example['response']}\n\n"
+    for examples in FEW_SHOT_EXAMPLES.values()
+    for i, example in enumerate(examples, 1)
+)
+
+# Every (mode, include_examples) variant, fully rendered; examples apply to the
+# default and tool_calling modes only
+_RENDERED_PROMPTS = {
+    (mode, include_examples): prompt + _EXAMPLES_TEXT
+    if include_examples and mode in ("default", "tool_calling")
+    else prompt
+    for mode, prompt in SYSTEM_PROMPTS.items()
+    for include_examples in (False, True)
+}
+
+
 def get_system_prompt(mode: str = "default", include_examples: bool = False) -> str:
     """
     Get system prompt for the assistant.
 
+    All variants are prebuilt at import, so this is a dict lookup on every turn.
+
     Args:
         mode: Prompt mode (default, multimodal, tool_calling)
         include_examples: Whether to include few-shot examples
@@ -123,19 +143,8 @@ def get_system_prompt(mode: str = "default", include_examples: bool = False) ->
     Returns:
         System prompt string
     """
-    prompt = SYSTEM_PROMPTS.get(mode, SYSTEM_PROMPTS["default"])
-
-    if include_examples and mode in ["default", "tool_calling"]:
-        examples_text = "\n\n## Example Interactions:\n\n"
-        for example_type, examples in FEW_SHOT_EXAMPLES.items():
-            for i, example in enumerate(examples, 1):
-                examples_text += f"Example {i}:\n"
-                examples_text += f"User: {example['user']}\n"
-                examples_text += f"Assistant: {example['response']}\n\n"
-
-        prompt += examples_text
-
-    return prompt
+    # Unknown modes fall back to the default prompt, without examples
+    return _RENDERED_PROMPTS.get((mode, include_examples), SYSTEM_PROMPTS["default"])
 
 
 def format_rag_context(products: list[dict], max_products: int = 5) -> str:
@@ -152,18 +161,22 @@ def format_rag_context(products: list[dict], max_products: int = 5) -> str:
     if not products:
         return "No relevant products found in the catalog."
 
-    context = "Relevant products from catalog:\n\n"
+    parts = ["Relevant products from catalog:\n\n"]
 
     for i, product in enumerate(products[:max_products], 1):
-        context += f"{i}. {product.get('name')} (SKU: {product.get('sku')})\n"
-        context += f"   Category: {product.get('category')}\n"
-        context += f"   Price: ${product.get('price', 0):.2f}\n"
-        context += f"   Current Stock: {product.get('current_stock', 0)} units\n"
-        context += f"   Reorder Level: {product.get('reorder_level', 0)} units\n"
-
-        if product.get("current_stock", 0) <= product.get("reorder_level", 0):
-            context += "   ⚠️ LOW STOCK - Consider reordering\n"
-
-        context += "\n"
-
-    return context
+        current_stock = product.get("current_stock", 0)
+        reorder_level = product.get("reorder_level", 0)
+        parts.append(
+            f"{i}. {product.get('name')} (SKU: {product.get('sku')})\n"
+            f"   Category: {product.get('category')}\n"
+            f"   Price: ${product.get('price', 0):.2f}\n"
+            f"   Current Stock: {current_stock} units\n"
+            f"   Reorder Level: {reorder_level} units\n"
+        )
+
+        if current_stock <= reorder_level:
+            parts.append("   ⚠️ LOW STOCK - Consider reordering\n")
+
+        parts.append("\n")
+
+    return "".join(parts)
@@ -0,0 +1,79 @@
+"""Persistent on-disk cache of product identifications from images."""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class VisionDiskCache:
+    """
+    SQLite-backed store of vision results keyed by image digest and user context.
+
+    Entries survive restarts and redeploys, and every worker process pointed at the
+    same file shares them: SQLite serializes writers across processes, and WAL mode
+    lets readers proceed while another worker writes. Methods block on disk I/O, so
+    call them from a worker thread inside the event loop.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = 30 * 86400):
+        """
+        Open (or create) the cache database and drop expired entries.
+
+        Args:
+            path: SQLite file location, shared by all workers
+            ttl: Seconds an identification stays valid (30 days default)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # Wait for other workers' writes instead of failing with "database is locked"
+        self.conn = sqlite3.connect(path, timeout=10.0, check_same_thread=False)
+        with self._lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS vision (key TEXT PRIMARY KEY, expires_at REAL, data BLOB)")
+            self.conn.execute("DELETE FROM vision WHERE expires_at < ?", (time.time(),))
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up an unexpired identification.
+
+        Args:
+            key: Cache key (image digest + context)
+
+        Returns:
+            Vision data, or None if missing or expired
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM vision WHERE key = ? AND expires_at >= ?", (key, time.time())
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, vision_data: dict[str, Any]) -> None:
+        """
+        Store an identification as compact JSON.
+
+        Args:
+            key: Cache key (image digest + context)
+            vision_data: Identification result to persist
+        """
+        blob = orjson.dumps(vision_data)
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO vision (key, expires_at, data) VALUES (?, ?, ?)",
+                (key, time.time() + self.ttl, blob),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
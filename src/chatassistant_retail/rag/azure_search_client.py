@@ -1,12 +1,17 @@
 """Azure AI Search client for product catalog and sales data."""
 
+import asyncio
+import hashlib
 import logging
+import random
 import time
 from typing import Any
 
+import numpy as np
+import orjson
 from azure.core.credentials import AzureKeyCredential
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
-from azure.search.documents import SearchClient
+from azure.search.documents import IndexDocumentsBatch, SearchClient
 from azure.search.documents.indexes import SearchIndexClient
 from azure.search.documents.indexes.models import (
     HnswAlgorithmConfiguration,
@@ -27,6 +32,38 @@ from chatassistant_retail.data.models import Product
 
 logger = logging.getLogger(__name__)
 
+# Throttled indexing requests (Azure Search returns 503 under load) are retried with backoff
+_THROTTLED_STATUS_CODES = (429, 503)
+_MAX_THROTTLE_RETRIES = 5
+_MAX_BACKOFF_SECONDS = 30.0
+
+# Product fields fingerprinted into the "content_hash" index field for change detection
+CONTENT_HASH_FIELDS = ("name", "category", "description", "price", "current_stock", "reorder_level", "supplier")
+
+
+def compute_content_hash(product: Product, embedding_fingerprint: str = "") -> str:
+    """
+    Compute a stable fingerprint of a product's indexed fields.
+
+    Args:
+        product: Product instance
+        embedding_fingerprint: Identity of the embedding model that produced the
+            document's vector (e.g. the deployment name), so vectors from another
+            model hash differently even when the product is unchanged
+
+    Returns:
+        Hex digest that changes whenever any of CONTENT_HASH_FIELDS or the embedding
+        fingerprint changes
+    """
+    payload = orjson.dumps(
+        product.model_dump(mode="json", include=set(CONTENT_HASH_FIELDS)),
+        option=orjson.OPT_SORT_KEYS,
+    )
+    digest = hashlib.blake2b(payload, digest_size=16)
+    if embedding_fingerprint:
+        digest.update(b"\0" + embedding_fingerprint.encode())
+    return digest.hexdigest()
+
 
 class AzureSearchClient:
     """Client for Azure AI Search with hybrid (vector + keyword) search."""
@@ -66,6 +103,9 @@ class AzureSearchClient:
         # Track whether semantic search is available (will be set to True if semantic search errors occur)
         self._semantic_search_disabled = False
 
+        # Whether the live index has the content_hash field (resolved lazily; older indexes predate it)
+        self._content_hash_supported: bool | None = None
+
         # Check if index exists and warn if missing
         if not self.index_exists():
             logger.warning(
@@ -74,6 +114,11 @@ class AzureSearchClient:
                 f"The application will fall back to local product data until the index is created."
             )
 
+    @property
+    def embedding_fingerprint(self) -> str:
+        """Identity of the embedding model whose vectors this client uploads."""
+        return self.settings.azure_openai_embedding_deployment
+
     def create_index(self, embedding_dimensions: int = 1536):
         """
         Create search index with vector and keyword search capabilities.
@@ -139,6 +184,12 @@ class AzureSearchClient:
                 filterable=True,
                 searchable=True,
             ),
+            SearchField(
+                name="content_hash",
+                type=SearchFieldDataType.String,
+                filterable=False,
+                searchable=False,
+            ),
             SearchField(
                 name="content_vector",
                 type=SearchFieldDataType.Collection(SearchFieldDataType.Single),
@@ -188,55 +239,86 @@ class AzureSearchClient:
 
         try:
             self.index_client.create_or_update_index(index)
+            self._content_hash_supported = None
             logger.info(f"Created/updated search index: {self.settings.azure_search_index_name}")
         except Exception as e:
             logger.error(f"Error creating search index: {e}")
             raise
 
-    async def index_products(self, products: list[Product], embeddings: list[list[float]]):
+    def _supports_content_hash(self) -> bool:
         """
-        Index products with their embeddings to Azure Search.
+        Check whether the index schema includes the content_hash field.
 
-        Args:
-            products: List of Product instances
-            embeddings: List of embedding vectors (same length as products)
+        The result is cached after the first lookup, including a failed one (treated as
+        unsupported, so documents are uploaded without content_hash instead of repeating
+        the lookup per document), and reset by create_index().
         """
-        if not self.enabled:
-            logger.warning("Azure Search not enabled. Cannot index products.")
-            return
+        if self._content_hash_supported is None:
+            try:
+                index = self.index_client.get_index(self.settings.azure_search_index_name)
+            except Exception as e:
+                logger.warning(f"Could not inspect index fields; uploading without content_hash: {e}")
+                self._content_hash_supported = False
+                return False
+            self._content_hash_supported = any(field.name == "content_hash" for field in index.fields)
+        return self._content_hash_supported
 
-        if len(products) != len(embeddings):
-            raise ValueError("Number of products must match number of embeddings")
+    def _product_document(self, product: Product, embedding: list[float] | np.ndarray) -> dict[str, Any]:
+        """
+        Build the search document for a product and its embedding.
 
-        documents = []
-        for product, embedding in zip(products, embeddings, strict=True):
-            doc = {
-                "id": product.sku,
-                "sku": product.sku,
-                "name": product.name,
-                "category": product.category,
-                "description": product.description,
-                "price": product.price,
-                "current_stock": product.current_stock,
-                "reorder_level": product.reorder_level,
-                "supplier": product.supplier,
-                "content_vector": embedding,
-            }
-            documents.append(doc)
+        float32 array rows are converted to a Python list only here, at the request boundary.
+        """
+        doc = {
+            "id": product.sku,
+            "sku": product.sku,
+            "name": product.name,
+            "category": product.category,
+            "description": product.description,
+            "price": product.price,
+            "current_stock": product.current_stock,
+            "reorder_level": product.reorder_level,
+            "supplier": product.supplier,
+            "content_vector": embedding.tolist() if isinstance(embedding, np.ndarray) else embedding,
+        }
+        if self._supports_content_hash():
+            doc["content_hash"] = compute_content_hash(product, self.embedding_fingerprint)
+        return doc
 
-        try:
-            # Upload in batches of 100
-            batch_size = 100
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i : i + batch_size]
-                self.search_client.upload_documents(documents=batch)
-                logger.info(f"Indexed batch {i // batch_size + 1}: {len(batch)} products")
+    async def _call_with_backoff(self, func, *args, **kwargs):
+        """
+        Run a blocking SDK call in a worker thread, retrying throttled requests.
 
-            logger.info(f"Successfully indexed {len(products)} products")
+        Honors the Retry-After header when the service sends one; otherwise waits
+        a random time up to an exponentially growing cap (full jitter) so concurrent
+        batches do not retry in lockstep.
 
-        except Exception as e:
-            logger.error(f"Error indexing products: {e}")
-            raise
+        Args:
+            func: SDK method to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of func
+
+        Raises:
+            HttpResponseError: If the error is not throttling or retries are exhausted
+        """
+        for attempt in range(_MAX_THROTTLE_RETRIES + 1):
+            try:
+                return await asyncio.to_thread(func, *args, **kwargs)
+            except HttpResponseError as e:
+                if e.status_code not in _THROTTLED_STATUS_CODES or attempt == _MAX_THROTTLE_RETRIES:
+                    raise
+
+                retry_after = e.response.headers.get("Retry-After") if e.response is not None else None
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = random.uniform(0, min(_MAX_BACKOFF_SECONDS, 2**attempt))
+
+                logger.warning(f"Azure Search throttled request ({e.status_code}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
 
     async def search_products(
         self,
@@ -424,23 +506,27 @@ class AzureSearchClient:
         all_documents = []
         skip = 0
 
+        # Use minimal select fields for comparison (exclude content_vector to reduce transfer size)
+        select = [
+            "sku",
+            "name",
+            "category",
+            "description",
+            "price",
+            "current_stock",
+            "reorder_level",
+            "supplier",
+        ]
+        if self._supports_content_hash():
+            select.append("content_hash")
+
         try:
             while True:
-                # Use minimal select fields for comparison (exclude content_vector to reduce transfer size)
                 results = self.search_client.search(
                     search_text="*",
                     top=batch_size,
                     skip=skip,
-                    select=[
-                        "sku",
-                        "name",
-                        "category",
-                        "description",
-                        "price",
-                        "current_stock",
-                        "reorder_level",
-                        "supplier",
-                    ],
+                    select=select,
                 )
 
                 batch = list(results)
@@ -519,17 +605,27 @@ class AzureSearchClient:
 
         return {"total": total, "succeeded": succeeded, "failed": failed, "errors": errors}
 
-    async def upsert_products(self, products: list[Product], embeddings: list[list[float]]) -> dict[str, Any]:
+    async def apply_diff(
+        self,
+        deletes: list[str],
+        upserts: list[Product],
+        embeddings: list[list[float]],
+        batch_size: int = 1000,
+    ) -> dict[str, Any]:
         """
-        Insert or update products in the Azure Search index.
-        Uses merge-or-upload: creates new documents or updates existing ones.
+        Apply deletes and upserts to the index in combined batches.
+
+        Each request carries both delete and merge-or-upload actions, so a sync needs
+        one round-trip per batch instead of separate delete and upsert passes.
 
         Args:
-            products: List of Product instances
-            embeddings: List of embedding vectors (same length as products)
+            deletes: SKUs to delete from the index
+            upserts: Products to insert or update
+            embeddings: Embedding vectors for upserts (same length as upserts)
+            batch_size: Maximum actions per request (Azure Search limit: 1000)
 
         Returns:
-            Dictionary with upsert results:
+            Dictionary with results:
             {
                 "total": int,
                 "succeeded": int,
@@ -538,59 +634,54 @@ class AzureSearchClient:
             }
         """
         if not self.enabled:
-            logger.warning("Azure Search not enabled. Cannot upsert products.")
+            logger.warning("Azure Search not enabled. Cannot apply changes.")
             return {"total": 0, "succeeded": 0, "failed": 0, "errors": []}
 
-        if len(products) != len(embeddings):
+        if len(upserts) != len(embeddings):
             raise ValueError("Number of products must match number of embeddings")
 
-        # Prepare documents
-        documents = []
-        for product, embedding in zip(products, embeddings, strict=True):
-            doc = {
-                "id": product.sku,
-                "sku": product.sku,
-                "name": product.name,
-                "category": product.category,
-                "description": product.description,
-                "price": product.price,
-                "current_stock": product.current_stock,
-                "reorder_level": product.reorder_level,
-                "supplier": product.supplier,
-                "content_vector": embedding,
-            }
-            documents.append(doc)
+        delete_docs = [{"id": sku} for sku in deletes]
+        num_deletes = len(delete_docs)
 
-        total = len(documents)
+        total = num_deletes + len(upserts)
         succeeded = 0
         failed = 0
         errors = []
 
-        try:
-            # Upload in batches of 100
-            batch_size = 100
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i : i + batch_size]
-                try:
-                    results = self.search_client.merge_or_upload_documents(documents=batch)
+        for start in range(0, total, batch_size):
+            end = start + batch_size
+            batch = IndexDocumentsBatch()
+            if start < num_deletes:
+                batch.add_delete_actions(delete_docs[start:end])
+            if end > num_deletes:
+                upsert_start, upsert_end = max(start - num_deletes, 0), end - num_deletes
+                batch.add_merge_or_upload_actions(
+                    [
+                        self._product_document(product, embedding)
+                        for product, embedding in zip(
+                            upserts[upsert_start:upsert_end], embeddings[upsert_start:upsert_end], strict=True
+                        )
+                    ]
+                )
 
-                    for result in results:
-                        if result.succeeded:
-                            succeeded += 1
-                        else:
-                            failed += 1
-                            errors.append(f"SKU {result.key}: {result.error_message}")
+            batch_number = start // batch_size + 1
+            try:
+                # Run the blocking SDK call off the event loop so callers can overlap other work
+                results = await self._call_with_backoff(self.search_client.index_documents, batch)
 
-                    logger.info(f"Upserted batch {i // batch_size + 1}: {len(batch)} products")
+                for result in results:
+                    if result.succeeded:
+                        succeeded += 1
+                    else:
+                        failed += 1
+                        errors.append(f"SKU {result.key}: {result.error_message}")
 
-                except Exception as e:
-                    failed += len(batch)
-                    errors.append(f"Batch {i // batch_size + 1} failed: {str(e)}")
-                    logger.error(f"Error upserting batch: {e}")
+                logger.info(f"Applied batch {batch_number}: {min(end, total) - start} actions")
 
-        except Exception as e:
-            logger.error(f"Error during upsert: {e}")
-            errors.append(f"Upsert failed: {str(e)}")
+            except Exception as e:
+                failed += min(end, total) - start
+                errors.append(f"Batch {batch_number} failed: {str(e)}")
+                logger.error(f"Error applying batch: {e}")
 
         return {"total": total, "succeeded": succeeded, "failed": failed, "errors": errors}
 
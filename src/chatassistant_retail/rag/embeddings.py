@@ -1,31 +1,60 @@
 """Embeddings client for Azure OpenAI."""
 
+import asyncio
 import logging
 
-from openai import AsyncAzureOpenAI
+import httpx
+from openai import AsyncAzureOpenAI, BadRequestError, RateLimitError
 
 from chatassistant_retail.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Rate-limited sub-batches are retried this many times, waiting 1s, 2s, 4s, ... (capped)
+_MAX_RATE_LIMIT_RETRIES = 5
+_MAX_RATE_LIMIT_BACKOFF_SECONDS = 30.0
+
+# Error codes for a request rejected because of one of its input texts; only these are
+# worth splitting the request to isolate the text, any other bad request fails as a whole
+_PER_INPUT_ERROR_CODES = frozenset({"context_length_exceeded", "string_above_max_length", "invalid_input"})
+
+
+def _is_per_input_error(error: BadRequestError) -> bool:
+    """Whether a rejected embeddings request was caused by one of its input texts."""
+    # The embeddings endpoint reports an over-long input with a null code, so also match the message
+    return error.code in _PER_INPUT_ERROR_CODES or "maximum context length" in str(error)
+
 
 class EmbeddingsClient:
     """Client for generating embeddings using Azure OpenAI."""
 
-    def __init__(self, settings=None):
+    def __init__(
+        self,
+        settings=None,
+        http_client: httpx.AsyncClient | None = None,
+        batch_size: int = 64,
+        max_concurrency: int = 8,
+    ):
         """
         Initialize embeddings client.
 
         Args:
             settings: Optional Settings instance. If None, uses get_settings().
+            http_client: Optional shared httpx.AsyncClient, so several clients reuse one
+                connection pool. The caller owns it and is responsible for closing it.
+            batch_size: Maximum texts per embeddings request in generate_embeddings_batch
+            max_concurrency: Maximum embeddings requests in flight in generate_embeddings_batch
         """
         self.settings = settings or get_settings()
         self.client = AsyncAzureOpenAI(
             api_key=self.settings.azure_openai_api_key,
             api_version=self.settings.azure_openai_api_version,
             azure_endpoint=self.settings.azure_openai_endpoint,
+            http_client=http_client,
         )
         self.cache = {} if self.settings.cache_embeddings else None
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
         logger.info("Initialized embeddings client")
 
     async def generate_embedding(self, text: str) -> list[float]:
@@ -72,46 +101,120 @@ class EmbeddingsClient:
         Returns:
             List of embedding vectors
         """
-        # Check which texts are already cached
+        # Check which texts are already cached; duplicate texts are only embedded once
+        # (dict keeps first-seen order) and expanded back to every position below
+        unique_texts = list(dict.fromkeys(texts))
         uncached_texts = []
         cached_embeddings = {}
 
         if self.cache is not None:
-            for text in texts:
+            for text in unique_texts:
                 if text in self.cache:
                     cached_embeddings[text] = self.cache[text]
                 else:
                     uncached_texts.append(text)
         else:
-            uncached_texts = texts
+            uncached_texts = unique_texts
 
-        # Generate embeddings for uncached texts
+        # Generate embeddings for uncached texts in sub-batches sent concurrently
         new_embeddings = {}
         if uncached_texts:
+            # Bounds API requests, including the extra ones from splitting rejected sub-batches
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            sub_batches = [
+                uncached_texts[i : i + self.batch_size] for i in range(0, len(uncached_texts), self.batch_size)
+            ]
             try:
-                response = await self.client.embeddings.create(
-                    model=self.settings.azure_openai_embedding_deployment,
-                    input=uncached_texts,
+                results = await asyncio.gather(
+                    *(self._embed_with_split(sub_batch, semaphore) for sub_batch in sub_batches)
                 )
+            except Exception as e:
+                logger.error(f"Error generating batch embeddings: {e}")
+                raise
+
+            # Texts the API rejected on their own come back as None; substitute zero vectors
+            # (never cached) so one bad input does not fail the whole batch. Indexing callers
+            # must not upload them (see scripts/setup_azure_search.py:embed_and_apply)
+            dimensions = next((len(e) for embeddings in results for e in embeddings if e is not None), None)
+            if dimensions is None:
+                raise ValueError("Embeddings API rejected every input text")
+
+            for sub_batch, embeddings in zip(sub_batches, results, strict=True):
+                for text, embedding in zip(sub_batch, embeddings, strict=True):
+                    if embedding is None:
+                        logger.warning(f"Using zero vector for text rejected by embeddings API: {text[:50]}...")
+                        new_embeddings[text] = [0.0] * dimensions
+                        continue
 
-                for text, data in zip(uncached_texts, response.data):
-                    embedding = data.embedding
                     new_embeddings[text] = embedding
 
                     # Cache the result
                     if self.cache is not None:
                         self.cache[text] = embedding
 
-                logger.info(f"Generated {len(uncached_texts)} new embeddings")
-
-            except Exception as e:
-                logger.error(f"Error generating batch embeddings: {e}")
-                raise
+            logger.info(f"Generated {len(uncached_texts)} new embeddings in {len(sub_batches)} requests")
 
         # Combine cached and new embeddings in original order
         all_embeddings = {**cached_embeddings, **new_embeddings}
         return [all_embeddings[text] for text in texts]
 
+    async def _embed_request(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed texts with a single embeddings API request.
+
+        Args:
+            texts: Texts to embed (at most batch_size)
+
+        Returns:
+            Embedding vectors in the same order as texts
+        """
+        response = await self.client.embeddings.create(
+            model=self.settings.azure_openai_embedding_deployment,
+            input=texts,
+        )
+        return [data.embedding for data in response.data]
+
+    async def _embed_with_split(self, texts: list[str], semaphore: asyncio.Semaphore) -> list[list[float] | None]:
+        """
+        Embed a sub-batch, retrying rate limits and isolating rejected inputs.
+
+        A rate-limited request is retried with exponential backoff. A request rejected
+        because of one of its texts (e.g. one over the token limit) is split in half and
+        each half retried, recursing down to single texts, so only the offending text is
+        lost; other bad requests are raised. Every API request, including those from
+        splits, holds a semaphore permit, so splitting never exceeds max_concurrency.
+
+        Args:
+            texts: Texts to embed
+            semaphore: Limits embeddings requests in flight
+
+        Returns:
+            Embedding vectors in the same order as texts; None for a text the API rejected
+        """
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    return await self._embed_request(texts)
+            except RateLimitError:
+                if attempt == _MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = min(2.0**attempt, _MAX_RATE_LIMIT_BACKOFF_SECONDS)
+                attempt += 1
+                logger.warning(f"Embeddings request rate limited; retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+            except BadRequestError as e:
+                if not _is_per_input_error(e):
+                    raise
+                if len(texts) == 1:
+                    logger.error(f"Embeddings API rejected text: {e}")
+                    return [None]
+                mid = len(texts) // 2
+                first, second = await asyncio.gather(
+                    self._embed_with_split(texts[:mid], semaphore), self._embed_with_split(texts[mid:], semaphore)
+                )
+                return first + second
+
     def clear_cache(self):
         """Clear the embeddings cache."""
         if self.cache is not None:
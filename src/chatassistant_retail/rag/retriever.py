@@ -5,6 +5,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import httpx
+
 from chatassistant_retail.config import get_settings
 from chatassistant_retail.data.models import Product
 from chatassistant_retail.observability import trace
@@ -18,15 +20,17 @@ logger = logging.getLogger(__name__)
 class Retriever:
     """Retriever for fetching relevant context from product catalog."""
 
-    def __init__(self, settings=None):
+    def __init__(self, settings=None, http_client: httpx.AsyncClient | None = None):
         """
         Initialize retriever.
 
         Args:
             settings: Optional Settings instance. If None, uses get_settings().
+            http_client: Optional shared httpx.AsyncClient for the embeddings client.
+                The caller owns it and is responsible for closing it.
         """
         self.settings = settings or get_settings()
-        self.embeddings_client = EmbeddingsClient(settings=self.settings)
+        self.embeddings_client = EmbeddingsClient(settings=self.settings, http_client=http_client)
         self.search_client = AzureSearchClient(settings=self.settings)
 
         # Fallback to local data if Azure Search not configured
@@ -1,16 +1,23 @@
 """Langgraph dialog state machine for conversation flow."""
 
 import logging
-from typing import Any, Literal
+import sys
+from typing import Any, Literal, get_args
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langgraph.graph import END, StateGraph
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from chatassistant_retail.tools.context_utils import update_products_cache
 
 logger = logging.getLogger(__name__)
 
+Intent = Literal["greeting", "rag", "tool", "direct", "unknown"]
+
+# One shared string object per intent, so states loaded from storage don't each
+# hold their own copy and intent comparisons hit the identity fast path
+_INTERNED_INTENTS = {intent: sys.intern(intent) for intent in get_args(Intent)}
+
 
 class ConversationState(BaseModel):
     """State model for conversation flow."""
@@ -21,11 +28,17 @@ class ConversationState(BaseModel):
     context: dict[str, Any] = Field(default_factory=dict)
     tool_calls: list[dict[str, Any]] = Field(default_factory=list)
     session_id: str = ""
-    current_intent: Literal["greeting", "rag", "tool", "direct", "unknown"] = "unknown"
+    current_intent: Intent = "unknown"
     needs_rag: bool = False
     needs_tool: bool = False
     error: str | None = None
 
+    @field_validator("current_intent")
+    @classmethod
+    def _intern_intent(cls, value: str) -> str:
+        """Replace the validated intent with its interned string."""
+        return _INTERNED_INTENTS[value]
+
 
 class LanggraphManager:
     """
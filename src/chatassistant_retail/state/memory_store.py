@@ -14,6 +14,11 @@ class MemorySessionStore(SessionStore):
 
     Suitable for HuggingFace Spaces deployment where sessions persist
     only while the space is running. State is lost on restart/cold start.
+
+    No lock is taken: every operation is a single dict call on one key (or a
+    snapshot of the keys), which is atomic in CPython, so concurrent sessions
+    never wait on each other. Ordering of writes to the same session is the
+    caller's concern (RetailChatBot serializes them per session).
     """
 
     def __init__(self):
@@ -72,8 +77,8 @@ class MemorySessionStore(SessionStore):
             True if successful, False otherwise
         """
         try:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
+            # Single pop rather than check-then-delete, so a concurrent delete can't raise KeyError
+            if self._sessions.pop(session_id, None) is not None:
                 logger.debug(f"Deleted state for session: {session_id}")
                 return True
             logger.debug(f"No state to delete for session: {session_id}")
@@ -89,7 +94,7 @@ class MemorySessionStore(SessionStore):
         Returns:
             List of session IDs
         """
-        return list(self._sessions.keys())
+        return list(self._sessions)
 
     async def clear_all(self) -> bool:
         """
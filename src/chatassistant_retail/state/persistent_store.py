@@ -1,13 +1,55 @@
 """Persistent session storage implementations for local deployment."""
 
-import json
+import asyncio
 import logging
+import weakref
 from typing import Any
 
+import orjson
+
 from chatassistant_retail.state.session_store import SessionStore
 
 logger = logging.getLogger(__name__)
 
+# Redis connection pools shared by every RedisSessionStore, per event loop and URL:
+# redis.asyncio connections belong to the loop that opened them and can't be used from
+# another one. A loop's pools are dropped along with the loop.
+_redis_pools: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]] = weakref.WeakKeyDictionary()
+
+
+def _get_redis_pool(redis_url: str, max_connections: int, pool_timeout: float) -> Any:
+    """
+    Get the running event loop's shared connection pool for a Redis URL, creating it on first use.
+
+    When every connection is busy, further operations wait for one to be released
+    instead of failing with "Too many connections".
+
+    Args:
+        redis_url: Redis connection URL
+        max_connections: Upper bound on open connections, to stay under the server's maxclients
+        pool_timeout: Seconds to wait for a free connection before raising ConnectionError
+
+    Returns:
+        redis.asyncio.BlockingConnectionPool for the URL
+    """
+    loop_pools = _redis_pools.setdefault(asyncio.get_running_loop(), {})
+    pool = loop_pools.get(redis_url)
+    if pool is None:
+        import redis.asyncio as redis
+
+        pool = redis.BlockingConnectionPool.from_url(
+            redis_url, max_connections=max_connections, timeout=pool_timeout, decode_responses=True
+        )
+        loop_pools[redis_url] = pool
+    return pool
+
+
+async def close_redis_pools() -> None:
+    """Disconnect the shared Redis connection pools opened on the running event loop."""
+    pools = _redis_pools.pop(asyncio.get_running_loop(), {})
+    for pool in pools.values():
+        await pool.disconnect()
+
 
 class RedisSessionStore(SessionStore):
     """
@@ -17,18 +59,35 @@ class RedisSessionStore(SessionStore):
     Requires: redis>=5.0.0
     """
 
-    def __init__(self, redis_url: str = "redis://localhost:6379", ttl: int = 3600):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        ttl: int = 3600,
+        connection_pool: Any = None,
+        max_connections: int = 64,
+        pool_timeout: float = 20.0,
+    ):
         """
         Initialize Redis session store.
 
         Args:
             redis_url: Redis connection URL
             ttl: Session time-to-live in seconds (default: 1 hour)
+            connection_pool: Pool to use instead of the shared pool for redis_url
+                (the caller must only use the store on the pool's event loop)
+            max_connections: Connection cap when creating the shared pool for redis_url
+            pool_timeout: Seconds an operation waits for a free pooled connection
         """
         try:
             import redis.asyncio as redis
 
-            self.redis = redis.from_url(redis_url, decode_responses=True)
+            self._redis_cls = redis.Redis
+            self._redis_url = redis_url
+            self._connection_pool = connection_pool
+            self._max_connections = max_connections
+            self._pool_timeout = pool_timeout
+            # One client per event loop, each on that loop's shared pool
+            self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = weakref.WeakKeyDictionary()
             self.ttl = ttl
             self._prefix = "chatbot:session:"
             logger.info(f"Initialized Redis session store: {redis_url}")
@@ -36,6 +95,19 @@ class RedisSessionStore(SessionStore):
             logger.error("redis package not installed. Install with: pip install redis")
             raise
 
+    @property
+    def redis(self) -> Any:
+        """Redis client for the running event loop, created on first use from that loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            pool = self._connection_pool
+            if pool is None:
+                pool = _get_redis_pool(self._redis_url, self._max_connections, self._pool_timeout)
+            client = self._redis_cls(connection_pool=pool)
+            self._clients[loop] = client
+        return client
+
     async def save_state(self, session_id: str, state: dict[str, Any]) -> bool:
         """
         Save conversation state for a session.
@@ -49,7 +121,7 @@ class RedisSessionStore(SessionStore):
         """
         try:
             key = f"{self._prefix}{session_id}"
-            serialized = json.dumps(state)
+            serialized = orjson.dumps(state)
             await self.redis.setex(key, self.ttl, serialized)
             logger.debug(f"Saved state for session: {session_id}")
             return True
@@ -71,7 +143,7 @@ class RedisSessionStore(SessionStore):
             key = f"{self._prefix}{session_id}"
             serialized = await self.redis.get(key)
             if serialized:
-                state = json.loads(serialized)
+                state = orjson.loads(serialized)
                 logger.debug(f"Loaded state for session: {session_id}")
                 return state
             logger.debug(f"No state found for session: {session_id}")
@@ -137,8 +209,10 @@ class RedisSessionStore(SessionStore):
             return False
 
     async def close(self):
-        """Close Redis connection."""
-        await self.redis.close()
+        """Close Redis connection (a shared connection pool stays open for other stores; see close_redis_pools)."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
 
 
 class PostgreSQLSessionStore(SessionStore):
@@ -165,7 +239,12 @@ class PostgreSQLSessionStore(SessionStore):
             if db_url.startswith("postgresql://"):
                 db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
 
-            self.engine = create_async_engine(db_url, echo=False)
+            self.engine = create_async_engine(
+                db_url,
+                echo=False,
+                json_serializer=lambda obj: orjson.dumps(obj).decode(),
+                json_deserializer=orjson.loads,
+            )
             self.async_session_maker = sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
 
             Base = declarative_base()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from collections import defaultdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -44,6 +46,21 @@ def _dicts_to_products(product_dicts: list[dict]) -> list[Product]:
     return [Product(**p) for p in product_dicts]
 
 
+def _sales_to_dicts(sales: list[Sale]) -> list[dict]:
+    """Convert Sale models to dictionaries for caching."""
+    return [
+        {
+            "sale_id": s.sale_id,
+            "sku": s.sku,
+            "quantity": s.quantity,
+            "sale_price": s.sale_price,
+            "timestamp": s.timestamp.isoformat(),
+            "channel": s.channel,
+        }
+        for s in sales
+    ]
+
+
 def _load_local_data() -> tuple[list[Product], list[Sale]]:
     """
     Load products and sales from local JSON files.
@@ -78,6 +95,37 @@ def _load_local_data() -> tuple[list[Product], list[Sale]]:
         return [], []
 
 
+async def prime_sku_contexts(states: dict[str, ConversationState]) -> None:
+    """
+    Load inventory data once and cache each SKU's product and sales in its own state.
+
+    Tool calls for a SKU whose state is primed read from the context cache instead of
+    re-parsing products.json and sales_history.json. The files are read in a worker
+    thread so the event loop keeps serving other sessions meanwhile.
+
+    Args:
+        states: Conversation state to prime, keyed by SKU
+    """
+    products, sales = await asyncio.to_thread(_load_local_data)
+
+    products_by_sku = {p.sku: p for p in products if p.sku in states}
+    sales_by_sku: dict[str, list[Sale]] = defaultdict(list)
+    for sale in sales:
+        if sale.sku in states:
+            sales_by_sku[sale.sku].append(sale)
+
+    for sku, state in states.items():
+        if sku in products_by_sku:
+            update_products_cache(
+                state,
+                _products_to_dicts([products_by_sku[sku]]),
+                source="full_load",
+                filter_applied={"sku": sku},
+            )
+        if sales_by_sku[sku]:
+            update_sales_cache(state, _sales_to_dicts(sales_by_sku[sku]), sku_filter=sku)
+
+
 @trace(name="tool_query_inventory", trace_type="tool")
 async def query_inventory_impl(
     sku: str | None = None,
@@ -235,18 +283,7 @@ async def calculate_reorder_point_impl(
 
         # Cache the loaded sales for future use
         if state and sales:
-            sales_dicts_for_cache = [
-                {
-                    "sale_id": s.sale_id,
-                    "sku": s.sku,
-                    "quantity": s.quantity,
-                    "sale_price": s.sale_price,
-                    "timestamp": s.timestamp.isoformat(),
-                    "channel": s.channel,
-                }
-                for s in sales
-            ]
-            update_sales_cache(state, sales_dicts_for_cache, sku_filter=sku)
+            update_sales_cache(state, _sales_to_dicts(sales), sku_filter=sku)
 
     # Filter sales for this product
     product_sales = [s for s in sales if s.sku == sku]
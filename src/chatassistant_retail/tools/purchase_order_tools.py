@@ -154,7 +154,7 @@ async def create_purchase_order_impl(
         }
 
     # Generate PO ID
-    po_id = f"PO-{datetime.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8]}"
+    po_id = f"PO-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8]}"
 
     # Calculate delivery date
     order_date = datetime.now()
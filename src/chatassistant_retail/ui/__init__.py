@@ -1,5 +1,5 @@
 """Gradio UI components for retail chatbot."""
 
-from chatassistant_retail.ui.gradio_app import create_gradio_interface
+from chatassistant_retail.ui.gradio_app import app_lifespan, create_gradio_interface
 
-__all__ = ["create_gradio_interface"]
+__all__ = ["app_lifespan", "create_gradio_interface"]
@@ -33,8 +33,9 @@ def format_chat_history(messages: list[dict[str, str]]) -> list[dict[str, str]]:
     Returns:
         List of dictionaries with 'role' and 'content' keys for Gradio (messages format)
     """
-    # Messages are already in the correct format for Gradio 4.0+
-    # Just return as-is
+    # Messages are already in the correct format for Gradio 4.0+.
+    # Return the same list (no copy or per-message loop) so long histories cost O(1) here;
+    # converting to (user, assistant) tuples would break the messages-format widget.
     return messages
 
 
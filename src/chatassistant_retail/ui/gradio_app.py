@@ -1,11 +1,12 @@
 """Main Gradio application for retail chatbot."""
 
 import logging
+import sys
 import uuid
+from contextlib import asynccontextmanager
 
 import gradio as gr
 
-from chatassistant_retail.chatbot import get_chatbot
 from chatassistant_retail.ui.chat_interface import (
     create_example_queries,
     format_context_display,
@@ -23,6 +24,22 @@ from chatassistant_retail.ui.chat_interface import (
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def app_lifespan(app):
+    """
+    Server lifespan: on shutdown, flush the chatbot and close its shared connections.
+
+    Pass as ``demo.launch(app_kwargs={"lifespan": app_lifespan})``. The shutdown
+    phase runs on the server's event loop, which owns the chatbot's pending session
+    saves and pooled connections, so they can be awaited and closed there.
+    """
+    yield
+    # Nothing to release if no request ever loaded the chatbot
+    chatbot_module = sys.modules.get("chatassistant_retail.chatbot")
+    if chatbot_module is not None:
+        await chatbot_module.shutdown_chatbot()
+
+
 def create_gradio_interface():
     """
     Create and configure the Gradio interface.
@@ -30,14 +47,15 @@ def create_gradio_interface():
     Returns:
         Gradio Blocks interface
     """
-    # Initialize chatbot
-    chatbot_instance = get_chatbot()
+    # The chatbot module (langgraph, MCP tools, Azure clients) is imported and the
+    # chatbot created on the first request (see get_chatbot_async), so the UI starts
+    # serving without waiting for either
 
     # Session storage (in Gradio state)
     def get_session_id(session_id):
         """Get or create session ID."""
         if not session_id:
-            return str(uuid.uuid4())
+            return uuid.uuid4().hex
         return session_id
 
     async def send_message(message, chat_history, session_id, image=None):
@@ -61,6 +79,9 @@ def create_gradio_interface():
             session_id = get_session_id(session_id)
 
             # Process message through chatbot
+            from chatassistant_retail.chatbot import get_chatbot_async
+
+            chatbot_instance = await get_chatbot_async()
             response = await chatbot_instance.process_message(
                 text=message or "Analyze this image",
                 image=image,
@@ -94,18 +115,22 @@ def create_gradio_interface():
         """Clear chat history."""
         if session_id:
             try:
-                await chatbot_instance.clear_session(session_id)
+                from chatassistant_retail.chatbot import get_chatbot_async
+
+                await (await get_chatbot_async()).clear_session(session_id)
             except Exception as e:
                 logger.error(f"Error clearing session: {e}")
 
         # Generate new session ID
-        new_session_id = str(uuid.uuid4())
+        new_session_id = uuid.uuid4().hex
         return [], new_session_id, "Chat cleared"
 
     def refresh_metrics():
         """Refresh metrics dashboard."""
         try:
-            metrics = chatbot_instance.get_metrics()
+            from chatassistant_retail.chatbot import get_chatbot
+
+            metrics = get_chatbot().get_metrics()
             total, avg_time, tools, success = format_metrics_for_display(metrics)
             activity = format_activity_log(metrics)
             return total, avg_time, tools, success, activity
@@ -282,4 +307,5 @@ def launch_app(server_name="127.0.0.1", server_port=7860, share=False):
         server_port=server_port,
         share=share,
         show_error=True,
+        app_kwargs={"lifespan": app_lifespan},
     )
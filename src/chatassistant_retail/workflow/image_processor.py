@@ -11,6 +11,8 @@ from typing import Any
 
 from chatassistant_retail.llm import AzureOpenAIClient
 from chatassistant_retail.rag import Retriever
+from chatassistant_retail.state.langgraph_manager import ConversationState
+from chatassistant_retail.tools.inventory_tools import prime_sku_contexts
 from chatassistant_retail.tools.mcp_server import ToolExecutor
 
 logger = logging.getLogger(__name__)
@@ -339,88 +341,122 @@ Example:
                 - inventory_results: List of products with inventory status and reorder recommendations
                 - tool_calls_data: List of tool calls executed (for state tracking)
         """
+        # Read the inventory files once for all matches; each SKU's tool calls then hit
+        # its own primed context instead of re-parsing products and sales history
+        states = {product["sku"]: ConversationState() for product in products if product.get("sku")}
+        await prime_sku_contexts(states)
+
         inventory_results = []
         tool_calls_data = []
-
         for product in products:
-            try:
-                sku = product.get("sku")
-                if not sku:
-                    continue
-
-                # Query inventory for this SKU
-                tool_args = {"sku": sku}
-                inventory_data = await tool_executor.execute_tool(
-                    "query_inventory",
-                    tool_args,
-                )
+            result, tool_calls = await self._check_product_inventory(
+                product, tool_executor, states.get(product.get("sku"))
+            )
+            if result is not None:
+                inventory_results.append(result)
+            tool_calls_data.extend(tool_calls)
 
-                # Record tool call for state tracking
-                tool_calls_data.append(
-                    {
-                        "tool": "query_inventory",
-                        "args": tool_args,
-                        "result": inventory_data,
-                    }
-                )
+        return inventory_results, tool_calls_data
 
-                # Extract product info from inventory response
-                if inventory_data and inventory_data.get("products"):
-                    product_info = inventory_data["products"][0]
-
-                    current_stock = product_info.get("current_stock", 0)
-                    reorder_level = product_info.get("reorder_level", 0)
-
-                    # Check if low stock
-                    is_low_stock = current_stock <= reorder_level
-
-                    result = {
-                        "sku": sku,
-                        "name": product_info.get("name"),
-                        "category": product_info.get("category"),
-                        "price": product_info.get("price"),
-                        "current_stock": current_stock,
-                        "reorder_level": reorder_level,
-                        "supplier": product_info.get("supplier"),
-                        "status": "LOW STOCK" if is_low_stock else "OK",
-                        "is_low_stock": is_low_stock,
-                        "search_score": product.get("search_score", 0),
-                    }
-
-                    # If low stock, calculate reorder recommendation
-                    if is_low_stock:
-                        try:
-                            reorder_args = {"sku": sku}
-                            reorder_calc = await tool_executor.execute_tool(
-                                "calculate_reorder_point",
-                                reorder_args,
-                            )
-
-                            # Record reorder tool call
-                            tool_calls_data.append(
-                                {
-                                    "tool": "calculate_reorder_point",
-                                    "args": reorder_args,
-                                    "result": reorder_calc,
-                                }
-                            )
-
-                            if reorder_calc and "recommendations" in reorder_calc:
-                                result["reorder_recommendation"] = {
-                                    "order_quantity": reorder_calc["recommendations"].get("order_quantity"),
-                                    "days_until_stockout": reorder_calc["recommendations"].get("days_until_stockout"),
-                                    "urgency": reorder_calc["recommendations"].get("urgency"),
-                                }
-                        except Exception as e:
-                            logger.warning(f"Could not calculate reorder point for {sku}: {e}")
-
-                    inventory_results.append(result)
-
-            except Exception as e:
-                logger.error(f"Error checking inventory for product: {e}", exc_info=True)
-                continue
+    async def _check_product_inventory(
+        self,
+        product: dict[str, Any],
+        tool_executor: ToolExecutor,
+        state: ConversationState | None = None,
+    ) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+        """
+        Check inventory status for one matched product.
 
-        return inventory_results, tool_calls_data
+        Args:
+            product: Matched product from catalog search
+            tool_executor: Tool executor for inventory operations
+            state: Conversation state primed with this product's inventory data
+
+        Returns:
+            Tuple of (inventory_result, tool_calls_data); inventory_result is None if the
+            product has no SKU or its inventory could not be read
+        """
+        tool_calls_data = []
+
+        try:
+            sku = product.get("sku")
+            if not sku:
+                return None, tool_calls_data
+
+            # Query inventory for this SKU
+            tool_args = {"sku": sku}
+            inventory_data = await tool_executor.execute_tool(
+                "query_inventory",
+                tool_args,
+                state=state,
+            )
+
+            # Record tool call for state tracking
+            tool_calls_data.append(
+                {
+                    "tool": "query_inventory",
+                    "args": tool_args,
+                    "result": inventory_data,
+                }
+            )
+
+            # Extract product info from inventory response
+            if inventory_data and inventory_data.get("products"):
+                product_info = inventory_data["products"][0]
+
+                current_stock = product_info.get("current_stock", 0)
+                reorder_level = product_info.get("reorder_level", 0)
+
+                # Check if low stock
+                is_low_stock = current_stock <= reorder_level
+
+                result = {
+                    "sku": sku,
+                    "name": product_info.get("name"),
+                    "category": product_info.get("category"),
+                    "price": product_info.get("price"),
+                    "current_stock": current_stock,
+                    "reorder_level": reorder_level,
+                    "supplier": product_info.get("supplier"),
+                    "status": "LOW STOCK" if is_low_stock else "OK",
+                    "is_low_stock": is_low_stock,
+                    "search_score": product.get("search_score", 0),
+                }
+
+                # If low stock, calculate reorder recommendation
+                if is_low_stock:
+                    try:
+                        reorder_args = {"sku": sku}
+                        reorder_calc = await tool_executor.execute_tool(
+                            "calculate_reorder_point",
+                            reorder_args,
+                            state=state,
+                        )
+
+                        # Record reorder tool call
+                        tool_calls_data.append(
+                            {
+                                "tool": "calculate_reorder_point",
+                                "args": reorder_args,
+                                "result": reorder_calc,
+                            }
+                        )
+
+                        if reorder_calc and "recommendations" in reorder_calc:
+                            result["reorder_recommendation"] = {
+                                "order_quantity": reorder_calc["recommendations"].get("order_quantity"),
+                                "days_until_stockout": reorder_calc["recommendations"].get("days_until_stockout"),
+                                "urgency": reorder_calc["recommendations"].get("urgency"),
+                            }
+                    except Exception as e:
+                        logger.warning(f"Could not calculate reorder point for {sku}: {e}")
+
+                return result, tool_calls_data
+
+        except Exception as e:
+            logger.error(f"Error checking inventory for product: {e}", exc_info=True)
+
+        return None, tool_calls_data
 
     async def _generate_response(
         self,
@@ -1,8 +1,17 @@
 """Unit tests for Azure OpenAI client."""
 
+import base64
+import io
+import sqlite3
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import orjson
 import pytest
+from PIL import Image
 
-from chatassistant_retail.llm.azure_openai_client import AzureOpenAIClient
+from chatassistant_retail.config import Settings
+from chatassistant_retail.llm.azure_openai_client import AzureOpenAIClient, _detect_image_mime, _parse_json_object
 
 
 class TestAzureOpenAIClient:
@@ -186,3 +195,201 @@ class TestAzureOpenAIClient:
         content = await client.extract_response_content(response)
 
         assert content == ""
+
+
+class TestVisionCache:
+    """Test caching of product identifications for repeat image uploads."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client with mock settings."""
+        settings = Mock(spec=Settings)
+        settings.azure_openai_api_key = "test-key"
+        settings.azure_openai_api_version = "2024-02-15-preview"
+        settings.azure_openai_endpoint = "https://test.openai.azure.com"
+        settings.vision_cache_path = None
+        return AzureOpenAIClient(settings)
+
+    @pytest.mark.asyncio
+    async def test_same_image_and_context_skips_llm_call(self, client, tmp_path):
+        """Test that a repeat identification is served from the cache."""
+        response_text = '{"product_name": "Mouse", "category": "Electronics", "keywords": ["mouse"]}'
+        client.process_multimodal = AsyncMock(return_value={"choices": [{"message": {"content": response_text}}]})
+        image = tmp_path / "mouse.jpg"
+        image.write_bytes(b"fake image bytes")
+
+        first = await client.identify_product_from_image(image)
+        first["keywords"].append("mutated by caller")
+        second = await client.identify_product_from_image(image)
+        await client.identify_product_from_image(image, context="different question")
+
+        assert second["keywords"] == ["mouse"]
+        assert client.process_multimodal.await_count == 2
+        assert client.vision_cache_stats == {"hits": 1, "misses": 2, "disk_hits": 0}
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_new_client(self, client, tmp_path):
+        """Test that an identification persisted by one client is reused by a fresh one."""
+        response_text = '{"product_name": "Mouse", "category": "Electronics", "keywords": ["mouse"]}'
+        client.settings.vision_cache_path = str(tmp_path / "vision.sqlite")
+        image = tmp_path / "mouse.jpg"
+        image.write_bytes(b"fake image bytes")
+
+        first_client = AzureOpenAIClient(client.settings)
+        first_client.process_multimodal = AsyncMock(return_value={"choices": [{"message": {"content": response_text}}]})
+        first = await first_client.identify_product_from_image(image)
+
+        restarted_client = AzureOpenAIClient(client.settings)
+        restarted_client.process_multimodal = AsyncMock()
+        second = await restarted_client.identify_product_from_image(image)
+
+        assert second == first
+        restarted_client.process_multimodal.assert_not_awaited()
+        assert restarted_client.vision_cache_stats["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_errors_do_not_fail_identification(self, client, tmp_path):
+        """Test that sqlite errors on lookup and store are logged and identification still succeeds."""
+        response_text = '{"product_name": "Mouse", "category": "Electronics", "keywords": ["mouse"]}'
+        client.process_multimodal = AsyncMock(return_value={"choices": [{"message": {"content": response_text}}]})
+        client._vision_disk_cache = Mock()
+        client._vision_disk_cache.get.side_effect = sqlite3.OperationalError("database is locked")
+        client._vision_disk_cache.set.side_effect = sqlite3.OperationalError("database is locked")
+        image = tmp_path / "mouse.jpg"
+        image.write_bytes(b"fake image bytes")
+
+        result = await client.identify_product_from_image(image)
+
+        assert result["product_name"] == "Mouse"
+        client._vision_disk_cache.set.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_reuses_the_data_url_built_while_hashing(self, client, tmp_path):
+        """Test that a small image is encoded during the cache key pass and not read again on a miss."""
+        response_text = '{"product_name": "Mouse", "category": "Electronics", "keywords": ["mouse"]}'
+        client.process_multimodal = AsyncMock(return_value={"choices": [{"message": {"content": response_text}}]})
+        client._image_data_url_async = AsyncMock()
+        image = tmp_path / "mouse.png"
+        image.write_bytes(b"\x89PNG\r\n\x1a\n fake image bytes")
+
+        await client.identify_product_from_image(image)
+
+        image_url = client.process_multimodal.await_args.kwargs["image_url"]
+        assert image_url == "data:image/png;base64," + base64.b64encode(image.read_bytes()).decode("ascii")
+        client._image_data_url_async.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_identify_products_from_images_keeps_order_and_isolates_failures(self, client):
+        """Test that batch identification returns results in input order with None for failures."""
+
+        async def identify(image_path, context=""):
+            if image_path == "broken.jpg":
+                raise RuntimeError("boom")
+            return {"product_name": image_path, "context": context}
+
+        client.identify_product_from_image = AsyncMock(side_effect=identify)
+
+        results = await client.identify_products_from_images(["a.jpg", "broken.jpg", "b.jpg"], ["x", "y", "z"])
+
+        assert results == [{"product_name": "a.jpg", "context": "x"}, None, {"product_name": "b.jpg", "context": "z"}]
+
+
+class TestStreamResponse:
+    """Test batching of streamed response deltas."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client whose LLM call streams a fixed list of deltas."""
+        settings = Mock(spec=Settings)
+        settings.azure_openai_api_key = "test-key"
+        settings.azure_openai_api_version = "2024-02-15-preview"
+        settings.azure_openai_endpoint = "https://test.openai.azure.com"
+        settings.vision_cache_path = None
+        client = AzureOpenAIClient(settings)
+
+        async def stream():
+            yield Mock(choices=[])
+            for content in ["Hel", "lo", None, ", wor", "ld", "!"]:
+                yield Mock(choices=[Mock(delta=Mock(content=content))])
+
+        client.call_llm = AsyncMock(side_effect=lambda **kwargs: stream())
+        return client
+
+    @pytest.mark.asyncio
+    async def test_small_deltas_are_coalesced(self, client):
+        """Test that deltas are batched up to min_flush_chars without changing the text."""
+        chunks = [chunk async for chunk in client.stream_response([], min_flush_chars=5, max_flush_ms=60_000)]
+
+        assert chunks == ["Hello", ", wor", "ld!"]
+
+    @pytest.mark.asyncio
+    async def test_zero_min_flush_chars_yields_every_delta(self, client):
+        """Test that min_flush_chars=0 passes each non-empty delta straight through."""
+        chunks = [chunk async for chunk in client.stream_response([], min_flush_chars=0)]
+
+        assert chunks == ["Hel", "lo", ", wor", "ld", "!"]
+
+
+class TestEncodeImage:
+    """Test image encoding for upload."""
+
+    def test_oversized_image_is_downscaled_to_jpeg(self, tmp_path):
+        """Test that large images are shrunk before base64 encoding."""
+        settings = Mock(spec=Settings)
+        settings.azure_openai_api_key = "test-key"
+        settings.azure_openai_api_version = "2024-02-15-preview"
+        settings.azure_openai_endpoint = "https://test.openai.azure.com"
+        settings.vision_cache_path = None
+        client = AzureOpenAIClient(settings)
+
+        image_path = tmp_path / "large.png"
+        pixels = np.random.default_rng(0).integers(0, 256, (1500, 3000, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(image_path)
+
+        encoded = base64.b64decode(client._encode_image(image_path))
+
+        assert len(encoded) < image_path.stat().st_size
+        with Image.open(io.BytesIO(encoded)) as image:
+            assert image.format == "JPEG"
+            assert image.size == (2048, 1024)
+
+    @pytest.mark.parametrize(
+        ("header", "mime"),
+        [
+            (b"\x89PNG\r\n\x1a\n\x00\x00\x00\r", "image/png"),
+            (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01", "image/jpeg"),
+            (b"RIFF\x24\x00\x00\x00WEBP", "image/webp"),
+            (b"GIF89a\x08\x00\x08\x00\x00\x00", "image/gif"),
+            (b"not an image", "image/jpeg"),
+        ],
+    )
+    def test_detect_image_mime(self, header, mime):
+        """Test MIME detection from file signatures, defaulting to JPEG."""
+        assert _detect_image_mime(header) == mime
+
+
+class TestParseJsonObject:
+    """Test JSON extraction from vision model responses."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"product_name": "Mouse", "tags": {"a": 1}}',
+            '```json\n{"product_name": "Mouse", "tags": {"a": 1}}\n```',
+            'Here you go:\n```\n{"product_name": "Mouse", "tags": {"a": 1}}\n```\nDone.',
+        ],
+    )
+    def test_bare_and_fenced_json(self, text):
+        """Test that bare, fenced, and surrounded JSON objects parse the same."""
+        assert _parse_json_object(text) == {"product_name": "Mouse", "tags": {"a": 1}}
+
+    def test_falls_back_to_fence_when_slice_is_invalid(self):
+        """Test that the fence regex is used when braces outside the fence break the slice."""
+        text = 'Use {braces} carefully:\n```json\n{"product_name": "Mouse"}\n```'
+
+        assert _parse_json_object(text) == {"product_name": "Mouse"}
+
+    def test_invalid_json_raises(self):
+        """Test that text with no parseable JSON raises a decode error."""
+        with pytest.raises(orjson.JSONDecodeError):
+            _parse_json_object("no json here")
@@ -6,7 +6,8 @@ import pytest
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 
 from chatassistant_retail.config import Settings
-from chatassistant_retail.rag.azure_search_client import AzureSearchClient
+from chatassistant_retail.data.models import Product
+from chatassistant_retail.rag.azure_search_client import AzureSearchClient, compute_content_hash
 
 
 @pytest.fixture
@@ -755,3 +756,165 @@ class TestSemanticSearchFallback:
 
         # Verify it's the original error
         assert "Unauthorized" in str(exc_info.value)
+
+
+@pytest.fixture
+def sample_product():
+    """Create a sample product."""
+    return Product(
+        sku="SKU-10001",
+        name="Wireless Mouse",
+        category="Electronics",
+        price=29.99,
+        current_stock=45,
+        reorder_level=20,
+        supplier="Tech Supplies Inc.",
+        description="Ergonomic wireless mouse",
+    )
+
+
+class TestContentHash:
+    """Tests for content hash fingerprinting used by index sync."""
+
+    def test_content_hash_is_stable(self, sample_product):
+        """Test that identical content produces identical hashes."""
+        copy = sample_product.model_copy()
+        assert compute_content_hash(sample_product) == compute_content_hash(copy)
+
+    def test_content_hash_changes_with_fields(self, sample_product):
+        """Test that changing an indexed field changes the hash."""
+        changed = sample_product.model_copy(update={"current_stock": 44})
+        assert compute_content_hash(sample_product) != compute_content_hash(changed)
+
+    def test_content_hash_changes_with_embedding_fingerprint(self, sample_product):
+        """Test that vectors from a different embedding deployment hash differently."""
+        assert compute_content_hash(sample_product, "text-embedding-ada-002") != compute_content_hash(
+            sample_product, "text-embedding-3-small"
+        )
+
+    def test_content_hash_ignores_non_indexed_fields(self, sample_product):
+        """Test that fields not stored in the index do not affect the hash."""
+        changed = sample_product.model_copy(update={"image_url": "https://example.com/mouse.png"})
+        assert compute_content_hash(sample_product) == compute_content_hash(changed)
+
+    @patch("chatassistant_retail.rag.azure_search_client.SearchClient")
+    @patch("chatassistant_retail.rag.azure_search_client.SearchIndexClient")
+    def test_document_includes_hash_when_supported(
+        self, mock_index_client_class, mock_search_client_class, mock_settings, mock_index, sample_product
+    ):
+        """Test that documents carry content_hash only when the index has the field."""
+        hash_field = Mock()
+        hash_field.name = "content_hash"
+        mock_index_client = Mock()
+        mock_index_client.get_index.return_value = mock_index
+        mock_index_client_class.return_value = mock_index_client
+
+        client = AzureSearchClient(mock_settings)
+        assert "content_hash" not in client._product_document(sample_product, [0.1])
+
+        mock_index.fields = [*mock_index.fields, hash_field]
+        client._content_hash_supported = None
+        doc = client._product_document(sample_product, [0.1])
+        assert doc["content_hash"] == compute_content_hash(sample_product, "text-embedding-ada-002")
+
+    @patch("chatassistant_retail.rag.azure_search_client.SearchClient")
+    @patch("chatassistant_retail.rag.azure_search_client.SearchIndexClient")
+    def test_failed_schema_lookup_is_cached(
+        self, mock_index_client_class, mock_search_client_class, mock_settings, mock_index, sample_product
+    ):
+        """Test that a failed index lookup is not repeated for every document."""
+        mock_index_client = Mock()
+        mock_index_client.get_index.return_value = mock_index
+        mock_index_client_class.return_value = mock_index_client
+
+        client = AzureSearchClient(mock_settings)
+        mock_index_client.get_index.reset_mock()
+        mock_index_client.get_index.side_effect = RuntimeError("service unavailable")
+        client._content_hash_supported = None
+
+        docs = [client._product_document(sample_product, [0.1]) for _ in range(3)]
+
+        assert all("content_hash" not in doc for doc in docs)
+        assert mock_index_client.get_index.call_count == 1
+
+
+class TestApplyDiff:
+    """Tests for combined delete + upsert batches."""
+
+    @patch("chatassistant_retail.rag.azure_search_client.SearchClient")
+    @patch("chatassistant_retail.rag.azure_search_client.SearchIndexClient")
+    def test_apply_diff_mixes_actions_across_batches(
+        self, mock_index_client_class, mock_search_client_class, mock_settings, mock_index, sample_product
+    ):
+        """Test that deletes and upserts share batches and results are aggregated."""
+        mock_index_client = Mock()
+        mock_index_client.get_index.return_value = mock_index
+        mock_index_client_class.return_value = mock_index_client
+
+        mock_search_client = Mock()
+        mock_search_client.index_documents.side_effect = lambda batch: [Mock(succeeded=True) for _ in batch.actions]
+        mock_search_client_class.return_value = mock_search_client
+
+        client = AzureSearchClient(mock_settings)
+        other = sample_product.model_copy(update={"sku": "SKU-10002"})
+
+        import asyncio
+
+        result = asyncio.run(
+            client.apply_diff(["SKU-1", "SKU-2", "SKU-3"], [sample_product, other], [[0.1], [0.2]], batch_size=2)
+        )
+
+        assert result == {"total": 5, "succeeded": 5, "failed": 0, "errors": []}
+        batches = [call.args[0] for call in mock_search_client.index_documents.call_args_list]
+        assert [[a.action_type for a in b.actions] for b in batches] == [
+            ["delete", "delete"],
+            ["delete", "mergeOrUpload"],
+            ["mergeOrUpload"],
+        ]
+
+    def test_apply_diff_disabled(self, mock_settings_disabled):
+        """Test apply_diff is a no-op when Azure Search is not configured."""
+        client = AzureSearchClient(mock_settings_disabled)
+
+        import asyncio
+
+        result = asyncio.run(client.apply_diff(["SKU-1"], [], []))
+
+        assert result == {"total": 0, "succeeded": 0, "failed": 0, "errors": []}
+
+
+class TestThrottlingBackoff:
+    """Tests for retrying throttled index requests."""
+
+    @patch("chatassistant_retail.rag.azure_search_client.asyncio.sleep")
+    @patch("chatassistant_retail.rag.azure_search_client.SearchClient")
+    @patch("chatassistant_retail.rag.azure_search_client.SearchIndexClient")
+    def test_apply_diff_retries_throttled_batch(
+        self, mock_index_client_class, mock_search_client_class, mock_sleep, mock_settings, mock_index, sample_product
+    ):
+        """Test that a 503 response is retried after the Retry-After delay."""
+        mock_index_client = Mock()
+        mock_index_client.get_index.return_value = mock_index
+        mock_index_client_class.return_value = mock_index_client
+
+        throttled = HttpResponseError(message="Service Unavailable")
+        throttled.status_code = 503
+        throttled.response = Mock(headers={"Retry-After": "2"})
+
+        mock_search_client = Mock()
+        mock_search_client.index_documents.side_effect = [throttled, [Mock(succeeded=True)]]
+        mock_search_client_class.return_value = mock_search_client
+
+        client = AzureSearchClient(mock_settings)
+
+        import asyncio
+
+        async def no_sleep(delay):
+            return None
+
+        mock_sleep.side_effect = no_sleep
+        result = asyncio.run(client.apply_diff([], [sample_product], [[0.1]]))
+
+        assert result["succeeded"] == 1
+        assert mock_search_client.index_documents.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
@@ -2,9 +2,10 @@
 
 from datetime import datetime
 
+import numpy as np
 import pytest
 
-from chatassistant_retail.data import Product, Sale, SampleDataGenerator
+from chatassistant_retail.data import Product, Sale, SaleRow, SampleDataGenerator
 
 
 class TestSampleDataGenerator:
@@ -159,6 +160,55 @@ class TestSampleDataGenerator:
             groceries_price = gen._generate_category_price("Groceries")
             assert 1.99 <= groceries_price <= 49.99
 
+    def test_unvalidated_rows_pass_validation(self):
+        """Test that rows built without validation satisfy the model constraints."""
+        gen = SampleDataGenerator(seed=42)
+        products = gen.generate_products(count=50)
+        sales = gen.generate_sales_history(products, months=1)
+
+        for product in products:
+            Product.model_validate(product.model_dump())
+        for sale in sales:
+            Sale.model_validate(sale.model_dump())
+
+    def test_generate_sales_history_fast_rows(self):
+        """Test that the lightweight sales rows validate into Sale models."""
+        gen = SampleDataGenerator(seed=42)
+        products = gen.generate_products(count=20)
+        rows = gen.generate_sales_history_fast(products, months=1)
+
+        assert len(rows) > 0
+        assert all(isinstance(row, SaleRow) for row in rows)
+        sale = Sale.from_row(rows[0])
+        assert sale.sale_id == rows[0].sale_id
+        assert sale.channel == rows[0].channel
+
+    def test_generate_sales_history_columnar(self):
+        """Test that columnar sales convert to Sale models and handle no products."""
+        gen = SampleDataGenerator(seed=42)
+        products = gen.generate_products(count=20)
+        columns = gen.generate_sales_history_columnar(products, months=1)
+
+        assert len(columns) > 0
+        assert columns.quantity.dtype == np.int32
+        sales = columns.to_models(validate=True)
+        assert len(sales) == len(columns)
+        assert {sale.sku for sale in sales} <= {p.sku for p in products}
+
+        assert len(gen.generate_sales_history_columnar([], months=1)) == 0
+
+    def test_iterators_match_list_generators(self):
+        """Test that iter_products/iter_sales_history yield the same data as the list methods."""
+        products = SampleDataGenerator(seed=42).generate_products(count=20)
+        streamed = list(SampleDataGenerator(seed=42).iter_products(count=20))
+        assert [p.model_dump() for p in streamed] == [p.model_dump() for p in products]
+
+        sales = SampleDataGenerator(seed=7).generate_sales_history(products, months=1)
+        streamed_sales = list(SampleDataGenerator(seed=7).iter_sales_history(products, months=1))
+        assert [(s.sale_id, s.sku, s.sale_price) for s in streamed_sales] == [
+            (s.sale_id, s.sku, s.sale_price) for s in sales
+        ]
+
     def test_reproducibility_with_same_seed(self):
         """Test that same seed produces same results."""
         gen1 = SampleDataGenerator(seed=42)
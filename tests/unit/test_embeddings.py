@@ -0,0 +1,122 @@
+"""Unit tests for EmbeddingsClient batching."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from openai import BadRequestError
+
+from chatassistant_retail.config import Settings
+from chatassistant_retail.rag.embeddings import EmbeddingsClient
+
+
+@pytest.fixture
+def mock_settings():
+    """Create mock settings for the embeddings client."""
+    settings = Mock(spec=Settings)
+    settings.azure_openai_endpoint = "https://test.openai.azure.com"
+    settings.azure_openai_api_key = "test-openai-key"
+    settings.azure_openai_api_version = "2024-02-15-preview"
+    settings.azure_openai_embedding_deployment = "text-embedding-ada-002"
+    settings.cache_embeddings = True
+    return settings
+
+
+def fake_create(model, input):
+    """Return one single-value embedding per input text, equal to the text length."""
+    return Mock(data=[Mock(embedding=[float(len(text))]) for text in input])
+
+
+class TestGenerateEmbeddingsBatch:
+    """Tests for sub-batching, deduplication, and caching in generate_embeddings_batch."""
+
+    @patch("chatassistant_retail.rag.embeddings.AsyncAzureOpenAI")
+    @pytest.mark.asyncio
+    async def test_splits_into_sub_batches_and_preserves_order(self, mock_openai_class, mock_settings):
+        """Test that texts are sent in sub-batches and results keep input order."""
+        mock_openai_class.return_value.embeddings.create = AsyncMock(side_effect=fake_create)
+        client = EmbeddingsClient(mock_settings, batch_size=2)
+
+        texts = ["a", "bbb", "cc", "dddd", "eeeee"]
+        embeddings = await client.generate_embeddings_batch(texts)
+
+        assert embeddings == [[1.0], [3.0], [2.0], [4.0], [5.0]]
+        sizes = [len(call.kwargs["input"]) for call in client.client.embeddings.create.call_args_list]
+        assert sorted(sizes) == [1, 2, 2]
+
+    @patch("chatassistant_retail.rag.embeddings.AsyncAzureOpenAI")
+    @pytest.mark.asyncio
+    async def test_duplicates_and_cached_texts_are_not_resent(self, mock_openai_class, mock_settings):
+        """Test that duplicate texts are embedded once and cached texts are skipped."""
+        mock_openai_class.return_value.embeddings.create = AsyncMock(side_effect=fake_create)
+        client = EmbeddingsClient(mock_settings)
+
+        await client.generate_embeddings_batch(["a", "a", "bb"])
+        embeddings = await client.generate_embeddings_batch(["bb", "ccc"])
+
+        assert embeddings == [[2.0], [3.0]]
+        sent = [call.kwargs["input"] for call in client.client.embeddings.create.call_args_list]
+        assert sent == [["a", "bb"], ["ccc"]]
+
+    @patch("chatassistant_retail.rag.embeddings.AsyncAzureOpenAI")
+    @pytest.mark.asyncio
+    async def test_rejected_text_is_isolated_by_splitting(self, mock_openai_class, mock_settings):
+        """Test that a rejected batch is split so only the offending text gets a zero vector."""
+
+        def reject_poison(model, input):
+            if "poison" in input:
+                raise BadRequestError(
+                    "input too long", response=Mock(request=Mock()), body={"code": "context_length_exceeded"}
+                )
+            return fake_create(model, input)
+
+        mock_openai_class.return_value.embeddings.create = AsyncMock(side_effect=reject_poison)
+        client = EmbeddingsClient(mock_settings)
+
+        embeddings = await client.generate_embeddings_batch(["a", "poison", "ccc", "dd"])
+
+        assert embeddings == [[1.0], [0.0], [3.0], [2.0]]
+        assert "poison" not in client.cache
+
+    @patch("chatassistant_retail.rag.embeddings.AsyncAzureOpenAI")
+    @pytest.mark.asyncio
+    async def test_other_bad_requests_are_raised_without_splitting(self, mock_openai_class, mock_settings):
+        """Test that a bad request not caused by an input text fails instead of being split."""
+        error = BadRequestError(
+            "deployment not found", response=Mock(request=Mock()), body={"code": "DeploymentNotFound"}
+        )
+        mock_openai_class.return_value.embeddings.create = AsyncMock(side_effect=error)
+        client = EmbeddingsClient(mock_settings)
+
+        with pytest.raises(BadRequestError):
+            await client.generate_embeddings_batch(["a", "bb", "ccc", "dddd"])
+
+        assert client.client.embeddings.create.await_count == 1
+
+    @patch("chatassistant_retail.rag.embeddings.AsyncAzureOpenAI")
+    @pytest.mark.asyncio
+    async def test_splits_respect_max_concurrency(self, mock_openai_class, mock_settings):
+        """Test that requests issued while splitting rejected sub-batches stay within max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def reject_poison(model, input):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if any(text.startswith("poison") for text in input):
+                raise BadRequestError(
+                    "too long", response=Mock(request=Mock()), body={"code": "context_length_exceeded"}
+                )
+            return fake_create(model, input)
+
+        mock_openai_class.return_value.embeddings.create = AsyncMock(side_effect=reject_poison)
+        client = EmbeddingsClient(mock_settings, batch_size=8, max_concurrency=2)
+
+        texts = [f"poison-{i}" if i % 8 == 7 else f"text-{i}" for i in range(32)]
+        embeddings = await client.generate_embeddings_batch(texts)
+
+        assert peak == 2
+        assert sum(embedding == [0.0] for embedding in embeddings) == 4
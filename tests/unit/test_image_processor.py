@@ -1,7 +1,7 @@
 """Unit tests for ImageProductProcessor."""
 
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -292,6 +292,31 @@ class TestImageProductProcessor:
         assert tool_calls[1]["tool"] == "calculate_reorder_point"
         assert all("args" in tc and "result" in tc for tc in tool_calls)
 
+    @pytest.mark.asyncio
+    async def test_check_inventory_status_primes_each_sku_once(self, mock_tool_executor, sample_products):
+        """Test that inventory data is loaded once and each SKU's tool calls get its own primed state."""
+        seen_states = {}
+
+        async def query_inventory(tool_name, args, state=None):
+            seen_states[args["sku"]] = state
+            return {"products": [{"sku": args["sku"], "name": args["sku"], "current_stock": 50, "reorder_level": 20}]}
+
+        mock_tool_executor.execute_tool.side_effect = query_inventory
+
+        processor = ImageProductProcessor()
+        with patch("chatassistant_retail.workflow.image_processor.prime_sku_contexts") as mock_prime:
+            results, tool_calls = await processor._check_inventory_status(
+                products=[*sample_products, {"name": "No SKU"}],
+                tool_executor=mock_tool_executor,
+            )
+
+        mock_prime.assert_awaited_once()
+        primed_states = mock_prime.await_args.args[0]
+        assert list(primed_states) == ["SKU-10001", "SKU-10002"]
+        assert seen_states == primed_states
+        assert [r["sku"] for r in results] == ["SKU-10001", "SKU-10002"]
+        assert [tc["args"]["sku"] for tc in tool_calls] == ["SKU-10001", "SKU-10002"]
+
     @pytest.mark.asyncio
     async def test_generate_response_with_low_stock(self, mock_llm_client, sample_vision_result):
         """Test response generation with low stock items."""
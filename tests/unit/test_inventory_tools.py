@@ -1,9 +1,13 @@
 """Unit tests for inventory tools."""
 
+from unittest.mock import patch
+
 import pytest
 
+from chatassistant_retail.state.langgraph_manager import ConversationState
 from chatassistant_retail.tools.inventory_tools import (
     calculate_reorder_point_impl,
+    prime_sku_contexts,
     query_inventory_impl,
 )
 
@@ -75,6 +79,21 @@ class TestInventoryTools:
             assert "urgency" in result["recommendations"]
             assert result["recommendations"]["urgency"] in ["HIGH", "MEDIUM", "LOW"]
 
+    @pytest.mark.asyncio
+    async def test_primed_contexts_skip_file_reads(self):
+        """Test that tools for a primed SKU read its context instead of the JSON files."""
+        states = {"SKU-10000": ConversationState(), "SKU-10001": ConversationState()}
+        await prime_sku_contexts(states)
+
+        with patch("chatassistant_retail.tools.inventory_tools._load_local_data") as mock_load:
+            inventory = await query_inventory_impl(sku="SKU-10001", state=states["SKU-10001"])
+            reorder = await calculate_reorder_point_impl(sku="SKU-10000", state=states["SKU-10000"])
+
+        mock_load.assert_not_called()
+        assert [p["sku"] for p in inventory["products"]] == ["SKU-10001"]
+        assert reorder["success"] is True
+        assert {s["sku"] for s in states["SKU-10000"].context["sales_cache"]["data"]} == {"SKU-10000"}
+
 
 class TestQueryInventoryResults:
     """Test query inventory result formatting."""
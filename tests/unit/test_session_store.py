@@ -1,8 +1,13 @@
 """Unit tests for session storage implementations."""
 
+import asyncio
+import weakref
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
 from chatassistant_retail.state import MemorySessionStore
+from chatassistant_retail.state.persistent_store import RedisSessionStore, close_redis_pools
 
 
 class TestMemorySessionStore:
@@ -146,3 +151,49 @@ class TestMemorySessionStore:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestRedisSessionStore:
+    """Tests for RedisSessionStore connection pooling."""
+
+    @pytest.mark.asyncio
+    async def test_shared_pool_blocks_when_exhausted(self, monkeypatch):
+        """Test that stores share one blocking pool per URL, so excess callers wait for a connection."""
+        redis = pytest.importorskip("redis.asyncio")
+        monkeypatch.setattr("chatassistant_retail.state.persistent_store._redis_pools", weakref.WeakKeyDictionary())
+
+        first = RedisSessionStore("redis://localhost:6379/0", max_connections=8, pool_timeout=5.0)
+        second = RedisSessionStore("redis://localhost:6379/0")
+
+        pool = first.redis.connection_pool
+        assert isinstance(pool, redis.BlockingConnectionPool)
+        assert pool is second.redis.connection_pool
+        assert pool.max_connections == 8
+        assert pool.timeout == 5.0
+
+    def test_each_event_loop_gets_its_own_pool(self, monkeypatch):
+        """Test that a store used from two event loops never shares connections between them."""
+        pytest.importorskip("redis.asyncio")
+        monkeypatch.setattr("chatassistant_retail.state.persistent_store._redis_pools", weakref.WeakKeyDictionary())
+        store = RedisSessionStore("redis://localhost:6379/0")
+
+        async def current_pool():
+            assert store.redis is store.redis
+            return store.redis.connection_pool
+
+        assert asyncio.run(current_pool()) is not asyncio.run(current_pool())
+
+    @pytest.mark.asyncio
+    async def test_close_redis_pools_disconnects_the_loop_pools(self, monkeypatch):
+        """Test that closing the pools disconnects them and later use opens a fresh pool."""
+        pytest.importorskip("redis.asyncio")
+        monkeypatch.setattr("chatassistant_retail.state.persistent_store._redis_pools", weakref.WeakKeyDictionary())
+        store = RedisSessionStore("redis://localhost:6379/0")
+        pool = store.redis.connection_pool
+
+        with patch.object(pool, "disconnect", AsyncMock()) as disconnect:
+            await close_redis_pools()
+        await store.close()
+
+        disconnect.assert_awaited_once()
+        assert store.redis.connection_pool is not pool